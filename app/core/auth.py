@@ -34,17 +34,14 @@ async def get_current_user(
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         username: str = payload.get("sub")
-        print('useraaa', username)
         if username is None:
             raise credentials_exception
     except JWTError:
-        print('useraaaaaaa', username)
         raise credentials_exception
     
     stmt = select(User).filter(User.username == username)
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
-    print('fasfasfa', username)
     
     if user is None:
         raise credentials_exception
@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+class TTLCache:
+    """
+    In-process LRU-кэш с ограничением времени жизни записей.
+
+    Кэш не потокобезопасен и рассчитан на использование из одного
+    event loop процесса.
+
+    Атрибуты:
+        maxsize (int): Максимальное количество записей
+        ttl (float): Время жизни записи, сек
+        hits (int): Количество попаданий
+        misses (int): Количество промахов
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Получение значения по ключу.
+
+        Args:
+            key (Hashable): Ключ
+
+        Returns:
+            Optional[Any]: Значение или None, если записи нет или она устарела
+        """
+        item = self._data.get(key)
+        if item is None or item[0] <= time.monotonic():
+            if item is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Сохранение значения; при переполнении вытесняется самая старая запись.
+
+        Args:
+            key (Hashable): Ключ
+            value (Any): Значение
+        """
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Удаление записи по ключу, если она есть."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Удаление всех записей и обнуление статистики."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Статистика кэша.
+
+        Returns:
+            dict[str, Any]: Размер, попадания, промахи и доля попаданий
+        """
+        requests = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / requests, 4) if requests else 0.0,
+        }
@@ -0,0 +1,79 @@
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_current_active_user
+from app.database.session import get_db
+from app.models.user import User
+from app.services.data_version import get_data_version
+
+def make_etag(user_id: int, version: int) -> str:
+    """
+    ETag данных пользователя.
+
+    Тело ответа не хешируется: любое изменение данных пользователя
+    увеличивает users.data_version, и вместе с ней меняются ETag всех
+    его ресурсов. ETag слабый, так как не зависит от кодирования тела.
+
+    Args:
+        user_id (int): ID пользователя
+        version (int): Версия данных пользователя
+
+    Returns:
+        str: Значение заголовка ETag
+    """
+    return f'W/"{user_id}.{version}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Проверка If-None-Match слабым сравнением (RFC 9110, 13.1.2).
+
+    Args:
+        if_none_match (str, опционально): Значение заголовка If-None-Match
+        etag (str): Текущий ETag
+
+    Returns:
+        bool: True, если клиенту можно ответить 304
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+async def read_data_version(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> int:
+    """
+    Версия данных пользователя для условных GET-запросов.
+
+    Выполняется до тела маршрута: при совпадении If-None-Match сразу
+    возвращается 304 без загрузки и сериализации данных, иначе ETag
+    добавляется к ответу, а версия передается маршруту (ключ кэша ответов).
+
+    Args:
+        request (Request): Запрос с заголовком If-None-Match
+        response (Response): Ответ маршрута для заголовка ETag
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+
+    Returns:
+        int: Версия данных пользователя
+
+    Raises:
+        HTTPException: 304, если данные у клиента актуальны
+    """
+    version = await get_data_version(db, current_user.id)
+    etag = make_etag(current_user.id, version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return version
@@ -1,6 +1,47 @@
 from pydantic import Field
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Any, Optional
+
+# Пресеты профиля подключения к базе данных.
+# Любое значение можно переопределить отдельной переменной окружения DB_*.
+DB_PROFILE_PRESETS: dict[str, dict[str, Any]] = {
+    "dev": {
+        "pool_size": 5,
+        "max_overflow": 5,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "echo": True,
+        "statement_timeout_ms": 0,
+        "idle_in_transaction_timeout_ms": 0,
+        "statement_cache_size": 100,
+        "null_pool": False,
+    },
+    "test": {
+        "pool_size": 1,
+        "max_overflow": 0,
+        "pool_timeout": 10,
+        "pool_recycle": -1,
+        "pool_pre_ping": False,
+        "echo": False,
+        "statement_timeout_ms": 10_000,
+        "idle_in_transaction_timeout_ms": 0,
+        "statement_cache_size": 0,
+        "null_pool": True,
+    },
+    "prod": {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_timeout": 5,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+        "echo": False,
+        "statement_timeout_ms": 15_000,
+        "idle_in_transaction_timeout_ms": 60_000,
+        "statement_cache_size": 500,
+        "null_pool": False,
+    },
+}
 
 class Settings(BaseSettings):
     DATABASE_HOST: str = Field(default="localhost")
@@ -11,14 +52,123 @@ class Settings(BaseSettings):
     SECRET_KEY: str = Field(default="secret")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    
+
+    # Профиль движка базы данных: dev, test или prod
+    DB_PROFILE: str = Field(default="dev")
+    # Переопределения отдельных параметров профиля (None - взять из пресета)
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[float] = None
+    DB_POOL_RECYCLE: Optional[int] = None
+    DB_POOL_PRE_PING: Optional[bool] = None
+    DB_ECHO: Optional[bool] = None
+    DB_STATEMENT_TIMEOUT_MS: Optional[int] = None
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS: Optional[int] = None
+    DB_STATEMENT_CACHE_SIZE: Optional[int] = None
+    DB_NULL_POOL: Optional[bool] = None
+    DB_APPLICATION_NAME: str = Field(default="workout_tracker")
+
+    # Пагинация списков
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+
+    # Кэш пользователей, найденных по токену (0 - отключить)
+    AUTH_CACHE_TTL_SECONDS: float = 60
+    AUTH_CACHE_MAX_SIZE: int = 10_000
+    # Передавать id и is_active в токене и не обращаться к БД на каждом запросе.
+    # Деактивация пользователя вступает в силу только после истечения токена.
+    AUTH_TOKEN_CLAIMS: bool = False
+
+    # Хеширование паролей: стоимость bcrypt и пул потоков для него
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    # Максимум вызовов, ожидающих свободного потока (0 - без ограничения)
+    PASSWORD_HASH_MAX_QUEUE: int = 64
+
+    # Сериализация деревьев тренировок через TypeAdapter, минуя jsonable_encoder
+    FAST_JSON_RESPONSES: bool = False
+
+    # Выгрузка истории: тренировок в одной пачке серверного курсора
+    EXPORT_BATCH_SIZE: int = 500
+    # Импорт истории: строк (тренировки + упражнения + подходы) в одной пачке COPY
+    IMPORT_BATCH_SIZE: int = 20_000
+    # Лента изменений: строк на странице по умолчанию и максимум
+    SYNC_PAGE_SIZE_DEFAULT: int = 500
+    SYNC_PAGE_SIZE_MAX: int = 2000
+    # Поиск упражнений: бюджет времени запроса к БД (0 - без ограничения);
+    # при превышении ответ строится по префиксному дереву названий
+    EXERCISE_SEARCH_TIMEOUT_MS: int = 200
+    # Префиксные деревья названий упражнений в памяти процесса
+    EXERCISE_TRIE_CACHE_SIZE: int = 10_000
+    EXERCISE_TRIE_TTL_SECONDS: float = 600
+    # Пакет изменений: максимум операций в одном запросе
+    BATCH_MAX_OPERATIONS: int = 100
+
+    # Запросы к БД: порог лога медленных выражений (0 - отключить) и заголовок
+    # Server-Timing с количеством и временем запросов HTTP-запроса
+    SQL_SLOW_QUERY_MS: float = 200
+    SERVER_TIMING_HEADER: bool = True
+
+    # Метрики Prometheus на /metrics и период обновления метрик процесса
+    # (задержка event loop, пул соединений, кэш пользователей, пул bcrypt)
+    METRICS_ENABLED: bool = True
+    METRICS_UPDATE_INTERVAL_SECONDS: float = 5
+
+    # Логирование: уровень корневого логгера, формат (json или text) и файл (пусто - только stdout)
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"
+    LOG_FILE: Optional[str] = "logs/app.log"
+    # Очередь записей для фонового потока; при переполнении записи отбрасываются
+    LOG_QUEUE_SIZE: int = 10_000
+    # Доля записей ниже WARNING, которые пишутся, по имени логгера, например {"app.main": 0.1}
+    LOG_SAMPLE_RATES: dict[str, float] = {}
+
+    # Кэш ответов чтения: memory (в процессе), redis (общий) или none
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_URL: Optional[str] = None
+    # Время жизни ответа (0 - отключить) и размер кэша в памяти
+    RESPONSE_CACHE_TTL_SECONDS: float = 300
+    RESPONSE_CACHE_MAX_SIZE: int = 10_000
+
     @property
     def DATABASE_URL(self) -> str:
         return f"postgresql+asyncpg://{self.DATABASE_USER}:{self.DATABASE_PASSWORD}@{self.DATABASE_HOST}:{self.DATABASE_PORT}/{self.DATABASE_NAME}"
 
+    @property
+    def db_profile(self) -> dict[str, Any]:
+        """
+        Итоговый профиль подключения: пресет DB_PROFILE с учетом переопределений.
+
+        Returns:
+            dict[str, Any]: Параметры пула, asyncpg и логирования
+
+        Raises:
+            ValueError: Если указан неизвестный профиль
+        """
+        if self.DB_PROFILE not in DB_PROFILE_PRESETS:
+            raise ValueError(
+                f"Неизвестный DB_PROFILE '{self.DB_PROFILE}', "
+                f"допустимые значения: {', '.join(DB_PROFILE_PRESETS)}"
+            )
+        profile = dict(DB_PROFILE_PRESETS[self.DB_PROFILE])
+        overrides = {
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+            "echo": self.DB_ECHO,
+            "statement_timeout_ms": self.DB_STATEMENT_TIMEOUT_MS,
+            "idle_in_transaction_timeout_ms": self.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS,
+            "statement_cache_size": self.DB_STATEMENT_CACHE_SIZE,
+            "null_pool": self.DB_NULL_POOL,
+        }
+        profile.update({key: value for key, value in overrides.items() if value is not None})
+        return profile
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         extra = "ignore"
 
-settings = Settings() 
\ No newline at end of file
+settings = Settings()
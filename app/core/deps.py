@@ -1,15 +1,107 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import make_transient_to_detached
 from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.security import verify_password
 from app.database.session import get_db
 from app.models.user import User
 from app.schemas.user import UserInDB
 from app.core.auth import oauth2_scheme
-from typing import Optional
+from typing import Any, Optional
+
+# Колонки пользователей, найденных по токену, ключ - subject токена (username)
+principal_cache = TTLCache(settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+def invalidate_principal(username: str) -> None:
+    """
+    Удаление пользователя из кэша после изменения или удаления.
+
+    Args:
+        username (str): Имя пользователя (subject токена)
+    """
+    principal_cache.pop(username)
+
+def token_claims(user: User) -> dict[str, Any]:
+    """
+    Данные пользователя для кодирования в токен.
+
+    Args:
+        user (User): Пользователь
+
+    Returns:
+        dict[str, Any]: Subject и, при AUTH_TOKEN_CLAIMS, id и is_active
+    """
+    claims: dict[str, Any] = {"sub": user.username}
+    if settings.AUTH_TOKEN_CLAIMS:
+        claims.update(uid=user.id, active=user.is_active)
+    return claims
+
+def decode_token(token: str) -> dict[str, Any]:
+    """
+    Декодирование токена доступа.
+
+    Args:
+        token (str): JWT токен
+
+    Returns:
+        dict[str, Any]: Данные токена с обязательным subject
+
+    Raises:
+        HTTPException: Если токен недействителен
+    """
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        raise credentials_exception
+    if payload.get("sub") is None:
+        raise credentials_exception
+    return payload
+
+async def load_user(db: AsyncSession, username: str) -> User:
+    """
+    Загрузка пользователя по имени с использованием кэша.
+
+    При попадании в кэш пользователь восстанавливается из сохраненных колонок
+    и присоединяется к сессии без запроса к БД, поэтому его можно изменять
+    и удалять как обычный загруженный объект.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        username (str): Имя пользователя
+
+    Returns:
+        User: Пользователь, присоединенный к сессии
+
+    Raises:
+        HTTPException: Если пользователь не найден
+    """
+    columns = principal_cache.get(username)
+    if columns is not None:
+        user = User(**columns)
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+
+    stmt = select(User).filter(User.username == username)
+    result = await db.execute(stmt)
+    user = result.scalar_one_or_none()
+    if user is None:
+        raise credentials_exception
+    principal_cache.set(
+        username,
+        {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs},
+    )
+    return user
 
 async def get_current_user(
     db: AsyncSession = Depends(get_db),
@@ -17,6 +109,10 @@ async def get_current_user(
 ) -> User:
     """
     Получение текущего пользователя из JWT токена.
+
+    Пользователь берется из кэша principal_cache, а при включенном
+    AUTH_TOKEN_CLAIMS - из данных токена без обращения к БД. Такой объект
+    содержит только id, username и is_active.
     
     Args:
         db (AsyncSession): Сессия базы данных
@@ -28,26 +124,33 @@ async def get_current_user(
     Raises:
         HTTPException: Если токен недействителен или пользователь не найден
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        print('payload', payload.get("sub"))
-        username: Optional[str] = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError as e:
-        raise credentials_exception
-    
-    stmt = select(User).filter(User.username == username)
-    result = await db.execute(stmt)
-    user = result.scalar_one_or_none()
-    if user is None:
-        raise credentials_exception
-    return user
+    payload = decode_token(token)
+    if settings.AUTH_TOKEN_CLAIMS and "uid" in payload and "active" in payload:
+        # Пользователь из данных токена, без обращения к БД; к сессии не присоединен
+        return User(id=payload["uid"], username=payload["sub"], is_active=payload["active"])
+    return await load_user(db, payload["sub"])
+
+async def get_current_user_record(
+    db: AsyncSession = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
+) -> User:
+    """
+    Получение полной записи текущего пользователя, присоединенной к сессии.
+
+    В отличие от get_current_user не использует данные пользователя из токена;
+    нужна маршрутам, которые читают или изменяют профиль.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        token (str): JWT токен
+
+    Returns:
+        User: Объект пользователя
+
+    Raises:
+        HTTPException: Если токен недействителен или пользователь не найден
+    """
+    return await load_user(db, decode_token(token)["sub"])
 
 async def get_current_active_user(
     current_user: User = Depends(get_current_user),
@@ -64,7 +167,23 @@ async def get_current_active_user(
     Raises:
         HTTPException: Если пользователь неактивен
     """
-    ss: str = current_user.email
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user 
\ No newline at end of file
+    return current_user
+
+async def get_current_active_user_record(
+    current_user: User = Depends(get_current_user_record),
+) -> User:
+    """
+    Получение полной записи текущего активного пользователя.
+
+    Args:
+        current_user (User): Текущий пользователь
+
+    Returns:
+        User: Активный пользователь
+
+    Raises:
+        HTTPException: Если пользователь неактивен
+    """
+    return await get_current_active_user(current_user) 
\ No newline at end of file
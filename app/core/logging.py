@@ -1,48 +1,193 @@
+import atexit
+import json
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Any, Optional
 
-# Создаем директорию для логов, если она не существует
-log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
-
-# Формат логов
-log_format = logging.Formatter(
-    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
-# Обработчик для файла
-file_handler = RotatingFileHandler(
-    "logs/app.log",
-    maxBytes=10_000_000,  # 10MB
-    backupCount=5,
-    encoding="utf-8"
-)
-file_handler.setFormatter(log_format)
-file_handler.setLevel(logging.INFO)
-
-# Обработчик для консоли
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setFormatter(log_format)
-console_handler.setLevel(logging.DEBUG)
-
-# Настройка корневого логгера
-root_logger = logging.getLogger()
-root_logger.setLevel(logging.DEBUG)
-root_logger.addHandler(file_handler)
-root_logger.addHandler(console_handler)
-
-# Настройка логгера для SQL запросов
-sql_logger = logging.getLogger("sqlalchemy.engine")
-sql_logger.setLevel(logging.WARNING)
-
-# Настройка логгера для FastAPI
-fastapi_logger = logging.getLogger("uvicorn")
-fastapi_logger.setLevel(logging.INFO)
+from app.core.config import settings
+
+# Атрибуты LogRecord; остальные (переданные через extra=) попадают в JSON как есть
+RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+class JsonFormatter(logging.Formatter):
+    """Запись лога одной строкой JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Форматирование записи.
+
+        Args:
+            record (logging.LogRecord): Запись лога
+
+        Returns:
+            str: JSON с временем, уровнем, логгером, сообщением и полями extra
+        """
+        data: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc"] = record.exc_text
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and not key.startswith("_"):
+                data[key] = value
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+class SamplingFilter(logging.Filter):
+    """
+    Пропуск доли записей уровня ниже WARNING по имени логгера.
+
+    Доля задается для логгера и действует на его потомков. Выборка
+    детерминированная: при доле 0.1 проходит каждая десятая запись.
+
+    Атрибуты:
+        rates (dict[str, float]): Доля пропускаемых записей по имени логгера
+        sampled_out (int): Количество отброшенных записей
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+        self.sampled_out = 0
+        self._counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _rate(self, name: str) -> Optional[float]:
+        while True:
+            if name in self.rates:
+                return self.rates[name]
+            if "." not in name:
+                return None
+            name = name.rpartition(".")[0]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        if rate is None or rate >= 1:
+            return True
+        with self._lock:
+            count = self._counts.get(record.name, 0) + 1
+            self._counts[record.name] = count
+            keep = int(count * rate) != int((count - 1) * rate)
+            if not keep:
+                self.sampled_out += 1
+        return keep
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Передача записей в ограниченную очередь фонового потока записи.
+
+    Если очередь заполнена, запись отбрасывается: логирование не
+    блокирует обработку запросов.
+
+    Атрибуты:
+        dropped (int): Количество отброшенных записей
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Подготовка записи к передаче в другой поток.
+
+        Сообщение и трассировка исключения вычисляются сразу, пока
+        аргументы записи не изменились; форматирование остается потоку записи.
+        """
+        record = logging.makeLogRecord(vars(record))
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+_pipeline: Optional[tuple[DroppingQueueHandler, SamplingFilter, QueueListener]] = None
+
+def setup_logging() -> None:
+    """
+    Настройка корневого логгера по LOG_* из настроек.
+
+    Запись в файл и stdout выполняет QueueListener в отдельном потоке;
+    корневой логгер только кладет записи в очередь. Повторный вызов
+    ничего не делает.
+    """
+    global _pipeline
+    if _pipeline is not None:
+        return
+
+    log_format: logging.Formatter
+    if settings.LOG_FORMAT == "json":
+        log_format = JsonFormatter()
+    else:
+        log_format = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    handlers: list[logging.Handler] = []
+    if settings.LOG_FILE:
+        Path(settings.LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(RotatingFileHandler(
+            settings.LOG_FILE,
+            maxBytes=10_000_000,  # 10MB
+            backupCount=5,
+            encoding="utf-8"
+        ))
+    handlers.append(logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(log_format)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+    queue_handler = DroppingQueueHandler(log_queue)
+    sampling = SamplingFilter(settings.LOG_SAMPLE_RATES)
+    queue_handler.addFilter(sampling)
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(settings.LOG_LEVEL.upper())
+    root_logger.addHandler(queue_handler)
+
+    # Настройка логгера для SQL запросов
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+
+    _pipeline = (queue_handler, sampling, listener)
+
+def get_logging_stats() -> dict[str, int]:
+    """
+    Состояние очереди логов.
+
+    Returns:
+        dict[str, int]: Записей в очереди, отброшенных из-за переполнения
+            и пропущенных выборкой
+    """
+    if _pipeline is None:
+        return {"queued": 0, "dropped": 0, "sampled_out": 0}
+    queue_handler, sampling, _ = _pipeline
+    return {
+        "queued": queue_handler.queue.qsize(),
+        "dropped": queue_handler.dropped,
+        "sampled_out": sampling.sampled_out,
+    }
 
 def get_logger(name: str) -> logging.Logger:
-    """Получение логгера с указанным именем."""
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    return logger 
\ No newline at end of file
+    """Получение логгера с указанным именем (уровень задает LOG_LEVEL)."""
+    return logging.getLogger(name)
+
+setup_logging()
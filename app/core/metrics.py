@@ -0,0 +1,208 @@
+import asyncio
+import os
+import time
+from typing import Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.deps import principal_cache
+from app.core.logging import get_logger, get_logging_stats
+from app.core.response_cache import response_cache
+from app.core.security import password_hasher_stats
+from app.database.instrumentation import current_query_stats
+from app.database.session import get_pool_stats
+
+logger = get_logger(__name__)
+
+# Несколько процессов uvicorn пишут метрики в файлы каталога
+# PROMETHEUS_MULTIPROC_DIR; /metrics любого процесса отдает их сумму
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+# Маршрут запросов, не нашедших обработчика: путь не попадает в метки
+UNMATCHED_ROUTE = "<unmatched>"
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Количество выражений SQL за HTTP-запрос",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP-запросы в обработке",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+EVENT_LOOP_LAG = Gauge(
+    "event_loop_lag_seconds",
+    "Задержка срабатывания таймера event loop",
+    multiprocess_mode="livemax",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Выданные соединения пула", multiprocess_mode="livesum"
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size", "Размер пула соединений", multiprocess_mode="livesum"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Соединения сверх pool_size", multiprocess_mode="livesum"
+)
+DB_POOL_TIMEOUTS = Gauge(
+    "db_pool_timeouts", "Отказы по pool_timeout с запуска процесса", multiprocess_mode="livesum"
+)
+DB_POOL_WAIT_MAX = Gauge(
+    "db_pool_wait_max_seconds", "Максимальное ожидание соединения", multiprocess_mode="livemax"
+)
+AUTH_CACHE_HITS = Gauge(
+    "auth_cache_hits", "Попадания в кэш пользователей с запуска процесса", multiprocess_mode="livesum"
+)
+AUTH_CACHE_MISSES = Gauge(
+    "auth_cache_misses", "Промахи кэша пользователей с запуска процесса", multiprocess_mode="livesum"
+)
+PASSWORD_HASH_WAITING = Gauge(
+    "password_hash_waiting", "Вызовы bcrypt, ожидающие потока", multiprocess_mode="livesum"
+)
+PASSWORD_HASH_RUNNING = Gauge(
+    "password_hash_running", "Вызовы bcrypt в потоках", multiprocess_mode="livesum"
+)
+PASSWORD_HASH_REJECTED = Gauge(
+    "password_hash_rejected", "Отказы 503 из-за очереди bcrypt с запуска процесса", multiprocess_mode="livesum"
+)
+RESPONSE_CACHE_HITS = Gauge(
+    "response_cache_hits", "Попадания в кэш ответов с запуска процесса", multiprocess_mode="livesum"
+)
+RESPONSE_CACHE_MISSES = Gauge(
+    "response_cache_misses", "Промахи кэша ответов с запуска процесса", multiprocess_mode="livesum"
+)
+LOG_QUEUE_SIZE = Gauge(
+    "log_queue_size", "Записи в очереди логов", multiprocess_mode="livesum"
+)
+LOG_RECORDS_DROPPED = Gauge(
+    "log_records_dropped", "Записи, отброшенные из-за переполнения очереди", multiprocess_mode="livesum"
+)
+LOG_RECORDS_SAMPLED_OUT = Gauge(
+    "log_records_sampled_out", "Записи, пропущенные выборкой", multiprocess_mode="livesum"
+)
+
+class MetricsMiddleware:
+    """Гистограммы времени и количества запросов к БД по шаблону пути маршрута."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            route = scope.get("route")
+            route_path = route.path_format if route is not None else UNMATCHED_ROUTE
+            REQUEST_LATENCY.labels(method, route_path, str(status)).observe(time.perf_counter() - started)
+            stats = current_query_stats.get()
+            if stats is not None:
+                REQUEST_DB_QUERIES.labels(method, route_path).observe(stats.queries)
+
+def update_process_metrics() -> None:
+    """Обновление метрик пула соединений, кэшей, пула bcrypt и очереди логов процесса."""
+    pool = get_pool_stats()
+    DB_POOL_CHECKED_OUT.set(pool.get("checked_out", 0))
+    DB_POOL_SIZE.set(pool.get("size", 0))
+    DB_POOL_OVERFLOW.set(max(pool.get("overflow", 0), 0))
+    DB_POOL_TIMEOUTS.set(pool["timeouts"])
+    DB_POOL_WAIT_MAX.set(pool["wait_time_max"])
+    AUTH_CACHE_HITS.set(principal_cache.hits)
+    AUTH_CACHE_MISSES.set(principal_cache.misses)
+    PASSWORD_HASH_WAITING.set(password_hasher_stats.waiting)
+    PASSWORD_HASH_RUNNING.set(password_hasher_stats.running)
+    PASSWORD_HASH_REJECTED.set(password_hasher_stats.rejected)
+    if response_cache is not None:
+        RESPONSE_CACHE_HITS.set(response_cache.hits)
+        RESPONSE_CACHE_MISSES.set(response_cache.misses)
+    logging_stats = get_logging_stats()
+    LOG_QUEUE_SIZE.set(logging_stats["queued"])
+    LOG_RECORDS_DROPPED.set(logging_stats["dropped"])
+    LOG_RECORDS_SAMPLED_OUT.set(logging_stats["sampled_out"])
+
+async def collect_process_metrics(interval: float) -> None:
+    """
+    Фоновая задача: задержка event loop и метрики процесса.
+
+    Задержка - насколько позже запланированного просыпается
+    asyncio.sleep(interval).
+
+    Args:
+        interval (float): Период обновления, сек
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.set(max(loop.time() - started - interval, 0.0))
+        try:
+            update_process_metrics()
+        except Exception:
+            logger.exception("Failed to update process metrics")
+
+def start_metrics_collector() -> Optional[asyncio.Task]:
+    """
+    Запуск фоновой задачи метрик процесса, если метрики включены.
+
+    Returns:
+        Optional[asyncio.Task]: Задача или None
+    """
+    if not settings.METRICS_ENABLED or settings.METRICS_UPDATE_INTERVAL_SECONDS <= 0:
+        return None
+    return asyncio.create_task(collect_process_metrics(settings.METRICS_UPDATE_INTERVAL_SECONDS))
+
+def mark_process_dead() -> None:
+    """Удаление live-метрик завершающегося процесса из общего каталога."""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(os.getpid())
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    Метрики в текстовом формате Prometheus.
+
+    Returns:
+        tuple[bytes, str]: Тело и Content-Type ответа
+    """
+    # Процесс, обработавший запрос, отдает свое состояние без задержки периода
+    update_process_metrics()
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
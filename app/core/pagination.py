@@ -0,0 +1,122 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+# Заголовок ответа с курсором следующей страницы
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Кодирование позиции (created_at, id) в непрозрачный курсор.
+
+    Args:
+        created_at (datetime): Дата создания последней записи страницы
+        row_id (int): ID последней записи страницы
+
+    Returns:
+        str: Курсор в формате base64url
+    """
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Декодирование курсора, полученного от клиента.
+
+    Args:
+        cursor (str): Курсор из encode_cursor
+
+    Returns:
+        tuple[datetime, int]: Позиция (created_at, id)
+
+    Raises:
+        HTTPException: Если курсор поврежден
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Некорректный курсор")
+
+def order_after_cursor(
+    stmt: Select,
+    created_at_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: Optional[str],
+    descending: bool = False,
+) -> Select:
+    """
+    Сортировка по ключу (created_at, id) и продолжение после курсора.
+
+    Args:
+        stmt (Select): Исходный запрос
+        created_at_column (InstrumentedAttribute): Колонка created_at
+        id_column (InstrumentedAttribute): Колонка id
+        cursor (str, опционально): Курсор последней полученной записи
+        descending (bool): Сортировка от новых записей к старым
+
+    Returns:
+        Select: Упорядоченный запрос
+
+    Raises:
+        HTTPException: Если курсор поврежден
+    """
+    if cursor is not None:
+        position = tuple_(*decode_cursor(cursor))
+        key = tuple_(created_at_column, id_column)
+        stmt = stmt.where(key < position if descending else key > position)
+    if descending:
+        return stmt.order_by(created_at_column.desc(), id_column.desc())
+    return stmt.order_by(created_at_column, id_column)
+
+def keyset_page(
+    stmt: Select,
+    created_at_column: InstrumentedAttribute,
+    id_column: InstrumentedAttribute,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = False,
+) -> Select:
+    """
+    Ограничение запроса одной страницей по ключу (created_at, id).
+
+    Запрашивается на одну запись больше limit, чтобы finish_page мог
+    определить, есть ли следующая страница.
+
+    Args:
+        stmt (Select): Исходный запрос
+        created_at_column (InstrumentedAttribute): Колонка created_at
+        id_column (InstrumentedAttribute): Колонка id
+        cursor (str, опционально): Курсор предыдущей страницы
+        limit (int): Размер страницы
+        descending (bool): Сортировка от новых записей к старым
+
+    Returns:
+        Select: Запрос страницы
+    """
+    stmt = order_after_cursor(stmt, created_at_column, id_column, cursor, descending)
+    return stmt.limit(limit + 1)
+
+def finish_page(rows: Sequence[Any], limit: int, response: Response) -> list[Any]:
+    """
+    Обрезка лишней записи и выставление заголовка X-Next-Cursor.
+
+    Args:
+        rows (Sequence[Any]): Записи, полученные запросом keyset_page
+        limit (int): Размер страницы
+        response (Response): Ответ, в который пишется курсор
+
+    Returns:
+        list[Any]: Записи текущей страницы
+    """
+    page = list(rows[:limit])
+    if len(rows) > limit and page:
+        last = page[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return page
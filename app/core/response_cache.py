@@ -0,0 +1,227 @@
+import json
+from typing import Any, Optional, Protocol
+from urllib.parse import urlencode
+
+from fastapi import Response
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.serialization import FastJSONResponse
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - redis необязателен
+    redis_asyncio = None
+
+logger = get_logger(__name__)
+
+# Заголовки ответа, которые не сохраняются в кэше
+SKIPPED_HEADERS = {"content-length", "content-type"}
+
+class CacheBackend(Protocol):
+    """Хранилище сериализованных ответов."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    async def set(self, key: str, value: bytes) -> None:
+        ...
+
+    async def clear(self) -> None:
+        ...
+
+    def stats(self) -> dict[str, Any]:
+        ...
+
+class MemoryBackend:
+    """
+    Хранилище в памяти процесса (LRU с TTL).
+
+    У каждого процесса свой кэш; точность инвалидации от этого не
+    зависит, потому что версия данных читается из БД.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._cache = TTLCache(maxsize, ttl)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        self._cache.set(key, value)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        stats = self._cache.stats()
+        return {"size": stats["size"], "maxsize": stats["maxsize"], "ttl": stats["ttl"]}
+
+class RedisBackend:
+    """
+    Общее для всех процессов хранилище в Redis.
+
+    Требует пакет redis; ключи истекают через ttl секунд.
+    """
+
+    def __init__(self, url: str, ttl: float, prefix: str = "rc:") -> None:
+        if redis_asyncio is None:
+            raise RuntimeError("Для RESPONSE_CACHE_BACKEND=redis нужен пакет redis")
+        self._client = redis_asyncio.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        await self._client.set(self.prefix + key, value, ex=max(int(self.ttl), 1))
+
+    async def clear(self) -> None:
+        async for key in self._client.scan_iter(match=self.prefix + "*"):
+            await self._client.delete(key)
+
+    def stats(self) -> dict[str, Any]:
+        return {"ttl": self.ttl}
+
+class ResponseCache:
+    """
+    Кэш JSON-ответов чтения, привязанный к версии данных пользователя.
+
+    Ключ содержит users.data_version, которую увеличивает каждый изменяющий
+    маршрут в своей транзакции: после записи старые ключи больше не
+    запрашиваются и вытесняются по TTL, поэтому инвалидация точная.
+    Ошибки хранилища не ломают запрос и считаются промахом.
+
+    Атрибуты:
+        backend (CacheBackend): Хранилище
+        hits (int): Количество попаданий
+        misses (int): Количество промахов
+        errors (int): Количество ошибок хранилища
+    """
+
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @staticmethod
+    def key(user_id: int, version: int, name: str, **params: Any) -> str:
+        """
+        Ключ ответа.
+
+        Args:
+            user_id (int): ID пользователя
+            version (int): Версия данных пользователя
+            name (str): Имя маршрута
+            **params: Параметры запроса, влияющие на ответ
+
+        Returns:
+            str: Ключ
+        """
+        query = urlencode(sorted((k, v) for k, v in params.items() if v is not None), doseq=True)
+        return f"{user_id}:{version}:{name}?{query}"
+
+    async def get(self, key: str) -> Optional[Response]:
+        """
+        Сохраненный ответ по ключу.
+
+        Args:
+            key (str): Ключ из key()
+
+        Returns:
+            Optional[Response]: Ответ или None при промахе
+        """
+        try:
+            value = await self.backend.get(key)
+        except Exception:
+            self.errors += 1
+            logger.warning("Response cache get failed", exc_info=True)
+            value = None
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        raw_headers, body = value.split(b"\n", 1)
+        return FastJSONResponse(body, headers=json.loads(raw_headers))
+
+    async def store(self, key: str, response: Response) -> Response:
+        """
+        Сохранение ответа; сам ответ возвращается без изменений.
+
+        Args:
+            key (str): Ключ из key()
+            response (Response): Ответ с сериализованным телом
+
+        Returns:
+            Response: Тот же ответ
+        """
+        headers = {
+            name: value for name, value in response.headers.items() if name not in SKIPPED_HEADERS
+        }
+        try:
+            await self.backend.set(key, json.dumps(headers).encode() + b"\n" + response.body)
+        except Exception:
+            self.errors += 1
+            logger.warning("Response cache set failed", exc_info=True)
+        return response
+
+    async def clear(self) -> None:
+        """Удаление всех ответов и обнуление статистики."""
+        await self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Статистика кэша.
+
+        Returns:
+            dict[str, Any]: Хранилище, попадания, промахи, ошибки и доля попаданий
+        """
+        requests = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            **self.backend.stats(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / requests, 4) if requests else 0.0,
+        }
+
+def build_response_cache() -> Optional[ResponseCache]:
+    """
+    Кэш ответов по настройкам RESPONSE_CACHE_*.
+
+    Returns:
+        Optional[ResponseCache]: Кэш или None, если он отключен
+
+    Raises:
+        ValueError: Если указано неизвестное хранилище
+    """
+    backend = settings.RESPONSE_CACHE_BACKEND
+    if backend == "none" or settings.RESPONSE_CACHE_TTL_SECONDS <= 0:
+        return None
+    if backend == "memory":
+        return ResponseCache(
+            MemoryBackend(settings.RESPONSE_CACHE_MAX_SIZE, settings.RESPONSE_CACHE_TTL_SECONDS)
+        )
+    if backend == "redis":
+        return ResponseCache(RedisBackend(settings.RESPONSE_CACHE_URL, settings.RESPONSE_CACHE_TTL_SECONDS))
+    raise ValueError(
+        f"Неизвестный RESPONSE_CACHE_BACKEND '{backend}', допустимые значения: memory, redis, none"
+    )
+
+response_cache = build_response_cache()
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Зависимость маршрутов чтения; в тестах подменяется другим хранилищем.
+
+    Returns:
+        Optional[ResponseCache]: Кэш или None, если он отключен
+    """
+    return response_cache
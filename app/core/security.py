@@ -1,5 +1,8 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
@@ -10,7 +13,146 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Хеши с другим числом раундов считаются устаревшими (needs_update)
+# и пересчитываются при следующем успешном входе
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
+
+T = TypeVar("T")
+
+
+class PasswordHasherStats:
+    """
+    Статистика пула хеширования паролей.
+
+    Атрибуты:
+        waiting (int): Вызовы, ожидающие свободного потока (глубина очереди)
+        running (int): Вызовы, выполняющиеся в потоках
+        completed (int): Завершенные вызовы
+        rejected (int): Вызовы, отклоненные из-за переполнения очереди
+        max_waiting (int): Максимальная глубина очереди
+        wait_time_total (float): Суммарное время ожидания потока, сек
+        wait_time_max (float): Максимальное время ожидания потока, сек
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Обнуление счетчиков."""
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.max_waiting = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Счетчики и настройки пула в виде словаря."""
+        return {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+            "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+            "waiting": self.waiting,
+            "running": self.running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "max_waiting": self.max_waiting,
+            "wait_time_avg": round(
+                self.wait_time_total / self.completed, 6
+            ) if self.completed else 0.0,
+            "wait_time_max": round(self.wait_time_max, 6),
+        }
+
+
+password_hasher_stats = PasswordHasherStats()
+
+# bcrypt отпускает GIL, поэтому потоков достаточно, чтобы не блокировать event loop
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_hash_slots = asyncio.Semaphore(settings.PASSWORD_HASH_WORKERS)
+
+async def run_password_hasher(func: Callable[..., T], *args: Any) -> T:
+    """
+    Выполнение функции passlib в пуле потоков хеширования.
+
+    Одновременно выполняется не больше PASSWORD_HASH_WORKERS вызовов,
+    остальные ждут в очереди длиной до PASSWORD_HASH_MAX_QUEUE.
+
+    Args:
+        func (Callable): Функция pwd_context
+        *args: Аргументы функции
+
+    Returns:
+        T: Результат функции
+
+    Raises:
+        HTTPException: Если очередь хеширования переполнена
+    """
+    stats = password_hasher_stats
+    if settings.PASSWORD_HASH_MAX_QUEUE and stats.waiting >= settings.PASSWORD_HASH_MAX_QUEUE:
+        stats.rejected += 1
+        raise HTTPException(
+            status_code=503,
+            detail="Сервис перегружен, повторите попытку позже",
+            headers={"Retry-After": "1"},
+        )
+
+    started = time.perf_counter()
+    stats.waiting += 1
+    stats.max_waiting = max(stats.max_waiting, stats.waiting)
+    try:
+        await _hash_slots.acquire()
+    finally:
+        stats.waiting -= 1
+    waited = time.perf_counter() - started
+    stats.wait_time_total += waited
+    stats.wait_time_max = max(stats.wait_time_max, waited)
+
+    stats.running += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+    finally:
+        stats.running -= 1
+        stats.completed += 1
+        _hash_slots.release()
+
+async def hash_password(password: str) -> str:
+    """
+    Хеширование пароля без блокировки event loop.
+
+    Args:
+        password (str): Пароль для хеширования
+
+    Returns:
+        str: Хешированный пароль
+    """
+    return await run_password_hasher(pwd_context.hash, password)
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    Проверка пароля без блокировки event loop.
+
+    Args:
+        plain_password (str): Обычный пароль
+        hashed_password (str): Хешированный пароль
+
+    Returns:
+        tuple[bool, Optional[str]]: Результат проверки и новый хеш,
+            если сохраненный хеш устарел (иначе None)
+    """
+    return await run_password_hasher(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
 
 # Rate limiting
 limiter = Limiter(key_func=get_remote_address)
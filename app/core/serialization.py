@@ -0,0 +1,111 @@
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson необязателен
+    orjson = None
+
+@lru_cache(maxsize=None)
+def get_type_adapter(tp: Any) -> TypeAdapter:
+    """
+    TypeAdapter для типа ответа; схема валидации и сериализатор строятся один раз.
+
+    Args:
+        tp (Any): Тип ответа, например list[WorkoutResponse]
+
+    Returns:
+        TypeAdapter: Закэшированный адаптер
+    """
+    return TypeAdapter(tp)
+
+def dump_json(tp: Any, obj: Any) -> bytes:
+    """
+    Сериализация ORM-объектов в JSON через схему ответа.
+
+    Объекты проверяются схемой один раз (from_attributes) и сразу
+    сериализуются pydantic-core в байты, минуя jsonable_encoder.
+
+    Args:
+        tp (Any): Тип ответа
+        obj (Any): ORM-объект или список объектов
+
+    Returns:
+        bytes: JSON
+    """
+    adapter = get_type_adapter(tp)
+    return adapter.dump_json(adapter.validate_python(obj, from_attributes=True))
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON-ответ без повторной обработки готовых байтов.
+
+    Байты из dump_json передаются как есть, остальное содержимое
+    кодируется orjson, если он установлен.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+def fast_json_response(
+    tp: Any,
+    obj: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+) -> FastJSONResponse:
+    """
+    Готовый ответ для маршрута с response_model.
+
+    FastAPI не проверяет возвращенный Response повторно и не переносит
+    в него заголовки параметра response, поэтому они копируются здесь.
+
+    Args:
+        tp (Any): Тип ответа
+        obj (Any): ORM-объект или список объектов
+        response (Response, опционально): Ответ маршрута с заголовками
+        status_code (int): Код ответа
+
+    Returns:
+        FastJSONResponse: Ответ с сериализованным телом
+    """
+    fast_response = FastJSONResponse(dump_json(tp, obj), status_code=status_code)
+    if response is not None:
+        fast_response.headers.update(response.headers)
+    return fast_response
+
+def json_response(
+    tp: Any,
+    obj: Any,
+    response: Optional[Response] = None,
+    status_code: int = 200,
+) -> JSONResponse:
+    """
+    Ответ, каким его построил бы FastAPI по response_model.
+
+    Нужен, когда маршрут должен вернуть готовый Response (например, для
+    кэша), не меняя сериализацию по умолчанию: данные проходят схему и
+    JSONResponse, как без FAST_JSON_RESPONSES.
+
+    Args:
+        tp (Any): Тип ответа
+        obj (Any): ORM-объект или список объектов
+        response (Response, опционально): Ответ маршрута с заголовками
+        status_code (int): Код ответа
+
+    Returns:
+        JSONResponse: Ответ с сериализованным телом
+    """
+    adapter = get_type_adapter(tp)
+    content = adapter.dump_python(adapter.validate_python(obj, from_attributes=True), mode="json")
+    plain_response = JSONResponse(content, status_code=status_code)
+    if response is not None:
+        plain_response.headers.update(response.headers)
+    return plain_response
@@ -0,0 +1,128 @@
+import re
+import time
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+class QueryStats:
+    """
+    Запросы к БД в рамках одного HTTP-запроса.
+
+    Атрибуты:
+        queries (int): Количество выполненных выражений
+        db_time (float): Суммарное время выполнения, сек
+    """
+
+    __slots__ = ("queries", "db_time")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_time = 0.0
+
+# Статистика текущего HTTP-запроса (None вне запроса)
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+def normalize_statement(statement: str, max_length: int = 1000) -> str:
+    """
+    Выражение SQL в одну строку для лога.
+
+    Args:
+        statement (str): Выражение
+        max_length (int): Максимальная длина
+
+    Returns:
+        str: Выражение без переносов и повторяющихся пробелов
+    """
+    statement = WHITESPACE_RE.sub(" ", statement).strip()
+    if len(statement) > max_length:
+        return statement[:max_length] + "..."
+    return statement
+
+def describe_parameters(parameters: Any, executemany: bool) -> str:
+    """
+    Форма параметров выражения без значений: типы и количество строк.
+
+    Args:
+        parameters (Any): Параметры курсора
+        executemany (bool): Пакетное выполнение
+
+    Returns:
+        str: Например "(int, str)" или "300 x (int, int)"
+    """
+    if executemany:
+        rows = list(parameters)
+        return f"{len(rows)} x {describe_parameters(rows[0], False)}" if rows else "0 rows"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(type(value).__name__ for value in parameters) + ")"
+    return type(parameters).__name__
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += elapsed
+    if settings.SQL_SLOW_QUERY_MS > 0 and elapsed * 1000 >= settings.SQL_SLOW_QUERY_MS:
+        logger.warning(
+            "Slow query %.1fms: %s params=%s",
+            elapsed * 1000, normalize_statement(statement), describe_parameters(parameters, executemany),
+            extra={"duration_ms": round(elapsed * 1000, 3)},
+        )
+
+@event.listens_for(Engine, "handle_error")
+def _handle_error(context) -> None:
+    # after_cursor_execute не вызывается для выражения, завершившегося ошибкой
+    if context.connection is not None and context.connection.info.get("query_started"):
+        context.connection.info["query_started"].pop()
+
+class QueryStatsMiddleware:
+    """
+    Подсчет запросов к БД и их времени для каждого HTTP-запроса.
+
+    Итог передается в заголовке Server-Timing (db;dur=...;desc="N queries");
+    гистограмму по маршрутам строит MetricsMiddleware.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.SERVER_TIMING_HEADER:
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", (
+                    f'db;dur={stats.db_time * 1000:.3f};desc="{stats.queries} queries", '
+                    f"app;dur={(time.perf_counter() - started) * 1000:.3f}"
+                ))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
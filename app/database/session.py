@@ -1,6 +1,10 @@
 import os
+import time
+from typing import Any
+from sqlalchemy import exc
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 from app.database.base import Base
 from dotenv import load_dotenv
 from app.core.config import settings
@@ -14,14 +18,145 @@ DATABASE_URL = settings.DATABASE_URL
 if DATABASE_URL.startswith("postgresql://"):
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
 
+
+class PoolStats:
+    """
+    Накопительная статистика выдачи соединений из пула.
+
+    Атрибуты:
+        checkouts (int): Количество выданных соединений
+        timeouts (int): Количество отказов по pool_timeout
+        wait_time_total (float): Суммарное время ожидания соединения, сек
+        wait_time_max (float): Максимальное время ожидания соединения, сек
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        """Обнуление счетчиков."""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """Учет одного ожидания соединения."""
+        self.checkouts += 1
+        self.wait_time_total += seconds
+        if seconds > self.wait_time_max:
+            self.wait_time_max = seconds
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Пул соединений, замеряющий время получения соединения."""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        finally:
+            pool_stats.record_wait(time.perf_counter() - started)
+
+
+def build_engine_options(profile: dict[str, Any]) -> dict[str, Any]:
+    """
+    Параметры create_async_engine для профиля подключения.
+
+    Args:
+        profile (dict[str, Any]): Профиль из Settings.db_profile
+
+    Returns:
+        dict[str, Any]: Именованные аргументы для create_async_engine
+    """
+    server_settings = {"application_name": settings.DB_APPLICATION_NAME}
+    if profile["statement_timeout_ms"]:
+        server_settings["statement_timeout"] = str(profile["statement_timeout_ms"])
+    if profile["idle_in_transaction_timeout_ms"]:
+        server_settings["idle_in_transaction_session_timeout"] = str(
+            profile["idle_in_transaction_timeout_ms"]
+        )
+
+    options: dict[str, Any] = {
+        "echo": profile["echo"],
+        "pool_pre_ping": profile["pool_pre_ping"],
+        "connect_args": {
+            "server_settings": server_settings,
+            # Кэш подготовленных выражений SQLAlchemy и самого asyncpg;
+            # 0 отключает их (нужно при работе через pgbouncer в режиме transaction)
+            "prepared_statement_cache_size": profile["statement_cache_size"],
+            "statement_cache_size": profile["statement_cache_size"],
+        },
+    }
+    if profile["null_pool"]:
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=profile["pool_size"],
+            max_overflow=profile["max_overflow"],
+            pool_timeout=profile["pool_timeout"],
+            pool_recycle=profile["pool_recycle"],
+        )
+    return options
+
+
 # Создание асинхронного движка базы данных
-engine = create_async_engine(DATABASE_URL, echo=True)
+engine = create_async_engine(DATABASE_URL, **build_engine_options(settings.db_profile))
 
 # Создание фабрики асинхронных сессий
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+
+def get_pool_stats() -> dict[str, Any]:
+    """
+    Текущее состояние пула соединений.
+
+    Returns:
+        dict[str, Any]: Размер пула, занятые соединения, overflow и время ожидания
+    """
+    pool = engine.sync_engine.pool
+    stats: dict[str, Any] = {
+        "profile": settings.DB_PROFILE,
+        "pool_class": type(pool).__name__,
+        "checkouts": pool_stats.checkouts,
+        "timeouts": pool_stats.timeouts,
+        "wait_time_total": round(pool_stats.wait_time_total, 6),
+        "wait_time_max": round(pool_stats.wait_time_max, 6),
+        "wait_time_avg": round(
+            pool_stats.wait_time_total / pool_stats.checkouts, 6
+        ) if pool_stats.checkouts else 0.0,
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=settings.db_profile["max_overflow"],
+        )
+    return stats
+
+def get_session_factory() -> async_sessionmaker:
+    """
+    Фабрика сессий для маршрутов, читающих БД после отправки заголовков.
+
+    Сессия из get_db закрывается до отправки тела ответа, поэтому
+    потоковые ответы открывают собственную сессию из этой фабрики.
+
+    Returns:
+        async_sessionmaker: Фабрика асинхронных сессий
+    """
+    return AsyncSessionLocal
+
 async def get_db():
     """
     Генератор асинхронных сессий базы данных.
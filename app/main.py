@@ -1,14 +1,18 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from contextlib import asynccontextmanager
 
-from app.routers import workout, workout_type, exercise, auth, user
+from app.routers import workout, workout_type, exercise, auth, user, export, data_import, records, stats, sync, batch
 from app.database.session import init_db
+from app.database.instrumentation import QueryStatsMiddleware
 from app.core.logging import get_logger
+from app.core.metrics import MetricsMiddleware, mark_process_dead, render_metrics, start_metrics_collector
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.config import settings
 from app.core.security import limiter, rate_limit_exceeded_handler
 
 logger = get_logger(__name__)
@@ -19,8 +23,12 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up...")
     await init_db()
     logger.info("Database initialized")
+    metrics_task = start_metrics_collector()
     yield
     logger.info("Shutting down...")
+    if metrics_task is not None:
+        metrics_task.cancel()
+    mark_process_dead()
 
 app = FastAPI(
     title="Workout Tracker API",
@@ -40,14 +48,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
+# Гистограммы времени запросов по маршрутам (внутри QueryStatsMiddleware:
+# читает количество запросов к БД текущего HTTP-запроса)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Количество и время запросов к БД в заголовке Server-Timing
+app.add_middleware(QueryStatsMiddleware)
+
 # Включаем роутеры
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
 app.include_router(user.router, prefix="/api/v1/users", tags=["users"])
 app.include_router(workout.router, prefix="/api/v1/workouts", tags=["workouts"])
 app.include_router(workout_type.router, prefix="/api/v1/workout-types", tags=["workout types"])
 app.include_router(exercise.router, prefix="/api/v1/exercises", tags=["exercises"])
+app.include_router(export.router, prefix="/api/v1/export", tags=["export"])
+app.include_router(data_import.router, prefix="/api/v1/import", tags=["import"])
+app.include_router(records.router, prefix="/api/v1/records", tags=["records"])
+app.include_router(stats.router, prefix="/api/v1/stats", tags=["stats"])
+app.include_router(sync.router, prefix="/api/v1/sync", tags=["sync"])
+app.include_router(batch.router, prefix="/api/v1/batch", tags=["batch"])
 
 @app.get("/")
 async def root(request: Request):
@@ -61,6 +84,14 @@ async def health_check(request: Request):
     logger.info("Health check performed")
     return {"status": "healthy"}
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Метрики в формате Prometheus (сумма по процессам при PROMETHEUS_MULTIPROC_DIR)."""
+    if not settings.METRICS_ENABLED:
+        return JSONResponse(status_code=404, content={"detail": "Not Found"})
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Глобальный обработчик исключений."""
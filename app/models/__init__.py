@@ -6,6 +6,9 @@ from app.models.exercise import Exercise
 from app.models.workout import Workout
 from app.models.workout_exercise import WorkoutExercise
 from app.models.workout_set import WorkoutSet
+from app.models.personal_record import PersonalRecord, RepRecord
+from app.models.training_summary import TrainingSummary
+from app.models.sync import SyncTombstone
 
 __all__ = [
     "User",
@@ -14,4 +17,8 @@ __all__ = [
     "Workout",
     "WorkoutExercise",
     "WorkoutSet",
+    "PersonalRecord",
+    "RepRecord",
+    "TrainingSummary",
+    "SyncTombstone",
 ] 
\ No newline at end of file
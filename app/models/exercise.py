@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, ARRAY
+from sqlalchemy import BigInteger, Column, Computed, Integer, String, DateTime, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.database.base import Base
+from app.models.sync import sync_version_seq
 from datetime import datetime
 
 class Exercise(Base):
@@ -13,18 +15,50 @@ class Exercise(Base):
         description (str): Описание упражнения (опционально)
         muscle_groups (list[str]): Группы мышц, задействованные в упражнении
         created_at (datetime): Дата и время создания записи
+        updated_at (datetime): Дата и время последнего изменения
+        sync_version (int): Версия последнего изменения (лента синхронизации)
         user_id (int): ID пользователя, создавшего упражнение
+        search_vector (str): Поисковый вектор названия (вес A) и описания (вес B)
         workout_exercises (relationship): Связь с упражнениями в тренировках
         user (relationship): Связь с пользователем
     """
     __tablename__ = "exercises"
+    __table_args__ = (
+        # Курсорная пагинация списков пользователя по (created_at, id)
+        Index("ix_exercises_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Лента изменений пользователя после версии
+        Index("ix_exercises_user_id_sync_version", "user_id", "sync_version"),
+        # Полнотекстовый поиск по названию и описанию
+        Index("ix_exercises_search_vector", "search_vector", postgresql_using="gin"),
+        # Фильтр по группам мышц (&& и @>)
+        Index("ix_exercises_muscle_groups", "muscle_groups", postgresql_using="gin"),
+        # Количество упражнений по группам мышц сканированием только индекса
+        Index("ix_exercises_user_id_muscle_groups", "user_id", postgresql_include=["muscle_groups"]),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     muscle_groups: Mapped[list[str]] = mapped_column(ARRAY(String), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    sync_version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=sync_version_seq.next_value(),
+        onupdate=sync_version_seq.next_value(),
+        nullable=False,
+    )
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
+    # Конфигурация simple: без стемминга, одинаково для русских и английских названий
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     
     workout_exercises = relationship("WorkoutExercise", back_populates="exercise")
     user = relationship("User", back_populates="exercises") 
\ No newline at end of file
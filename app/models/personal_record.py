@@ -0,0 +1,54 @@
+from datetime import datetime
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database.base import Base
+
+class PersonalRecord(Base):
+    """
+    Личные рекорды пользователя в упражнении.
+
+    Строка поддерживается при записи подходов (app.services.records),
+    поэтому чтение рекордов не требует просмотра workout_sets.
+    Учитываются только подходы с reps > 0.
+
+    Атрибуты:
+        user_id (int): ID пользователя
+        exercise_id (int): ID упражнения
+        max_weight (int): Максимальный вес в подходе
+        best_e1rm (float): Лучший расчетный разовый максимум (формула Эпли)
+        best_volume (int): Лучший объем (вес x повторения) за одну тренировку
+        updated_at (datetime): Время последнего изменения
+    """
+    __tablename__ = "personal_records"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    exercise_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("exercises.id", ondelete="CASCADE"), primary_key=True
+    )
+    max_weight: Mapped[int] = mapped_column(Integer, nullable=False)
+    best_e1rm: Mapped[float] = mapped_column(Float, nullable=False)
+    best_volume: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
+
+class RepRecord(Base):
+    """
+    Лучшее количество повторений пользователя с заданным весом.
+
+    Атрибуты:
+        user_id (int): ID пользователя
+        exercise_id (int): ID упражнения
+        weight (int): Вес в килограммах
+        reps (int): Максимум повторений с этим весом
+    """
+    __tablename__ = "rep_records"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    exercise_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("exercises.id", ondelete="CASCADE"), primary_key=True
+    )
+    weight: Mapped[int] = mapped_column(Integer, primary_key=True)
+    reps: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -0,0 +1,43 @@
+from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, Sequence, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database.base import Base
+
+# Общая последовательность версий изменений синхронизируемых таблиц
+# и журнала удалений: версия задает порядок ленты изменений
+sync_version_seq = Sequence("sync_version_seq", metadata=Base.metadata)
+
+class SyncTombstone(Base):
+    """
+    Запись журнала удалений для ленты изменений.
+
+    Удаление записи синхронизируемой таблицы оставляет строку с новой
+    версией из sync_version_seq. Дочерние записи удаленной тренировки
+    или упражнения в тренировке отдельно не журналируются: клиент
+    удаляет их вместе с родителем.
+
+    Атрибуты:
+        sync_version (int): Версия удаления
+        user_id (int): ID владельца удаленной записи
+        entity (str): Имя таблицы удаленной записи
+        entity_id (int): ID удаленной записи
+        deleted_at (datetime): Время удаления
+    """
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        # Лента удалений пользователя после версии
+        Index("ix_sync_tombstones_user_id_sync_version", "user_id", "sync_version"),
+    )
+
+    sync_version: Mapped[int] = mapped_column(
+        BigInteger,
+        sync_version_seq,
+        server_default=sync_version_seq.next_value(),
+        primary_key=True,
+    )
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    entity: Mapped[str] = mapped_column(String(32), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
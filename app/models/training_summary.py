@@ -0,0 +1,36 @@
+from datetime import date
+from sqlalchemy import BigInteger, Date, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+from app.database.base import Base
+
+class TrainingSummary(Base):
+    """
+    Сводка тренировок пользователя за неделю или месяц по группе мышц.
+
+    Строки пересчитываются по затронутым периодам при записи тренировок
+    (app.services.summaries), поэтому чтение сводки не зависит от объема
+    истории. Подход упражнения с несколькими группами мышц учитывается
+    в каждой из них; упражнения без групп попадают в группу "other".
+
+    Атрибуты:
+        user_id (int): ID пользователя
+        period (str): Период: week или month
+        period_start (date): Первый день периода (неделя начинается с понедельника)
+        muscle_group (str): Группа мышц
+        volume (int): Объем (сумма вес x повторения)
+        sets (int): Количество подходов
+        reps (int): Количество повторений
+        workouts (int): Количество тренировок
+    """
+    __tablename__ = "training_summaries"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    period: Mapped[str] = mapped_column(String(5), primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    muscle_group: Mapped[str] = mapped_column(String, primary_key=True)
+    volume: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    sets: Mapped[int] = mapped_column(Integer, nullable=False)
+    reps: Mapped[int] = mapped_column(Integer, nullable=False)
+    workouts: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -14,6 +14,8 @@ class User(Base):
         hashed_password (str): Хешированный пароль
         is_active (bool): Статус активности пользователя
         created_at (datetime): Дата и время создания пользователя
+        data_version (int): Версия данных пользователя, увеличивается
+            при каждом изменении его тренировок, упражнений и типов
         workout_types (relationship): Связь с типами тренировок пользователя
         exercises (relationship): Связь с упражнениями пользователя
         workouts (relationship): Связь с тренировками пользователя
@@ -26,6 +28,7 @@ class User(Base):
     hashed_password: Mapped[str] = mapped_column(String)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    data_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
     
     workout_types = relationship("WorkoutType", back_populates="user", cascade="all, delete-orphan")
     exercises = relationship("Exercise", back_populates="user", cascade="all, delete-orphan")
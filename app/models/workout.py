@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.database.base import Base
+from app.models.sync import sync_version_seq
 from datetime import datetime
 
 class Workout(Base):
@@ -14,19 +15,40 @@ class Workout(Base):
         workout_type_id (int): ID типа тренировки
         user_id (int): ID пользователя, создавшего тренировку
         created_at (datetime): Дата и время создания записи
+        updated_at (datetime): Дата и время последнего изменения
+        sync_version (int): Версия последнего изменения (лента синхронизации)
         workout_type (relationship): Связь с типом тренировки
         exercises (relationship): Связь с упражнениями в тренировке
         user (relationship): Связь с пользователем
     """
     __tablename__ = "workouts"
+    __table_args__ = (
+        # Курсорная пагинация списков пользователя по (created_at, id)
+        Index("ix_workouts_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Лента изменений пользователя после версии
+        Index("ix_workouts_user_id_sync_version", "user_id", "sync_version"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=True)
-    workout_type_id: Mapped[int] = mapped_column(Integer, ForeignKey("workout_types.id"))
+    workout_type_id: Mapped[int] = mapped_column(Integer, ForeignKey("workout_types.id"), index=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    sync_version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=sync_version_seq.next_value(),
+        onupdate=sync_version_seq.next_value(),
+        nullable=False,
+    )
     
     workout_type = relationship("WorkoutType", back_populates="workouts", lazy="joined")
-    exercises = relationship("WorkoutExercise", back_populates="workout", lazy="selectin", cascade="all, delete-orphan")
+    exercises = relationship(
+        "WorkoutExercise",
+        back_populates="workout",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        order_by="WorkoutExercise.id",
+    )
     user = relationship("User", back_populates="workouts") 
\ No newline at end of file
@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, ForeignKey, Text
+from sqlalchemy import BigInteger, Column, Integer, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.database.base import Base
+from app.models.sync import sync_version_seq
+from datetime import datetime
 
 class WorkoutExercise(Base):
     """
@@ -9,19 +11,41 @@ class WorkoutExercise(Base):
     Атрибуты:
         id (int): Уникальный идентификатор упражнения в тренировке
         workout_id (int): ID тренировки
+        user_id (int): ID владельца тренировки (копия workouts.user_id для ленты изменений)
         exercise_id (int): ID упражнения
         notes (str, опционально): Заметки
+        updated_at (datetime): Дата и время последнего изменения
+        sync_version (int): Версия последнего изменения (лента синхронизации)
         workout (relationship): Связь с тренировкой
         exercise (relationship): Связь с упражнением
         sets (relationship): Связь с подходами
     """
     __tablename__ = "workout_exercises"
+    __table_args__ = (
+        # Поиск упражнения по всем тренировкам (история, рекорды, прогресс)
+        Index("ix_workout_exercises_exercise_id_workout_id", "exercise_id", "workout_id"),
+        # Лента изменений пользователя после версии
+        Index("ix_workout_exercises_user_id_sync_version", "user_id", "sync_version"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    workout_id: Mapped[int] = mapped_column(Integer, ForeignKey("workouts.id"))
+    workout_id: Mapped[int] = mapped_column(Integer, ForeignKey("workouts.id"), index=True)
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     exercise_id: Mapped[int] = mapped_column(Integer, ForeignKey("exercises.id"))
     notes: Mapped[str] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    sync_version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=sync_version_seq.next_value(),
+        onupdate=sync_version_seq.next_value(),
+        nullable=False,
+    )
     
     workout = relationship("Workout", back_populates="exercises")
     exercise = relationship("Exercise")
-    sets = relationship("WorkoutSet", back_populates="workout_exercise", cascade="all, delete-orphan") 
\ No newline at end of file
+    sets = relationship(
+        "WorkoutSet",
+        back_populates="workout_exercise",
+        cascade="all, delete-orphan",
+        order_by="WorkoutSet.set_number",
+    ) 
\ No newline at end of file
@@ -1,6 +1,8 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import BigInteger, Column, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.database.base import Base
+from app.models.sync import sync_version_seq
+from datetime import datetime
 
 class WorkoutSet(Base):
     """
@@ -9,17 +11,34 @@ class WorkoutSet(Base):
     Атрибуты:
         id (int): Уникальный идентификатор подхода
         workout_exercise_id (int): ID упражнения в тренировке
+        user_id (int): ID владельца тренировки (копия workouts.user_id для ленты изменений)
         set_number (int): Номер подхода
         weight (int): Вес в килограммах
         reps (int): Количество повторений
+        updated_at (datetime): Дата и время последнего изменения
+        sync_version (int): Версия последнего изменения (лента синхронизации)
         workout_exercise (relationship): Связь с упражнением в тренировке
     """
     __tablename__ = "workout_sets"
+    __table_args__ = (
+        # Загрузка подходов упражнения в порядке выполнения
+        Index("ix_workout_sets_workout_exercise_id_set_number", "workout_exercise_id", "set_number"),
+        # Лента изменений пользователя после версии
+        Index("ix_workout_sets_user_id_sync_version", "user_id", "sync_version"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     workout_exercise_id: Mapped[int] = mapped_column(Integer, ForeignKey("workout_exercises.id"))
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     set_number: Mapped[int] = mapped_column(Integer, nullable=False)
     weight: Mapped[int] = mapped_column(Integer, nullable=False)
     reps: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    sync_version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=sync_version_seq.next_value(),
+        onupdate=sync_version_seq.next_value(),
+        nullable=False,
+    )
     
     workout_exercise = relationship("WorkoutExercise", back_populates="sets") 
\ No newline at end of file
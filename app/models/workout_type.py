@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.database.base import Base
+from app.models.sync import sync_version_seq
 from datetime import datetime
 
 class WorkoutType(Base):
@@ -13,17 +14,32 @@ class WorkoutType(Base):
         description (str): Описание типа тренировки (опционально)
         icon_url (str): URL иконки типа тренировки (опционально)
         created_at (datetime): Дата и время создания записи
+        updated_at (datetime): Дата и время последнего изменения
+        sync_version (int): Версия последнего изменения (лента синхронизации)
         user_id (int): ID пользователя, создавшего тип тренировки
         workouts (relationship): Связь с тренировками этого типа
         user (relationship): Связь с пользователем
     """
     __tablename__ = "workout_types"
+    __table_args__ = (
+        # Курсорная пагинация списков пользователя по (created_at, id)
+        Index("ix_workout_types_user_id_created_at_id", "user_id", "created_at", "id"),
+        # Лента изменений пользователя после версии
+        Index("ix_workout_types_user_id_sync_version", "user_id", "sync_version"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, index=True)
     description: Mapped[str] = mapped_column(Text, nullable=True)
     icon_url: Mapped[str] = mapped_column(String, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    sync_version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=sync_version_seq.next_value(),
+        onupdate=sync_version_seq.next_value(),
+        nullable=False,
+    )
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"))
     
     workouts = relationship("Workout", back_populates="workout_type")
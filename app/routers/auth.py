@@ -4,11 +4,11 @@ from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.config import settings
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import create_access_token, hash_password, verify_and_update_password
 from app.database.session import get_db
 from app.models.user import User
 from app.schemas import UserBase, UserCreate, UserResponse, Token, TokenData
-from app.core.deps import get_current_active_user
+from app.core.deps import get_current_active_user, invalidate_principal, token_claims
 from app.core.auth import oauth2_scheme
 from jose import jwt, JWTError
 from typing import Optional
@@ -45,7 +45,7 @@ async def register(
         )
 
     # Создаем нового пользователя
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await hash_password(user.password)
     db_user = User(
         email=user.email,
         username=user.username,
@@ -79,16 +79,29 @@ async def login(
     result = await db.execute(stmt)
     user = result.scalar_one_or_none()
 
-    if user is None or not verify_password(form_data.password, user.hashed_password):
+    if user is None:
         raise HTTPException(
             status_code=401,
             detail="Incorrect email or password"
         )
 
+    verified, new_hash = await verify_and_update_password(form_data.password, user.hashed_password)
+    if not verified:
+        raise HTTPException(
+            status_code=401,
+            detail="Incorrect email or password"
+        )
+
+    # Хеш со старой стоимостью bcrypt пересчитывается с текущими параметрами
+    if new_hash is not None:
+        user.hashed_password = new_hash
+        await db.commit()
+        invalidate_principal(user.username)
+
     # Создаем токен доступа
     access_token_expires = timedelta(minutes=60)
     access_token = create_access_token(
-        data={"sub": user.username},
+        data=token_claims(user),
         expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
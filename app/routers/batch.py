@@ -0,0 +1,219 @@
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.routing import compile_path
+
+from app.core.deps import get_current_active_user
+from app.core.logging import get_logger
+from app.core.serialization import get_type_adapter
+from app.database.session import get_db
+from app.models.user import User
+from app.routers import exercise, workout, workout_type
+from app.schemas.batch import BatchOperation, BatchRequest, BatchResponse, BatchResult
+
+logger = get_logger(__name__)
+
+router = APIRouter(
+    tags=["batch"],
+)
+
+# Маршруты, доступные в пакете, по префиксу пути
+BATCH_ROUTERS = {
+    "/workouts": workout.router,
+    "/exercises": exercise.router,
+    "/workout-types": workout_type.router,
+}
+
+MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+@dataclass
+class BatchRoute:
+    """
+    Изменяющий маршрут, который можно вызвать из пакета.
+
+    Атрибуты:
+        methods (set[str]): HTTP-методы маршрута
+        pattern (re.Pattern): Регулярное выражение полного пути
+        endpoint (Callable): Функция маршрута
+        path_params (dict[str, TypeAdapter]): Параметры пути функции
+        body (tuple[str, TypeAdapter], опционально): Параметр тела и его схема
+        response_model (Any): Схема ответа
+        status_code (int): Код успешного ответа
+    """
+    methods: set[str]
+    pattern: re.Pattern
+    endpoint: Callable
+    path_params: dict[str, TypeAdapter]
+    body: Optional[tuple[str, TypeAdapter]]
+    response_model: Any
+    status_code: int
+
+def build_batch_routes() -> list[BatchRoute]:
+    """
+    Таблица маршрутов пакета из изменяющих маршрутов BATCH_ROUTERS.
+
+    Подходят маршруты, которым кроме пути и тела нужны только сессия (db)
+    и текущий пользователь (current_user): их пакет передает сам.
+
+    Returns:
+        list[BatchRoute]: Маршруты пакета
+    """
+    routes = []
+    for prefix, api_router in BATCH_ROUTERS.items():
+        for route in api_router.routes:
+            if not isinstance(route, APIRoute) or not route.methods & MUTATING_METHODS:
+                continue
+            dependant = route.dependant
+            if (
+                {dependency.name for dependency in dependant.dependencies} != {"db", "current_user"}
+                or dependant.query_params or dependant.header_params
+                or len(dependant.body_params) > 1
+            ):
+                continue
+            pattern, _, _ = compile_path(prefix + route.path)
+            body = None
+            if dependant.body_params:
+                field = dependant.body_params[0]
+                body = (field.name, get_type_adapter(field.field_info.annotation))
+            routes.append(BatchRoute(
+                methods=route.methods & MUTATING_METHODS,
+                pattern=pattern,
+                endpoint=route.endpoint,
+                path_params={
+                    field.name: get_type_adapter(field.field_info.annotation)
+                    for field in dependant.path_params
+                },
+                body=body,
+                response_model=route.response_model,
+                status_code=route.status_code or 200,
+            ))
+    return routes
+
+BATCH_ROUTES = build_batch_routes()
+
+def resolve_operation(operation: BatchOperation) -> tuple[BatchRoute, dict[str, str]]:
+    """
+    Поиск маршрута операции по методу и пути.
+
+    Args:
+        operation (BatchOperation): Операция
+
+    Returns:
+        tuple[BatchRoute, dict[str, str]]: Маршрут и значения параметров пути
+
+    Raises:
+        HTTPException: 404, если путь не найден; 405, если метод не подходит
+    """
+    path = "/" + operation.path.strip("/")
+    path_found = False
+    for route in BATCH_ROUTES:
+        match = route.pattern.match(path) or route.pattern.match(path + "/")
+        if match is None:
+            continue
+        if operation.method in route.methods:
+            return route, match.groupdict()
+        path_found = True
+    if path_found:
+        raise HTTPException(status_code=405, detail="Method Not Allowed")
+    raise HTTPException(status_code=404, detail="Not Found")
+
+async def run_operation(
+    operation: BatchOperation, session: AsyncSession, current_user: User
+) -> BatchResult:
+    """
+    Выполнение операции функцией маршрута в сессии пакета.
+
+    Args:
+        operation (BatchOperation): Операция
+        session (AsyncSession): Сессия пакета
+        current_user (User): Текущий пользователь
+
+    Returns:
+        BatchResult: Код и тело ответа маршрута
+
+    Raises:
+        HTTPException: Ошибка маршрута или операции
+        ValidationError: Если параметры пути или тело не прошли проверку
+        SQLAlchemyError: Ошибка БД при выполнении маршрута
+    """
+    route, path_values = resolve_operation(operation)
+    kwargs = {
+        name: adapter.validate_python(path_values[name])
+        for name, adapter in route.path_params.items()
+    }
+    if route.body is not None:
+        name, adapter = route.body
+        kwargs[name] = adapter.validate_python(operation.body)
+
+    result = await route.endpoint(**kwargs, db=session, current_user=current_user)
+    if isinstance(result, Response):
+        return BatchResult(status=result.status_code, body=json.loads(result.body) if result.body else None)
+    if route.response_model is not None:
+        adapter = get_type_adapter(route.response_model)
+        result = adapter.dump_python(adapter.validate_python(result, from_attributes=True), mode="json")
+    return BatchResult(status=route.status_code, body=result)
+
+@router.post("/", response_model=BatchResponse)
+async def run_batch(
+    batch: BatchRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> dict:
+    """
+    Выполнение нескольких изменяющих операций в одной транзакции.
+
+    Операции вызывают те же функции маршрутов тренировок, упражнений и
+    типов тренировок, что и отдельные запросы, с одним пользователем и
+    одним соединением. Сессия операций присоединена к транзакции запроса
+    в режиме create_savepoint: commit маршрута освобождает SAVEPOINT,
+    откат возвращает к нему, а транзакция фиксируется один раз в конце.
+    Ошибка БД в операции откатывает только ее SAVEPOINT и дает результат
+    409 (нарушение ограничения) или 500.
+
+    Args:
+        batch (BatchRequest): Операции и режим выполнения
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+
+    Returns:
+        dict: Результаты операций и признак фиксации
+    """
+    connection = await db.connection()
+    results = []
+    failed = False
+    async with AsyncSession(
+        bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False
+    ) as session:
+        for operation in batch.operations:
+            try:
+                results.append(await run_operation(operation, session, current_user))
+                continue
+            except HTTPException as e:
+                results.append(BatchResult(status=e.status_code, body={"detail": e.detail}))
+            except ValidationError as e:
+                results.append(BatchResult(
+                    status=422, body={"detail": jsonable_encoder(e.errors(include_url=False))}
+                ))
+            except IntegrityError:
+                results.append(BatchResult(status=409, body={"detail": "Нарушение ограничения целостности"}))
+            except SQLAlchemyError as e:
+                logger.error(f"Batch operation failed: {e}", exc_info=True)
+                results.append(BatchResult(status=500, body={"detail": "Internal server error"}))
+            await session.rollback()
+            failed = True
+            if batch.atomic:
+                break
+
+    if failed and batch.atomic:
+        await db.rollback()
+        return {"results": results, "committed": False}
+    await db.commit()
+    return {"results": results, "committed": True}
@@ -0,0 +1,109 @@
+import io
+from itertools import islice
+from typing import Optional
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.deps import get_current_active_user
+from app.database.session import get_db
+from app.models.user import User
+from app.schemas.data_import import ImportResult, ImportStatus
+from app.services.data_import import (
+    PARSE_CHUNK_SIZE,
+    PARSERS,
+    ImportFormatError,
+    WorkoutImporter,
+    import_progress,
+)
+from app.services.data_version import bump_data_version
+
+router = APIRouter(
+    tags=["import"],
+)
+
+@router.post("/workouts", response_model=ImportResult, status_code=201)
+async def import_workouts(
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> dict:
+    """
+    Импорт истории тренировок из CSV или NDJSON в формате выгрузки.
+
+    Файл разбирается потоком в пуле потоков порциями по PARSE_CHUNK_SIZE
+    тренировок, чтобы разбор не блокировал event loop, и загружается
+    пачками по IMPORT_BATCH_SIZE строк через COPY в одной транзакции: при
+    ошибке в любой строке ничего не сохраняется. Значения подходов
+    проверяются схемой WorkoutSetCreate до COPY. Ход импорта после каждой
+    пачки доступен через GET /import/workouts/status.
+
+    В отличие от создания тренировки, повторяющиеся названия тренировок
+    допускаются: история обычно содержит много тренировок с одним
+    названием, а повторная загрузка выгрузки добавляет ее копию.
+
+    Args:
+        file (UploadFile): Загружаемый файл
+        format (str, опционально): csv или ndjson; по умолчанию по расширению файла
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+
+    Returns:
+        dict: Итоги импорта
+
+    Raises:
+        HTTPException: Если формат не определен или файл содержит ошибки
+    """
+    if format is None:
+        extension = (file.filename or "").rsplit(".", 1)[-1].lower()
+        format = "ndjson" if extension in ("ndjson", "jsonl") else extension
+    if format not in PARSERS:
+        raise HTTPException(status_code=400, detail="Поддерживаются только файлы CSV и NDJSON")
+
+    await bump_data_version(db, current_user.id)
+    importer = WorkoutImporter(db, current_user.id, settings.IMPORT_BATCH_SIZE)
+    await importer.load_catalog()
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    workouts = PARSERS[format](stream)
+    try:
+        while chunk := await run_in_threadpool(list, islice(workouts, PARSE_CHUNK_SIZE)):
+            for workout in chunk:
+                await importer.add(workout)
+        await importer.finish()
+    except (ImportFormatError, UnicodeDecodeError) as e:
+        await db.rollback()
+        importer.publish("failed", str(e))
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        importer.publish("failed", "Внутренняя ошибка сервера")
+        raise
+    finally:
+        stream.detach()
+    await db.commit()
+    importer.publish("done")
+    return importer.summary()
+
+@router.get("/workouts/status", response_model=ImportStatus)
+async def get_import_status(
+    current_user: User = Depends(get_current_active_user),
+) -> dict:
+    """
+    Ход последнего импорта текущего пользователя.
+
+    Пока импорт выполняется, счетчики обновляются после каждой пачки.
+    Состояние хранится в памяти процесса, обработавшего импорт.
+
+    Args:
+        current_user (User): Текущий пользователь
+
+    Returns:
+        dict: Счетчики импорта и его состояние (running, done или failed)
+
+    Raises:
+        HTTPException: Если пользователь еще не запускал импорт
+    """
+    progress = import_progress.get(current_user.id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Импорт не запускался")
+    return progress
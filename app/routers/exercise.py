@@ -1,10 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select
+from typing import Optional
 
+from app.core.config import settings
+from app.core.pagination import finish_page, keyset_page
+from app.core.conditional import read_data_version
+from app.core.response_cache import ResponseCache, get_response_cache
+from app.core.serialization import json_response
 from app.database.session import get_db
 from app.models.exercise import Exercise
-from app.schemas import ExerciseCreate, ExerciseResponse, ExerciseUpdate
+from app.schemas import ExerciseCreate, ExerciseResponse, ExerciseSuggestion, ExerciseUpdate, MuscleGroupCount
+from app.schemas.progress import ExerciseProgress
+from app.services.progress import compute_progress, load_set_columns
+from app.services.data_version import bump_data_version
+from app.services.exercise_search import get_exercise_trie, search_exercises
+from app.services.sync import record_deletions
+from app.services.summaries import refresh_summaries
+from app.models.workout import Workout
+from app.models.workout_exercise import WorkoutExercise
 from app.models.user import User
 from app.core.deps import get_current_active_user
 
@@ -44,6 +58,7 @@ async def create_exercise(
             detail="Упражнение с таким именем уже существует"
         )
 
+    await bump_data_version(db, current_user.id)
     # Создаем новое упражнение
     db_exercise = Exercise(
         name=exercise.name,
@@ -58,28 +73,53 @@ async def create_exercise(
 
 @router.get("/", response_model=list[ExerciseResponse])
 async def get_exercises(
-    skip: int = 0,
-    limit: int = 100,
-    muscle_groups: list[str] = [],
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
+    muscle_groups: list[str] = Query([]),
+    match: str = Query("any", pattern="^(any|all)$"),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    cache: Optional[ResponseCache] = Depends(get_response_cache),
+    version: int = Depends(read_data_version),
 ):
-    """Получение списка упражнений с пагинацией и фильтрацией."""
+    """
+    Получение списка упражнений с пагинацией и фильтрацией.
+
+    Если передан cursor, используется курсорная пагинация и skip игнорируется.
+    Курсор следующей страницы возвращается в заголовке X-Next-Cursor.
+    Фильтр muscle_groups в режиме match=any оставляет упражнения хотя бы
+    с одной из групп, в режиме all - со всеми группами (GIN-индекс).
+    """
+    if cache is not None:
+        cache_key = cache.key(
+            current_user.id, version, "exercises",
+            skip=skip, limit=limit, cursor=cursor, muscle_groups=muscle_groups, match=match,
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
     # Базовый запрос для упражнений текущего пользователя
     stmt = select(Exercise).where(Exercise.user_id == current_user.id)
     
     # Добавляем фильтрацию по группам мышц, если указаны
-    if muscle_groups:
+    if muscle_groups and match == "all":
+        stmt = stmt.where(Exercise.muscle_groups.contains(muscle_groups))
+    elif muscle_groups:
         stmt = stmt.where(Exercise.muscle_groups.overlap(muscle_groups))
     
     # Добавляем пагинацию
-    stmt = stmt.offset(skip).limit(limit)
+    stmt = keyset_page(stmt, Exercise.created_at, Exercise.id, cursor, limit)
+    if cursor is None:
+        stmt = stmt.offset(skip)
     
     # Выполняем запрос
     result = await db.execute(stmt)
-    exercises = result.scalars().all()
+    exercises = finish_page(result.scalars().all(), limit, response)
     
-    return [
+    items = [
         ExerciseResponse(
             id=ex.id,
             name=ex.name,
@@ -89,8 +129,115 @@ async def get_exercises(
             created_at=ex.created_at
         ) for ex in exercises
     ]
+    if cache is not None:
+        return await cache.store(cache_key, json_response(list[ExerciseResponse], items, response))
+    return items
+
+@router.get(
+    "/muscle-groups",
+    response_model=list[MuscleGroupCount],
+    dependencies=[Depends(read_data_version)],
+)
+async def get_muscle_group_counts(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> list[dict]:
+    """
+    Количество упражнений пользователя по группам мышц.
+
+    Группы читаются из покрывающего индекса (user_id) INCLUDE (muscle_groups),
+    поэтому запрос не обращается к строкам таблицы.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+
+    Returns:
+        list[dict]: Группы мышц по убыванию количества упражнений
+    """
+    muscle_group = func.unnest(Exercise.muscle_groups).label("muscle_group")
+    groups = (
+        select(muscle_group)
+        .where(Exercise.user_id == current_user.id)
+        .subquery()
+    )
+    exercises = func.count().label("exercises")
+    result = await db.execute(
+        select(groups.c.muscle_group, exercises)
+        .group_by(groups.c.muscle_group)
+        .order_by(exercises.desc(), groups.c.muscle_group)
+    )
+    return [row._asdict() for row in result]
+
+@router.get("/autocomplete", response_model=list[ExerciseSuggestion])
+async def autocomplete_exercises(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    version: int = Depends(read_data_version),
+) -> list[dict]:
+    """
+    Подсказки по началу слов названия упражнения.
+
+    Ответ строится по префиксному дереву названий в памяти процесса;
+    дерево перестраивается одним запросом после изменения данных
+    пользователя, поэтому обычный запрос обходится чтением версии.
+
+    Args:
+        q (str): Начало названия, можно несколько слов
+        limit (int): Максимум подсказок
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+        version (int): Версия данных пользователя
+
+    Returns:
+        list[dict]: ID и названия упражнений
+    """
+    trie = await get_exercise_trie(db, current_user.id, version)
+    return [{"id": exercise_id, "name": name} for exercise_id, name in trie.search(q, limit)]
+
+@router.get("/search", response_model=list[ExerciseResponse])
+async def search_exercises_route(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=settings.PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    version: int = Depends(read_data_version),
+) -> list[Exercise]:
+    """
+    Поиск упражнений по словам названия и описания.
+
+    Каждое слово запроса ищется как префикс по GIN-индексу search_vector;
+    выше ранжируются названия, начинающиеся с запроса, и совпадения
+    в названии. Если запрос к БД не уложился в EXERCISE_SEARCH_TIMEOUT_MS,
+    результаты строятся по префиксному дереву названий.
+
+    Args:
+        q (str): Строка поиска
+        limit (int): Максимум результатов
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+        version (int): Версия данных пользователя
+
+    Returns:
+        list[Exercise]: Найденные упражнения
+    """
+    user_id = current_user.id
+    exercises = await search_exercises(db, user_id, q, limit)
+    if exercises is not None:
+        return exercises
+    trie = await get_exercise_trie(db, user_id, version)
+    ids = [exercise_id for exercise_id, _ in trie.search(q, limit)]
+    result = await db.execute(select(Exercise).where(Exercise.id.in_(ids)))
+    by_id = {exercise.id: exercise for exercise in result.scalars()}
+    return [by_id[exercise_id] for exercise_id in ids if exercise_id in by_id]
 
-@router.get("/{exercise_id}", response_model=ExerciseResponse)
+@router.get(
+    "/{exercise_id}",
+    response_model=ExerciseResponse,
+    dependencies=[Depends(read_data_version)],
+)
 async def get_exercise(
     exercise_id: int,
     db: AsyncSession = Depends(get_db),
@@ -107,6 +254,35 @@ async def get_exercise(
         raise HTTPException(status_code=404, detail="Exercise not found")
     return exercise
 
+@router.get(
+    "/{exercise_id}/progress",
+    response_model=ExerciseProgress,
+    dependencies=[Depends(read_data_version)],
+)
+async def get_exercise_progress(
+    exercise_id: int,
+    window: int = Query(4, ge=1, le=52),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Прогресс в упражнении по тренировкам: тоннаж, e1RM, интенсивность,
+    скользящие средние и тренды.
+
+    Подходы читаются одним запросом в виде колонок и обрабатываются
+    массивами NumPy, без создания ORM-объектов.
+    """
+    stmt = select(Exercise.id).where(
+        Exercise.id == exercise_id,
+        Exercise.user_id == current_user.id
+    )
+    result = await db.execute(stmt)
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Exercise not found")
+
+    columns = await load_set_columns(db, current_user.id, exercise_id)
+    return compute_progress(*columns, window=window)
+
 @router.put("/{exercise_id}", response_model=ExerciseResponse)
 async def update_exercise(
     exercise_id: int,
@@ -126,9 +302,24 @@ async def update_exercise(
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
     
+    await bump_data_version(db, current_user.id)
     # Обновляем поля упражнения
-    for field, value in exercise_in.dict(exclude_unset=True).items():
+    changes = exercise_in.dict(exclude_unset=True)
+    regrouped = "muscle_groups" in changes and changes["muscle_groups"] != exercise.muscle_groups
+    for field, value in changes.items():
         setattr(exercise, field, value)
+
+    # Сводки по группам мышц пересчитываются за период, в котором упражнение выполнялось
+    if regrouped:
+        await db.flush()
+        result = await db.execute(
+            select(func.min(Workout.created_at), func.max(Workout.created_at))
+            .join(WorkoutExercise, WorkoutExercise.workout_id == Workout.id)
+            .where(WorkoutExercise.exercise_id == exercise_id, Workout.user_id == current_user.id)
+        )
+        first, last = result.one()
+        if first is not None:
+            await refresh_summaries(db, current_user.id, [first, last])
     
     await db.commit()
     await db.refresh(exercise)
@@ -167,7 +358,9 @@ async def delete_exercise(
             detail="Упражнение не найдено"
         )
 
+    await bump_data_version(db, current_user.id)
     await db.delete(exercise)
+    await record_deletions(db, current_user.id, "exercises", [exercise_id])
     await db.commit()
     
     return {"message": "Упражнение успешно удалено"} 
\ No newline at end of file
@@ -0,0 +1,62 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.core.config import settings
+from app.core.deps import get_current_active_user
+from app.core.pagination import order_after_cursor
+from app.database.session import get_session_factory
+from app.models.user import User
+from app.models.workout import Workout
+from app.services.export import gzip_stream, stream_workouts
+from app.services.workout_query import select_workout_tree
+
+router = APIRouter(
+    tags=["export"],
+)
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+@router.get("/workouts")
+async def export_workouts(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    cursor: Optional[str] = None,
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """
+    Потоковая выгрузка всей истории тренировок пользователя.
+
+    Тренировки выгружаются от старых к новым вместе с упражнениями и подходами.
+    Каждая запись содержит курсор; если выгрузка прервалась, ее можно
+    продолжить, передав курсор последней полученной записи. Ответ сжимается
+    gzip, если клиент передал Accept-Encoding: gzip.
+
+    Args:
+        request (Request): Запрос (для Accept-Encoding)
+        format (str): Формат выгрузки: ndjson или csv
+        cursor (str, опционально): Курсор последней полученной тренировки
+        session_factory (async_sessionmaker): Фабрика сессий для чтения при отправке
+        current_user (User): Текущий пользователь
+
+    Returns:
+        StreamingResponse: Поток NDJSON или CSV
+
+    Raises:
+        HTTPException: Если курсор поврежден
+    """
+    stmt = order_after_cursor(
+        select_workout_tree().where(Workout.user_id == current_user.id),
+        Workout.created_at, Workout.id, cursor,
+    )
+    body = stream_workouts(session_factory, stmt, format, settings.EXPORT_BATCH_SIZE)
+    headers = {"Content-Disposition": f'attachment; filename="workouts.{format}"'}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(body, media_type=MEDIA_TYPES[format], headers=headers)
@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.deps import get_current_active_user
+from app.database.session import get_db
+from app.models.personal_record import PersonalRecord, RepRecord
+from app.models.user import User
+from app.schemas.records import PersonalRecordDetail, PersonalRecordResponse
+
+router = APIRouter(
+    tags=["records"],
+)
+
+@router.get("/", response_model=list[PersonalRecordResponse])
+async def get_personal_records(
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> list[PersonalRecord]:
+    """
+    Личные рекорды текущего пользователя по всем упражнениям.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+
+    Returns:
+        list[PersonalRecord]: Рекорды по возрастанию ID упражнения
+    """
+    result = await db.execute(
+        select(PersonalRecord)
+        .where(PersonalRecord.user_id == current_user.id)
+        .order_by(PersonalRecord.exercise_id)
+    )
+    return result.scalars().all()
+
+@router.get("/{exercise_id}", response_model=PersonalRecordDetail)
+async def get_exercise_records(
+    exercise_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> dict:
+    """
+    Личные рекорды в упражнении, включая лучшие повторения для каждого веса.
+
+    Args:
+        exercise_id (int): ID упражнения
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+
+    Returns:
+        dict: Рекорды упражнения
+
+    Raises:
+        HTTPException: Если по упражнению нет ни одного рекорда
+    """
+    record = await db.get(PersonalRecord, (current_user.id, exercise_id))
+    if record is None:
+        raise HTTPException(status_code=404, detail="Рекорды по упражнению не найдены")
+    result = await db.execute(
+        select(RepRecord)
+        .where(RepRecord.user_id == current_user.id, RepRecord.exercise_id == exercise_id)
+        .order_by(RepRecord.weight)
+    )
+    return {
+        **PersonalRecordResponse.model_validate(record).dict(),
+        "rep_records": result.scalars().all(),
+    }
@@ -0,0 +1,62 @@
+from datetime import date, datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.deps import get_current_active_user
+from app.database.session import get_db
+from app.models.training_summary import TrainingSummary
+from app.models.user import User
+from app.schemas.stats import TrainingSummaryResponse
+from app.services.summaries import period_start, shift_period
+
+router = APIRouter(
+    tags=["stats"],
+)
+
+# Количество периодов в ответе по умолчанию
+DEFAULT_PERIODS = 12
+
+@router.get("/summary", response_model=list[TrainingSummaryResponse])
+async def get_training_summary(
+    period: str = Query("week", pattern="^(week|month)$"),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> list[TrainingSummary]:
+    """
+    Объем тренировок по неделям или месяцам и группам мышц.
+
+    Читаются только готовые сводки (training_summaries) по первичному
+    ключу, поэтому стоимость запроса не зависит от объема истории.
+    По умолчанию возвращаются последние 12 периодов.
+
+    Args:
+        period (str): week или month
+        start (date, опционально): Дата внутри первого периода
+        end (date, опционально): Дата внутри последнего периода; по умолчанию сегодня
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+
+    Returns:
+        list[TrainingSummary]: Сводки по возрастанию периода и названию группы мышц
+
+    Raises:
+        HTTPException: Если начало диапазона позже конца
+    """
+    last = period_start(period, end or datetime.utcnow().date())
+    first = period_start(period, start) if start else shift_period(period, last, 1 - DEFAULT_PERIODS)
+    if first > last:
+        raise HTTPException(status_code=400, detail="Начало периода позже его конца")
+
+    result = await db.execute(
+        select(TrainingSummary)
+        .where(
+            TrainingSummary.user_id == current_user.id,
+            TrainingSummary.period == period,
+            TrainingSummary.period_start.between(first, last),
+        )
+        .order_by(TrainingSummary.period_start, TrainingSummary.muscle_group)
+    )
+    return result.scalars().all()
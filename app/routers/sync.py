@@ -0,0 +1,43 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.deps import get_current_active_user
+from app.database.session import get_db
+from app.models.user import User
+from app.schemas.sync import SyncChanges
+from app.services.sync import decode_sync_token, load_changes
+
+router = APIRouter(
+    tags=["sync"],
+)
+
+@router.get("/", response_model=SyncChanges)
+async def get_changes(
+    since: Optional[str] = None,
+    limit: int = Query(settings.SYNC_PAGE_SIZE_DEFAULT, ge=1, le=settings.SYNC_PAGE_SIZE_MAX),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> dict:
+    """
+    Изменения данных пользователя после токена since.
+
+    Возвращает измененные и созданные типы тренировок, упражнения,
+    тренировки, упражнения в тренировках и подходы плоскими строками,
+    а также удаленные записи. Без since лента начинается с начала истории.
+    Клиент повторяет запрос с next_token, пока has_more равен true, и
+    сохраняет последний next_token для следующей синхронизации.
+
+    Args:
+        since (str, опционально): Токен из предыдущего ответа
+        limit (int): Максимум строк на странице
+        db (AsyncSession): Сессия базы данных
+        current_user (User): Текущий пользователь
+
+    Returns:
+        dict: Страница изменений
+
+    Raises:
+        HTTPException: Если токен поврежден
+    """
+    return await load_changes(db, current_user.id, decode_sync_token(since), limit)
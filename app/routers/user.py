@@ -1,18 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from typing import List
 from app.database.session import get_db
 from app.schemas import UserResponse as User, UserCreate, UserUpdate
-from app.models import User as UserModel
-from app.core.deps import get_current_active_user
-from app.core.security import get_password_hash
+from app.models import Exercise, User as UserModel, Workout, WorkoutExercise, WorkoutSet, WorkoutType
+from app.core.deps import get_current_active_user_record, invalidate_principal
+from app.core.security import hash_password
 
 router = APIRouter()
 
 @router.get("/me", response_model=User)
 async def read_current_user(
-    user: UserModel = Depends(get_current_active_user)
+    user: UserModel = Depends(get_current_active_user_record)
 ):
     """
     Получение информации о текущем пользователе.
@@ -26,7 +26,7 @@ async def read_current_user(
 async def update_current_user(
     user_update: UserUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_active_user_record)
 ):
     """
     Обновление информации о текущем пользователе.
@@ -42,6 +42,7 @@ async def update_current_user(
     Raises:
         HTTPException: Если новый email или username уже заняты
     """
+    previous_username = current_user.username
     # Проверка email, если он изменился
     if user_update.email and user_update.email != current_user.email:
         result = await db.execute(
@@ -70,16 +71,17 @@ async def update_current_user(
     
     # Обновление пароля, если он изменился
     if user_update.password:
-        current_user.hashed_password = get_password_hash(user_update.password)
+        current_user.hashed_password = await hash_password(user_update.password)
     
     await db.commit()
+    invalidate_principal(previous_username)
     await db.refresh(current_user)
     return current_user
 
 @router.delete("/me")
 async def delete_current_user(
     db: AsyncSession = Depends(get_db),
-    current_user: UserModel = Depends(get_current_active_user)
+    current_user: UserModel = Depends(get_current_active_user_record)
 ):
     """
     Удаление текущего пользователя.
@@ -91,6 +93,20 @@ async def delete_current_user(
     Returns:
         dict: Сообщение об успешном удалении
     """
-    await db.delete(current_user)
+    # Удаление пакетными DELETE в порядке внешних ключей: каскад ORM
+    # загружал бы каждую тренировку, ее упражнения и подходы по отдельности.
+    # Рекорды, сводки и записи об удалении удаляет ON DELETE CASCADE.
+    workout_ids = select(Workout.id).where(Workout.user_id == current_user.id)
+    workout_exercise_ids = select(WorkoutExercise.id).where(WorkoutExercise.workout_id.in_(workout_ids))
+    for stmt in (
+        delete(WorkoutSet).where(WorkoutSet.workout_exercise_id.in_(workout_exercise_ids)),
+        delete(WorkoutExercise).where(WorkoutExercise.workout_id.in_(workout_ids)),
+        delete(Workout).where(Workout.user_id == current_user.id),
+        delete(Exercise).where(Exercise.user_id == current_user.id),
+        delete(WorkoutType).where(WorkoutType.user_id == current_user.id),
+        delete(UserModel).where(UserModel.id == current_user.id),
+    ):
+        await db.execute(stmt, execution_options={"synchronize_session": False})
     await db.commit()
+    invalidate_principal(current_user.username)
     return {"message": "User successfully deleted"} 
\ No newline at end of file
@@ -1,9 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
-from sqlalchemy import select
-from typing import List
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import delete, select
+from typing import Optional
+from app.core.config import settings
+from app.core.pagination import finish_page, keyset_page
+from app.core.conditional import read_data_version
+from app.core.response_cache import ResponseCache, get_response_cache
+from app.core.serialization import fast_json_response, json_response
 from app.database.session import get_db
+from app.services.data_version import bump_data_version
+from app.services.records import merge_records, recompute_records, samples_from_tree
+from app.services.summaries import refresh_summaries
+from app.services.sync import record_deletions
+from app.services.workout_query import select_workout_tree
+from app.services.workout_write import (
+    apply_workout_diff,
+    diff_workout_exercises,
+    insert_workout_exercises,
+    load_exercises,
+)
 from app.models.workout_exercise import WorkoutExercise
 from app.models.workout_type import WorkoutType
 from app.models.workout_set import WorkoutSet
@@ -27,6 +44,10 @@ async def create_workout(
     """
     Создает новую тренировку.
 
+    Тренировка, упражнения и подходы создаются в одной транзакции:
+    по одному INSERT ... RETURNING на каждую таблицу, без повторного
+    чтения созданного дерева.
+
     Args:
         workout (WorkoutCreate): Данные для создания тренировки
         db (AsyncSession): Сессия базы данных
@@ -36,10 +57,11 @@ async def create_workout(
         Workout: Созданная тренировка
 
     Raises:
-        HTTPException: Если тренировка с таким именем уже существует
+        HTTPException: Если тренировка с таким именем уже существует,
+            тип тренировки или упражнения не найдены
     """
     # Проверяем, существует ли тренировка с таким именем у текущего пользователя
-    stmt = select(Workout).where(
+    stmt = select(Workout.id).where(
         Workout.name == workout.name,
         Workout.user_id == current_user.id
     )
@@ -50,6 +72,21 @@ async def create_workout(
             detail="Тренировка с таким именем уже существует"
         )
 
+    result = await db.execute(
+        select(WorkoutType).where(
+            WorkoutType.id == workout.workout_type_id,
+            WorkoutType.user_id == current_user.id
+        )
+    )
+    workout_type = result.scalar_one_or_none()
+    if workout_type is None:
+        raise HTTPException(status_code=404, detail="Тип тренировки не найден")
+
+    exercises = await load_exercises(
+        db, current_user.id, (data.exercise_id for data in workout.exercises)
+    )
+
+    await bump_data_version(db, current_user.id)
     # Создаем новую тренировку
     db_workout = Workout(
         name=workout.name,
@@ -58,42 +95,91 @@ async def create_workout(
         user_id=current_user.id
     )
     db.add(db_workout)
+    await db.flush()
+
+    workout_exercises = await insert_workout_exercises(
+        db, current_user.id, db_workout.id, workout.exercises, exercises
+    )
+    await merge_records(db, current_user.id, samples_from_tree(workout_exercises))
+    if workout_exercises:
+        await refresh_summaries(db, current_user.id, [db_workout.created_at])
+    set_committed_value(db_workout, "workout_type", workout_type)
+    set_committed_value(db_workout, "exercises", workout_exercises)
     await db.commit()
-    await db.refresh(db_workout)
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json_response(WorkoutResponse, db_workout, status_code=201)
     return db_workout
 
 @router.get("/", response_model=list[WorkoutResponse])
 async def get_workouts(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
+    cache: Optional[ResponseCache] = Depends(get_response_cache),
+    version: int = Depends(read_data_version),
 ) -> list[Workout]:
     """
-    Возвращает список всех тренировок текущего пользователя.
+    Возвращает страницу тренировок текущего пользователя, от новых к старым.
+
+    Курсор следующей страницы возвращается в заголовке X-Next-Cursor;
+    заголовок отсутствует на последней странице. С If-None-Match,
+    совпадающим с ETag, возвращается 304.
 
     Args:
+        response (Response): Ответ для заголовков с курсором и ETag
+        cursor (str, опционально): Курсор из X-Next-Cursor предыдущей страницы
+        limit (int): Размер страницы
         db (AsyncSession): Сессия базы данных
         current_user (User): Текущий пользователь
+        cache (ResponseCache, опционально): Кэш ответов
+        version (int): Версия данных пользователя (ETag, ключ кэша)
 
     Returns:
         list[Workout]: Список тренировок
     """
-    result = await db.execute(select(Workout).where(Workout.user_id == current_user.id)
-                                .options(
-                                  selectinload(Workout.exercises).selectinload(WorkoutExercise.sets),
-                                  selectinload(Workout.exercises).selectinload(WorkoutExercise.exercise),
-                                  selectinload(Workout.exercises).selectinload(WorkoutExercise.workout)
-                              )
-                              .options(selectinload(Workout.workout_type).selectinload(WorkoutType.workouts)))
-    return list(result.scalars().all())
+    if cache is not None:
+        cache_key = cache.key(
+            current_user.id, version, "workouts",
+            cursor=cursor, limit=limit,
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    stmt = keyset_page(
+        select_workout_tree().where(Workout.user_id == current_user.id),
+        Workout.created_at, Workout.id, cursor, limit, descending=True,
+    )
+    result = await db.execute(stmt)
+    workouts = finish_page(result.scalars().all(), limit, response)
+    if cache is not None:
+        serialize = fast_json_response if settings.FAST_JSON_RESPONSES else json_response
+        return await cache.store(cache_key, serialize(list[WorkoutResponse], workouts, response))
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json_response(list[WorkoutResponse], workouts, response)
+    return workouts
 
 @router.get("/{workout_id}", response_model=WorkoutResponse)
-async def get_workout(workout_id: int, db: AsyncSession = Depends(get_db)):
+async def get_workout(
+    workout_id: int,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+    cache: Optional[ResponseCache] = Depends(get_response_cache),
+    version: int = Depends(read_data_version),
+):
     """
-    Получение тренировки по ID.
+    Получение тренировки текущего пользователя по ID.
     
     Args:
         workout_id (int): ID тренировки
+        response (Response): Ответ для заголовка ETag
         db (AsyncSession): Асинхронная сессия базы данных
+        current_user (User): Текущий пользователь
+        cache (ResponseCache, опционально): Кэш ответов
+        version (int): Версия данных пользователя (ETag, ключ кэша)
     
     Returns:
         Workout: Тренировка
@@ -101,76 +187,98 @@ async def get_workout(workout_id: int, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: Если тренировка не найдена
     """
-    result = await db.execute(select(Workout).where(Workout.id == workout_id)
-                              .options(
-                                  selectinload(Workout.exercises).selectinload(WorkoutExercise.sets),
-                                  selectinload(Workout.exercises).selectinload(WorkoutExercise.exercise),
-                              )
-                              .options(selectinload(Workout.workout_type)))
+    if cache is not None:
+        cache_key = cache.key(
+            current_user.id, version, "workout", id=workout_id
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    result = await db.execute(
+        select_workout_tree().where(
+            Workout.id == workout_id,
+            Workout.user_id == current_user.id
+        )
+    )
     
     workout = result.scalar_one_or_none()
     if not workout:
         raise HTTPException(status_code=404, detail="Тренировка не найдена")
+    if cache is not None:
+        serialize = fast_json_response if settings.FAST_JSON_RESPONSES else json_response
+        return await cache.store(cache_key, serialize(WorkoutResponse, workout, response))
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json_response(WorkoutResponse, workout, response)
     return workout
 
 @router.patch("/{workout_id}", response_model=WorkoutResponse)
-async def update_workout(workout_id: int, workout: WorkoutUpdate, db: AsyncSession = Depends(get_db)):
+async def update_workout(
+    workout_id: int,
+    workout: WorkoutUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
     """
     Обновление тренировки.
+
+    Дерево тренировки загружается один раз, изменения упражнений и подходов
+    применяются пакетно в одной транзакции. Переданный список exercises
+    задает итоговый набор упражнений: отсутствующие в нем удаляются.
     
     Args:
         workout_id (int): ID тренировки для обновления
         workout (WorkoutUpdate): Данные для обновления
         db (AsyncSession): Асинхронная сессия базы данных
+        current_user (User): Текущий пользователь
     
     Returns:
         Workout: Обновленная тренировка
     
     Raises:
-        HTTPException: Если тренировка не найдена
+        HTTPException: Если тренировка, тип тренировки или упражнение не найдены
     """
-    result = await db.execute(select(Workout).where(Workout.id == workout_id))
+    result = await db.execute(
+        select_workout_tree().where(
+            Workout.id == workout_id,
+            Workout.user_id == current_user.id
+        )
+    )
     db_workout = result.scalar_one_or_none()
     if not db_workout:
         raise HTTPException(status_code=404, detail="Тренировка не найдена")
-    
-    for key, value in workout.dict(exclude_unset=True).items():
-        if value is None:
-            continue
-        if key == "exercises":
-            processed_exercise_ids = set()
-            new_exercises_for_workout = []
-
-            if value:
-                for exercise_payload_data in value:
-                    exercise_id = exercise_payload_data.id
-
-                    if exercise_id is not None:
-                        processed_exercise_ids.add(exercise_id)
-                        updated_we = await update_workout_exercise(
-                            workout_id=workout_id,
-                            workout_exercise_id=exercise_id,
-                            workout_exercise_data=exercise_payload_data,
-                            db=db
-                        )
-                        new_exercises_for_workout.append(updated_we)
-                    else:
-                        pass
-            
-        else:
+
+    if workout.workout_type_id is not None:
+        result = await db.execute(
+            select(WorkoutType.id).where(
+                WorkoutType.id == workout.workout_type_id,
+                WorkoutType.user_id == current_user.id
+            )
+        )
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail="Тип тренировки не найден")
+
+    await bump_data_version(db, current_user.id)
+    for key, value in workout.dict(exclude_unset=True, exclude={"exercises"}).items():
+        if value is not None:
             setattr(db_workout, key, value)
-    
+
+    if workout.exercises is not None:
+        diff = diff_workout_exercises(db_workout.exercises, workout.exercises)
+        await load_exercises(db, current_user.id, diff.exercise_ids)
+        await apply_workout_diff(db, current_user.id, db_workout.id, diff)
+        await recompute_records(db, current_user.id, diff.affected_exercise_ids)
+        await refresh_summaries(db, current_user.id, [db_workout.created_at])
+
     await db.commit()
     result = await db.execute(
-        select(Workout)
-        .options(
-            selectinload(Workout.exercises).selectinload(WorkoutExercise.sets),
-            selectinload(Workout.exercises).selectinload(WorkoutExercise.exercise),
-            selectinload(Workout.workout_type)
-        )
+        select_workout_tree()
         .where(Workout.id == db_workout.id)
+        .execution_options(populate_existing=True)
     )
     db_workout = result.scalar_one_or_none()
+    if settings.FAST_JSON_RESPONSES:
+        return fast_json_response(WorkoutResponse, db_workout)
     return db_workout
 
 @router.delete("/{workout_id}")
@@ -183,9 +291,9 @@ async def delete_workout(
     Удаляет тренировку по ID.
 
     Args:
-        workout_id (int): ID тренировки
         workout_id (int): ID тренировки для удаления
         db (AsyncSession): Асинхронная сессия базы данных
+        current_user (User): Текущий пользователь
     
     Returns:
         dict: Сообщение об успешном удалении
@@ -193,18 +301,45 @@ async def delete_workout(
     Raises:
         HTTPException: Если тренировка не найдена
     """
-    result = await db.execute(select(Workout).where(Workout.id == workout_id))
-    workout = result.scalar_one_or_none()
-    if not workout:
+    result = await db.execute(
+        select(Workout.created_at).where(
+            Workout.id == workout_id,
+            Workout.user_id == current_user.id
+        )
+    )
+    workout_created_at = result.scalar_one_or_none()
+    if workout_created_at is None:
         raise HTTPException(status_code=404, detail="Тренировка не найдена")
-    
-    await db.delete(workout)
+
+    await bump_data_version(db, current_user.id)
+    # Пакетные DELETE в порядке внешних ключей: каскад ORM загружал бы
+    # подходы каждого упражнения тренировки отдельным запросом
+    workout_exercise_ids = select(WorkoutExercise.id).where(WorkoutExercise.workout_id == workout_id)
+    await db.execute(
+        delete(WorkoutSet).where(WorkoutSet.workout_exercise_id.in_(workout_exercise_ids)),
+        execution_options={"synchronize_session": False},
+    )
+    result = await db.execute(
+        delete(WorkoutExercise)
+        .where(WorkoutExercise.workout_id == workout_id)
+        .returning(WorkoutExercise.exercise_id),
+        execution_options={"synchronize_session": False},
+    )
+    exercise_ids = set(result.scalars())
+    await db.execute(
+        delete(Workout).where(Workout.id == workout_id),
+        execution_options={"synchronize_session": False},
+    )
+    await record_deletions(db, current_user.id, "workouts", [workout_id])
+    await recompute_records(db, current_user.id, exercise_ids)
+    await refresh_summaries(db, current_user.id, [workout_created_at])
     await db.commit()
     return {"message": "Тренировка успешно удалена"} 
 
 
 @router.delete("/{workout_id}/exercises/{workout_exercise_id}")
 async def delete_workout_exercise(
+    workout_id: int,
     workout_exercise_id: int,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
@@ -213,21 +348,37 @@ async def delete_workout_exercise(
     Удаляет упражнение из тренировки по ID.
 
     Args:
+        workout_id (int): ID тренировки из пути
         workout_exercise_id (int): ID упражнения
         db (AsyncSession): Асинхронная сессия базы данных
+        current_user (User): Текущий пользователь
     
     Returns:
         dict: Сообщение об успешном удалении
     
     Raises:
-        HTTPException: Если тренировка не найдена
+        HTTPException: Если упражнение не найдено в тренировке текущего пользователя
     """
-    result = await db.execute(select(WorkoutExercise).where(WorkoutExercise.id == workout_exercise_id))
-    workout_exercise = result.scalar_one_or_none()
-    if not workout_exercise:
+    result = await db.execute(
+        select(WorkoutExercise, Workout.created_at)
+        .join(Workout, Workout.id == WorkoutExercise.workout_id)
+        .where(
+            WorkoutExercise.id == workout_exercise_id,
+            WorkoutExercise.workout_id == workout_id,
+            Workout.user_id == current_user.id
+        )
+    )
+    row = result.one_or_none()
+    if not row:
         raise HTTPException(status_code=404, detail="Упражнение не найдено")
+    workout_exercise, workout_created_at = row
     
+    await bump_data_version(db, current_user.id)
     await db.delete(workout_exercise)
+    await db.flush()
+    await record_deletions(db, current_user.id, "workout_exercises", [workout_exercise.id])
+    await recompute_records(db, current_user.id, [workout_exercise.exercise_id])
+    await refresh_summaries(db, current_user.id, [workout_created_at])
     await db.commit()
     return {"message": "Упражнение успешно удалено"} 
 
@@ -235,167 +386,110 @@ async def delete_workout_exercise(
 async def create_workout_exercise(
     workout_id: int,
     workout_exercise_data: WorkoutExerciseCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
 ):
-    db_workout_exercise = WorkoutExercise(
-        workout_id=workout_id,
-        exercise_id=workout_exercise_data.exercise_id,
-        notes=workout_exercise_data.notes
-    )
+    """
+    Добавляет упражнение с подходами в тренировку.
 
-    if workout_exercise_data.sets:
-        # Эта часть требует вашей конкретной логики для создания WorkoutSet объектов
-        # и добавления их к db_workout_exercise.sets
-        # Например:
-        # from app.models.workout_set import WorkoutSet # Убедитесь, что модель импортирована
-        # for set_create_data in workout_exercise_data.sets:
-        #     new_set = WorkoutSet(**set_create_data.dict())
-        #     # SQLAlchemy автоматически свяжет new_set с db_workout_exercise при добавлении в коллекцию,
-        #     # если cascade настроен правильно, или вы можете установить workout_exercise_id вручную
-        #     # после того, как db_workout_exercise получит ID (после flush/commit).
-        #     # Более безопасный подход - создать сеты после того, как db_workout_exercise получит ID.
-        #     db_workout_exercise.sets.append(new_set) # Если 'sets' это InstrumentedList
-        pass
-
-
-    db.add(db_workout_exercise)
-    await db.commit()
-    
-    created_id = db_workout_exercise.id 
+    Args:
+        workout_id (int): ID тренировки
+        workout_exercise_data (WorkoutExerciseCreate): Упражнение с подходами
+        db (AsyncSession): Асинхронная сессия базы данных
+        current_user (User): Текущий пользователь
 
-    stmt = (
-        select(WorkoutExercise)
-        .options(
-            selectinload(WorkoutExercise.sets),      
-            selectinload(WorkoutExercise.exercise)   
+    Returns:
+        WorkoutExercise: Созданное упражнение в тренировке
+
+    Raises:
+        HTTPException: Если тренировка или упражнение не найдены
+    """
+    result = await db.execute(
+        select(Workout.created_at).where(
+            Workout.id == workout_id,
+            Workout.user_id == current_user.id
         )
-        .where(WorkoutExercise.id == created_id)
     )
-    result = await db.execute(stmt)
-    final_workout_exercise = result.scalar_one_or_none()
-
-    if not final_workout_exercise:
-        raise HTTPException(status_code=500, detail="Не удалось получить созданное упражнение для тренировки")
+    workout_created_at = result.scalar_one_or_none()
+    if workout_created_at is None:
+        raise HTTPException(status_code=404, detail="Тренировка не найдена")
 
-    return final_workout_exercise
+    exercises = await load_exercises(db, current_user.id, [workout_exercise_data.exercise_id])
+    await bump_data_version(db, current_user.id)
+    [db_workout_exercise] = await insert_workout_exercises(
+        db, current_user.id, workout_id, [workout_exercise_data], exercises
+    )
+    # Упражнение может уже быть в тренировке, и объем тренировки по нему
+    # складывается из всех подходов - поэтому пересчет, а не merge_records
+    await recompute_records(db, current_user.id, [db_workout_exercise.exercise_id])
+    await refresh_summaries(db, current_user.id, [workout_created_at])
+    await db.commit()
+    return db_workout_exercise
 
 
 @router.put("/{workout_id}/exercises/{workout_exercise_id}", response_model=WorkoutExerciseResponse)
 async def update_workout_exercise(
-    workout_id: int, # ID тренировки из пути (для проверки принадлежности)
+    workout_id: int,
     workout_exercise_id: int,
-    workout_exercise_data: WorkoutExerciseUpdate, # Данные для обновления
-    db: AsyncSession = Depends(get_db)
+    workout_exercise_data: WorkoutExerciseUpdate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
 ):
-    # 1. Получаем существующий WorkoutExercise из базы
-    # Загружаем сразу с существующими сетами, чтобы было с чем сравнивать
+    """
+    Обновление упражнения в тренировке и его подходов.
+
+    Args:
+        workout_id (int): ID тренировки из пути
+        workout_exercise_id (int): ID упражнения в тренировке
+        workout_exercise_data (WorkoutExerciseUpdate): Данные для обновления
+        db (AsyncSession): Асинхронная сессия базы данных
+        current_user (User): Текущий пользователь
+
+    Returns:
+        WorkoutExercise: Обновленное упражнение в тренировке
+
+    Raises:
+        HTTPException: Если упражнение не найдено или не принадлежит тренировке
+    """
     stmt_get = (
-        select(WorkoutExercise)
-        .options(selectinload(WorkoutExercise.sets)) # Загружаем сеты сразу
-        .where(WorkoutExercise.id == workout_exercise_id)
+        select(WorkoutExercise, Workout.created_at)
+        .join(Workout, Workout.id == WorkoutExercise.workout_id)
+        .options(selectinload(WorkoutExercise.sets))
+        .where(
+            WorkoutExercise.id == workout_exercise_id,
+            Workout.user_id == current_user.id
+        )
     )
     result = await db.execute(stmt_get)
-    db_workout_exercise = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not db_workout_exercise:
+    if not row:
         raise HTTPException(status_code=404, detail=f"Упражнение в тренировке с ID {workout_exercise_id} не найдено")
 
-    # 1.1 Проверяем принадлежность к тренировке из пути (опционально, но рекомендуется)
+    db_workout_exercise, workout_created_at = row
     if db_workout_exercise.workout_id != workout_id:
         raise HTTPException(status_code=403, detail="Упражнение не принадлежит указанной тренировке")
 
-    # 2. Обновляем прямые атрибуты WorkoutExercise
-    update_data_dict = workout_exercise_data.dict(exclude_unset=True)
-
-    if 'exercise_id' in update_data_dict:
-        db_workout_exercise.exercise_id = update_data_dict['exercise_id']
-    if 'notes' in update_data_dict:
-        db_workout_exercise.notes = update_data_dict['notes']
-
-    # 3. Обновляем сеты (sets)
-    if workout_exercise_data.sets is not None:
-        current_db_sets_map = {s.id: s for s in db_workout_exercise.sets}
-        input_set_ids_processed = set()
-
-        new_sets_for_workout_exercise = []
-
-        for set_data_from_input in workout_exercise_data.sets:
-            input_set_id = set_data_from_input.id
-
-            if input_set_id is not None:
-                input_set_ids_processed.add(input_set_id)
-                if input_set_id in current_db_sets_map:
-                    # Обновляем существующий сет
-                    db_set_to_update = current_db_sets_map[input_set_id]
-                    if set_data_from_input.weight is not None:
-                        db_set_to_update.weight = set_data_from_input.weight
-                    if set_data_from_input.reps is not None:
-                        db_set_to_update.reps = set_data_from_input.reps
-                    if set_data_from_input.set_number is not None:
-                        db_set_to_update.set_number = set_data_from_input.set_number
-                    # Если set_number не пришел, он не обновляется
-                    new_sets_for_workout_exercise.append(db_set_to_update)
-                else:
-                    # Сет с таким ID пришел в запросе, но его нет в базе у этого WorkoutExercise
-                    # Пропускаем или выбрасываем ошибку, как обсуждалось ранее
-                    pass 
-            else:
-                # Создаем новый сет (ID не указан)
-                if set_data_from_input.set_number is None:
-                    # Если set_number не предоставлен для нового сета, это ошибка, так как он NOT NULL
-                    # Можно автоматически присвоить следующий номер, если есть такая логика,
-                    # или требовать от клиента.
-                    # Для примера, выбросим ошибку, если не передан для нового сета.
-                    raise HTTPException(status_code=422, detail=f"Поле 'set_number' обязательно для новых подходов (сетов). Входные данные для сета: {set_data_from_input.dict()}")
-                
-                new_db_set = WorkoutSet(
-                    workout_exercise_id=db_workout_exercise.id,
-                    weight=set_data_from_input.weight if set_data_from_input.weight is not None else 0, # Пример значения по умолчанию, если weight тоже может быть None
-                    reps=set_data_from_input.reps if set_data_from_input.reps is not None else 0, # Пример значения по умолчанию
-                    set_number=set_data_from_input.set_number # Здесь он уже не None из-за проверки выше
-                )
-                new_sets_for_workout_exercise.append(new_db_set)
-
-        # Удаляем сеты, которые были в базе, но не пришли в запросе (по ID)
-        # Это эффективно, если db_workout_exercise.sets это InstrumentedList и настроен cascade="all, delete-orphan"
-        # В этом случае, простое присвоение новой коллекции удалит старые "осиротевшие" объекты.
-        # db_workout_exercise.sets = new_sets_for_workout_exercise
-
-        # Более явный способ удаления, если нет уверенности в каскадах для orphan removal при простом присвоении:
-        sets_to_delete = []
-        for existing_set_id, existing_set_obj in current_db_sets_map.items():
-            if existing_set_id not in input_set_ids_processed:
-                sets_to_delete.append(existing_set_obj)
-        
-        for set_to_del in sets_to_delete:
-            await db.delete(set_to_del)
-        
-        # Обновляем коллекцию. SQLAlchemy отследит изменения.
-        # Если new_sets_for_workout_exercise содержит объекты, которые уже были в сессии (обновленные),
-        # и новые объекты (еще не добавленные явно в сессию через db.add()),
-        # присвоение коллекции должно сработать.
-        # Новые объекты, добавленные в коллекцию, будут автоматически добавлены в сессию при flush/commit.
-        db_workout_exercise.sets = new_sets_for_workout_exercise
-
-
+    diff = diff_workout_exercises(
+        [db_workout_exercise],
+        [workout_exercise_data.model_copy(update={"id": workout_exercise_id})],
+        delete_missing=False,
+    )
+    await load_exercises(db, current_user.id, diff.exercise_ids)
+    await bump_data_version(db, current_user.id)
+    await apply_workout_diff(db, current_user.id, workout_id, diff)
+    await recompute_records(db, current_user.id, diff.affected_exercise_ids)
+    await refresh_summaries(db, current_user.id, [workout_created_at])
     await db.commit()
 
-    # 4. Получаем обновленный объект со всеми связями для ответа
-    # Это гарантирует, что все изменения, включая ID новых сетов, отразятся.
     stmt_final_select = (
         select(WorkoutExercise)
         .options(
             selectinload(WorkoutExercise.sets),
             selectinload(WorkoutExercise.exercise)
-            # selectinload(WorkoutExercise.workout) # Если workout нужен в ответе
         )
-        .where(WorkoutExercise.id == db_workout_exercise.id)
+        .where(WorkoutExercise.id == workout_exercise_id)
+        .execution_options(populate_existing=True)
     )
     result_final = await db.execute(stmt_final_select)
-    updated_workout_exercise = result_final.scalar_one_or_none()
-    
-    if not updated_workout_exercise:
-        # Этого не должно произойти, если commit прошел успешно
-        raise HTTPException(status_code=500, detail="Не удалось получить обновленное упражнение для тренировки после сохранения")
-
-    return updated_workout_exercise
\ No newline at end of file
+    return result_final.scalar_one()
\ No newline at end of file
@@ -1,12 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from typing import Optional
 
+from app.core.config import settings
+from app.core.pagination import finish_page, keyset_page
+from app.core.conditional import read_data_version
+from app.core.response_cache import ResponseCache, get_response_cache
+from app.core.serialization import json_response
 from app.database.session import get_db
 from app.models.workout_type import WorkoutType
 from app.schemas import WorkoutTypeCreate, WorkoutTypeResponse, WorkoutTypeBase
 from app.models.user import User
 from app.core.deps import get_current_active_user
+from app.services.data_version import bump_data_version
+from app.services.sync import record_deletions
 
 router = APIRouter(
     tags=["workout types"],
@@ -31,6 +39,7 @@ async def create_workout_type(
             detail="Тип тренировки с таким именем уже существует"
         )
 
+    await bump_data_version(db, current_user.id)
     # Создаем новый тип тренировки
     db_workout_type = WorkoutType(
         name=workout_type.name,
@@ -51,19 +60,40 @@ async def create_workout_type(
 
 @router.get("/", response_model=list[WorkoutTypeResponse])
 async def get_workout_types(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    cache: Optional[ResponseCache] = Depends(get_response_cache),
+    version: int = Depends(read_data_version),
 ):
-    """Получение списка типов тренировок."""
-    stmt = select(WorkoutType).where(
-        WorkoutType.user_id == current_user.id
-    ).offset(skip).limit(limit)
+    """
+    Получение списка типов тренировок.
+
+    Если передан cursor, используется курсорная пагинация и skip игнорируется.
+    Курсор следующей страницы возвращается в заголовке X-Next-Cursor.
+    """
+    if cache is not None:
+        cache_key = cache.key(
+            current_user.id, version, "workout_types",
+            skip=skip, limit=limit, cursor=cursor,
+        )
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    stmt = keyset_page(
+        select(WorkoutType).where(WorkoutType.user_id == current_user.id),
+        WorkoutType.created_at, WorkoutType.id, cursor, limit,
+    )
+    if cursor is None:
+        stmt = stmt.offset(skip)
     result = await db.execute(stmt)
-    workout_types = result.scalars().all()
+    workout_types = finish_page(result.scalars().all(), limit, response)
     
-    return [
+    items = [
         WorkoutTypeResponse(
             id=wt.id,
             name=wt.name,
@@ -72,8 +102,15 @@ async def get_workout_types(
             icon_url=wt.icon_url
         ) for wt in workout_types
     ]
+    if cache is not None:
+        return await cache.store(cache_key, json_response(list[WorkoutTypeResponse], items, response))
+    return items
 
-@router.get("/{workout_type_id}", response_model=WorkoutTypeResponse)
+@router.get(
+    "/{workout_type_id}",
+    response_model=WorkoutTypeResponse,
+    dependencies=[Depends(read_data_version)],
+)
 async def get_workout_type(
     workout_type_id: int,
     db: AsyncSession = Depends(get_db),
@@ -138,6 +175,7 @@ async def update_workout_type(
             )
     
     # Обновляем поля
+    await bump_data_version(db, current_user.id)
     for field, value in workout_type_in.dict(exclude_unset=True).items():
         setattr(workout_type, field, value)
     
@@ -174,7 +212,9 @@ async def delete_workout_type(
         )
     
     # Удаляем тип тренировки
+    await bump_data_version(db, current_user.id)
     await db.delete(workout_type)
+    await record_deletions(db, current_user.id, "workout_types", [workout_type_id])
     await db.commit()
     
     return {"message": "Тип тренировки успешно удален"} 
\ No newline at end of file
@@ -1,6 +1,6 @@
 from app.schemas.workout import WorkoutBase, WorkoutCreate, WorkoutResponse
 from app.schemas.workout_type import WorkoutTypeBase, WorkoutTypeCreate, WorkoutTypeResponse
-from app.schemas.exercise import ExerciseBase, ExerciseCreate, ExerciseResponse, ExerciseUpdate
+from app.schemas.exercise import ExerciseBase, ExerciseCreate, ExerciseResponse, ExerciseSuggestion, ExerciseUpdate, MuscleGroupCount
 from app.schemas.user import UserBase, UserCreate, UserResponse, UserUpdate
 from app.schemas.token import Token, TokenData
 
@@ -14,7 +14,9 @@ __all__ = [
     "ExerciseBase",
     "ExerciseCreate",
     "ExerciseResponse",
+    "ExerciseSuggestion",
     "ExerciseUpdate",
+    "MuscleGroupCount",
     "UserBase",
     "UserCreate",
     "UserUpdate",
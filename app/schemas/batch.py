@@ -0,0 +1,51 @@
+from typing import Any, Optional
+from pydantic import BaseModel, Field
+from app.core.config import settings
+
+class BatchOperation(BaseModel):
+    """
+    Операция пакета - вызов изменяющего маршрута API.
+
+    Атрибуты:
+        method (str): POST, PUT, PATCH или DELETE
+        path (str): Путь маршрута без /api/v1, например /workouts/1/exercises
+        body (Any, опционально): Тело запроса маршрута
+    """
+    method: str = Field(pattern="^(POST|PUT|PATCH|DELETE)$")
+    path: str
+    body: Optional[Any] = None
+
+class BatchRequest(BaseModel):
+    """
+    Пакет операций.
+
+    Атрибуты:
+        operations (list[BatchOperation]): Операции в порядке выполнения
+        atomic (bool): Откатить весь пакет при первой ошибке; иначе
+            откатывается только ошибочная операция
+    """
+    operations: list[BatchOperation] = Field(min_length=1, max_length=settings.BATCH_MAX_OPERATIONS)
+    atomic: bool = True
+
+class BatchResult(BaseModel):
+    """
+    Результат операции.
+
+    Атрибуты:
+        status (int): HTTP-код, который вернул бы маршрут
+        body (Any): Тело ответа маршрута или описание ошибки
+    """
+    status: int
+    body: Any = None
+
+class BatchResponse(BaseModel):
+    """
+    Результаты пакета.
+
+    Атрибуты:
+        results (list[BatchResult]): Результаты выполненных операций по порядку;
+            в атомарном пакете список заканчивается первой ошибкой
+        committed (bool): Зафиксированы ли изменения
+    """
+    results: list[BatchResult]
+    committed: bool
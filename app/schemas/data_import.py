@@ -0,0 +1,35 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+class ImportResult(BaseModel):
+    """
+    Итоги импорта истории тренировок.
+
+    Атрибуты:
+        workouts (int): Загружено тренировок
+        exercises (int): Загружено упражнений в тренировках
+        sets (int): Загружено подходов
+        batches (int): Количество пачек COPY
+        created_exercises (list[str]): Упражнения, добавленные в каталог
+        created_workout_types (list[str]): Типы тренировок, добавленные в каталог
+        elapsed_ms (float): Время импорта в миллисекундах
+    """
+    workouts: int
+    exercises: int
+    sets: int
+    batches: int
+    created_exercises: list[str]
+    created_workout_types: list[str]
+    elapsed_ms: float
+
+class ImportStatus(ImportResult):
+    """
+    Ход последнего импорта пользователя.
+
+    Атрибуты:
+        state (str): running, done или failed
+        error (str, опционально): Причина ошибки для failed
+    """
+    state: str
+    error: Optional[str] = None
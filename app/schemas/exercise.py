@@ -42,4 +42,25 @@ class ExerciseResponse(ExerciseBase):
     user_id: int
 
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+class ExerciseSuggestion(BaseModel):
+    """
+    Подсказка автодополнения.
+
+    Атрибуты:
+        id (int): ID упражнения
+        name (str): Название упражнения
+    """
+    id: int
+    name: str
+
+class MuscleGroupCount(BaseModel):
+    """
+    Количество упражнений с группой мышц.
+
+    Атрибуты:
+        muscle_group (str): Группа мышц
+        exercises (int): Количество упражнений
+    """
+    muscle_group: str
+    exercises: int
@@ -0,0 +1,20 @@
+from datetime import datetime
+from pydantic import computed_field
+
+from app.core.pagination import encode_cursor
+from app.schemas.workout import WorkoutResponse
+
+class WorkoutExport(WorkoutResponse):
+    """
+    Схема тренировки в выгрузке истории.
+
+    Атрибуты:
+        created_at (datetime): Дата и время создания тренировки
+        cursor (str): Курсор для продолжения выгрузки после этой тренировки
+    """
+    created_at: datetime
+
+    @computed_field
+    @property
+    def cursor(self) -> str:
+        return encode_cursor(self.created_at, self.id)
@@ -0,0 +1,38 @@
+from typing import Optional
+from pydantic import BaseModel
+
+class ExerciseProgress(BaseModel):
+    """
+    Ряды прогресса в упражнении по тренировкам.
+
+    Ряды выровнены по dates: i-е значение каждого ряда относится
+    к i-й тренировке.
+
+    Атрибуты:
+        sessions (int): Количество тренировок
+        window (int): Окно скользящих средних в тренировках
+        dates (list[str]): Время тренировок (ISO 8601)
+        tonnage (list[float]): Тоннаж (сумма вес x повторения)
+        e1rm_epley (list[float]): Лучший e1RM по формуле Эпли
+        e1rm_brzycki (list[float, опционально]): Лучший e1RM по формуле Бжицки
+        top_weight (list[float]): Максимальный вес
+        average_load (list[float]): Средний вес на повторение
+        intensity (list[float]): Максимальный вес относительно лучшего e1RM на эту дату
+        tonnage_rolling (list[float]): Скользящее среднее тоннажа
+        e1rm_rolling (list[float]): Скользящее среднее e1RM (Эпли)
+        tonnage_trend (float, опционально): Наклон тренда тоннажа за неделю
+        e1rm_trend (float, опционально): Наклон тренда e1RM за неделю
+    """
+    sessions: int
+    window: int
+    dates: list[str]
+    tonnage: list[float]
+    e1rm_epley: list[float]
+    e1rm_brzycki: list[Optional[float]]
+    top_weight: list[float]
+    average_load: list[float]
+    intensity: list[float]
+    tonnage_rolling: list[float]
+    e1rm_rolling: list[float]
+    tonnage_trend: Optional[float] = None
+    e1rm_trend: Optional[float] = None
@@ -0,0 +1,45 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+class RepRecordResponse(BaseModel):
+    """
+    Лучшее количество повторений с весом.
+
+    Атрибуты:
+        weight (int): Вес в килограммах
+        reps (int): Максимум повторений
+    """
+    weight: int
+    reps: int
+
+    class Config:
+        from_attributes = True
+
+class PersonalRecordResponse(BaseModel):
+    """
+    Личные рекорды в упражнении.
+
+    Атрибуты:
+        exercise_id (int): ID упражнения
+        max_weight (int): Максимальный вес в подходе
+        best_e1rm (float): Лучший расчетный разовый максимум
+        best_volume (int): Лучший объем за тренировку
+        updated_at (datetime): Время последнего изменения
+    """
+    exercise_id: int
+    max_weight: int
+    best_e1rm: float
+    best_volume: int
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class PersonalRecordDetail(PersonalRecordResponse):
+    """
+    Личные рекорды в упражнении с рекордами повторений по весам.
+
+    Атрибуты:
+        rep_records (list[RepRecordResponse]): Рекорды повторений по возрастанию веса
+    """
+    rep_records: list[RepRecordResponse]
@@ -0,0 +1,24 @@
+from datetime import date
+from pydantic import BaseModel
+
+class TrainingSummaryResponse(BaseModel):
+    """
+    Сводка за период по группе мышц.
+
+    Атрибуты:
+        period_start (date): Первый день недели или месяца
+        muscle_group (str): Группа мышц
+        volume (int): Объем (сумма вес x повторения)
+        sets (int): Количество подходов
+        reps (int): Количество повторений
+        workouts (int): Количество тренировок
+    """
+    period_start: date
+    muscle_group: str
+    volume: int
+    sets: int
+    reps: int
+    workouts: int
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,94 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+class SyncRow(BaseModel):
+    """
+    Общие поля строки ленты изменений.
+
+    Атрибуты:
+        id (int): ID записи
+        updated_at (datetime): Время последнего изменения
+        sync_version (int): Версия последнего изменения
+    """
+    id: int
+    updated_at: datetime
+    sync_version: int
+
+    class Config:
+        from_attributes = True
+
+class SyncWorkoutType(SyncRow):
+    """Измененный тип тренировки."""
+    name: str
+    description: Optional[str] = None
+    icon_url: Optional[str] = None
+    created_at: datetime
+
+class SyncExercise(SyncRow):
+    """Измененное упражнение каталога."""
+    name: str
+    description: Optional[str] = None
+    muscle_groups: Optional[list[str]] = None
+    created_at: datetime
+
+class SyncWorkout(SyncRow):
+    """Измененная тренировка без вложенных упражнений."""
+    name: str
+    description: Optional[str] = None
+    workout_type_id: int
+    created_at: datetime
+
+class SyncWorkoutExercise(SyncRow):
+    """Измененное упражнение в тренировке без вложенных подходов."""
+    workout_id: int
+    exercise_id: int
+    notes: Optional[str] = None
+
+class SyncWorkoutSet(SyncRow):
+    """Измененный подход."""
+    workout_exercise_id: int
+    set_number: int
+    weight: int
+    reps: int
+
+class SyncDeletion(BaseModel):
+    """
+    Удаленная запись.
+
+    Атрибуты:
+        entity (str): Имя таблицы
+        entity_id (int): ID записи
+        sync_version (int): Версия удаления
+        deleted_at (datetime): Время удаления
+    """
+    entity: str
+    entity_id: int
+    sync_version: int
+    deleted_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class SyncChanges(BaseModel):
+    """
+    Страница ленты изменений.
+
+    Атрибуты:
+        workout_types (list[SyncWorkoutType]): Измененные типы тренировок
+        exercises (list[SyncExercise]): Измененные упражнения
+        workouts (list[SyncWorkout]): Измененные тренировки
+        workout_exercises (list[SyncWorkoutExercise]): Измененные упражнения в тренировках
+        workout_sets (list[SyncWorkoutSet]): Измененные подходы
+        deleted (list[SyncDeletion]): Удаленные записи
+        next_token (str): Токен для следующего запроса
+        has_more (bool): Есть ли еще изменения после этой страницы
+    """
+    workout_types: list[SyncWorkoutType]
+    exercises: list[SyncExercise]
+    workouts: list[SyncWorkout]
+    workout_exercises: list[SyncWorkoutExercise]
+    workout_sets: list[SyncWorkoutSet]
+    deleted: list[SyncDeletion]
+    next_token: str
+    has_more: bool
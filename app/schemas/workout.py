@@ -1,7 +1,7 @@
 from typing import Optional
 from pydantic import BaseModel
 
-from app.schemas.workout_exercise import WorkoutExercise, WorkoutExerciseUpdate
+from app.schemas.workout_exercise import WorkoutExercise, WorkoutExerciseCreate, WorkoutExerciseUpdate
 from app.schemas.workout_type import WorkoutTypeResponse
 
 class WorkoutBase(BaseModel):
@@ -19,8 +19,14 @@ class WorkoutBase(BaseModel):
     exercises: list[WorkoutExercise] = []
 
 class WorkoutCreate(WorkoutBase):
-    """Схема для создания тренировки."""
-    pass
+    """
+    Схема для создания тренировки.
+
+    Атрибуты:
+        exercises (list[WorkoutExerciseCreate]): Упражнения с подходами,
+            создаваемые вместе с тренировкой
+    """
+    exercises: list[WorkoutExerciseCreate] = []
 
 class WorkoutUpdate(WorkoutBase):
     """Схема для обновления тренировки."""
@@ -21,7 +21,14 @@ class WorkoutExerciseCreate(WorkoutExerciseBase):
     pass
 
 class WorkoutExerciseUpdate(WorkoutExerciseBase):
-    """Схема для обновления упражнения в тренировке."""
+    """
+    Схема для обновления упражнения в тренировке.
+
+    Атрибуты:
+        id (int, опционально): ID существующего упражнения в тренировке;
+            без ID упражнение будет создано
+    """
+    id: Optional[int] = None
     exercise_id: Optional[int] = None
     sets: Optional[List[WorkoutSetUpdate]] = Field(default_factory=list)
 
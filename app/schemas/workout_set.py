@@ -1,5 +1,8 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+
+# Значения подхода хранятся в колонках INTEGER: вне диапазона запись упадет в БД
+SetValue = Annotated[int, Field(ge=0, le=2_147_483_647)]
 
 class WorkoutSetBase(BaseModel):
     """
@@ -15,15 +18,17 @@ class WorkoutSetBase(BaseModel):
     reps: int
 
 class WorkoutSetCreate(WorkoutSetBase):
-    """Схема для создания подхода."""
-    pass
+    """Схема для создания подхода с проверкой диапазона значений."""
+    set_number: SetValue
+    weight: SetValue
+    reps: SetValue
 
 class WorkoutSetUpdate(BaseModel):
     """Схема для обновления подхода, включая его ID. Все поля опциональны."""
     id: Optional[int] = None       # ID существующего подхода для обновления
-    set_number: Optional[int] = None
-    weight: Optional[int] = None
-    reps: Optional[int] = None
+    set_number: Optional[SetValue] = None
+    weight: Optional[SetValue] = None
+    reps: Optional[SetValue] = None
     # Если есть другие поля в WorkoutSetBase, которые могут обновляться, добавьте их сюда как Optional
 
 class WorkoutSet(WorkoutSetBase):
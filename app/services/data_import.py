@@ -0,0 +1,429 @@
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import IO, Any, Iterator, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+from app.models.exercise import Exercise
+from app.models.workout_type import WorkoutType
+from app.schemas.workout_set import WorkoutSetCreate
+from app.services.records import merge_records
+from app.services.summaries import refresh_summaries
+
+logger = get_logger(__name__)
+
+# Ход последнего импорта каждого пользователя в этом процессе
+import_progress: dict[int, dict[str, Any]] = {}
+
+# Тренировок в одной порции разбора, выполняемой в пуле потоков
+PARSE_CHUNK_SIZE = 500
+
+class ImportFormatError(ValueError):
+    """Ошибка формата загружаемого файла с указанием строки."""
+
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(f"Строка {line}: {message}")
+        self.line = line
+
+@dataclass
+class ImportedExercise:
+    """
+    Упражнение импортируемой тренировки.
+
+    Атрибуты:
+        name (str): Название упражнения из каталога пользователя
+        notes (str, опционально): Заметки
+        sets (list[tuple[int, int, int]]): Подходы (номер, вес, повторения)
+    """
+    name: str
+    notes: Optional[str] = None
+    sets: list[tuple[int, int, int]] = field(default_factory=list)
+
+@dataclass
+class ImportedWorkout:
+    """
+    Импортируемая тренировка.
+
+    Атрибуты:
+        name (str): Название тренировки
+        workout_type (str): Название типа тренировки
+        created_at (datetime): Дата и время тренировки
+        description (str, опционально): Описание
+        exercises (list[ImportedExercise]): Упражнения с подходами
+    """
+    name: str
+    workout_type: str
+    created_at: datetime
+    description: Optional[str] = None
+    exercises: list[ImportedExercise] = field(default_factory=list)
+
+def _required(value: Any, line: int, name: str) -> str:
+    if value is None or str(value).strip() == "":
+        raise ImportFormatError(line, f"не заполнено поле '{name}'")
+    return str(value).strip()
+
+def _integer(value: Any, line: int, name: str) -> int:
+    try:
+        return int(_required(value, line, name))
+    except ValueError:
+        raise ImportFormatError(line, f"поле '{name}' должно быть целым числом")
+
+def _set(line: int, set_number: Any, weight: Any, reps: Any) -> tuple[int, int, int]:
+    values = {
+        "set_number": _integer(set_number, line, "set_number"),
+        "weight": _integer(weight, line, "weight"),
+        "reps": _integer(reps, line, "reps"),
+    }
+    # Та же проверка, что при создании подхода через API: COPY не должен
+    # получить значение, которое отвергнет колонка INTEGER
+    try:
+        WorkoutSetCreate(**values)
+    except ValidationError as e:
+        name = e.errors()[0]["loc"][0]
+        raise ImportFormatError(line, f"поле '{name}' вне допустимого диапазона")
+    return values["set_number"], values["weight"], values["reps"]
+
+def _timestamp(value: Any, line: int) -> datetime:
+    if value is None or value == "":
+        return datetime.utcnow()
+    try:
+        created_at = datetime.fromisoformat(str(value))
+    except ValueError:
+        raise ImportFormatError(line, "поле 'created_at' должно быть датой в формате ISO 8601")
+    # Колонки created_at хранят UTC без часового пояса
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return created_at
+
+def _name(value: Any) -> Any:
+    # Формат выгрузки хранит связанные записи объектами: {"name": ...}
+    return value.get("name") if isinstance(value, dict) else value
+
+def parse_ndjson(stream: IO[str]) -> Iterator[ImportedWorkout]:
+    """
+    Разбор NDJSON: одна тренировка на строку, формат совпадает с выгрузкой.
+
+    Args:
+        stream (IO[str]): Текстовый поток
+
+    Yields:
+        ImportedWorkout: Очередная тренировка
+
+    Raises:
+        ImportFormatError: Если строка не является корректной тренировкой
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            raise ImportFormatError(line_number, "некорректный JSON")
+        if not isinstance(record, dict):
+            raise ImportFormatError(line_number, "ожидается объект тренировки")
+
+        workout = ImportedWorkout(
+            name=_required(record.get("name"), line_number, "name"),
+            workout_type=_required(_name(record.get("workout_type")), line_number, "workout_type"),
+            created_at=_timestamp(record.get("created_at"), line_number),
+            description=record.get("description"),
+        )
+        for exercise_record in record.get("exercises") or []:
+            exercise = ImportedExercise(
+                name=_required(
+                    _name(exercise_record.get("exercise")) or exercise_record.get("exercise_name"),
+                    line_number,
+                    "exercise",
+                ),
+                notes=exercise_record.get("notes"),
+            )
+            for set_record in exercise_record.get("sets") or []:
+                exercise.sets.append(_set(
+                    line_number,
+                    set_record.get("set_number"),
+                    set_record.get("weight"),
+                    set_record.get("reps"),
+                ))
+            workout.exercises.append(exercise)
+        yield workout
+
+def parse_csv(stream: IO[str]) -> Iterator[ImportedWorkout]:
+    """
+    Разбор CSV в формате выгрузки: одна строка на подход.
+
+    Строки одной тренировки идут подряд и группируются по workout_id, а без
+    этой колонки - по паре (workout_name, created_at). Подходы подряд идущих
+    строк с тем же exercise_name относятся к одному упражнению, пока номер
+    подхода возрастает.
+
+    Args:
+        stream (IO[str]): Текстовый поток
+
+    Yields:
+        ImportedWorkout: Очередная тренировка
+
+    Raises:
+        ImportFormatError: Если в строке нет обязательных полей
+    """
+    reader = csv.DictReader(stream)
+    workout: Optional[ImportedWorkout] = None
+    workout_key: Any = None
+    for row in reader:
+        line_number = reader.line_num
+        key = row.get("workout_id") or (row.get("workout_name"), row.get("created_at"))
+        if workout is None or key != workout_key:
+            if workout is not None:
+                yield workout
+            workout_key = key
+            workout = ImportedWorkout(
+                name=_required(row.get("workout_name"), line_number, "workout_name"),
+                workout_type=_required(row.get("workout_type"), line_number, "workout_type"),
+                created_at=_timestamp(row.get("created_at"), line_number),
+                description=row.get("workout_description") or None,
+            )
+
+        exercise_name = (row.get("exercise_name") or "").strip()
+        if not exercise_name:
+            continue
+        has_set = bool(row.get("set_number"))
+        last = workout.exercises[-1] if workout.exercises else None
+        set_number = _integer(row["set_number"], line_number, "set_number") if has_set else None
+        if (
+            last is None
+            or last.name != exercise_name
+            or not has_set
+            or not last.sets
+            or set_number <= last.sets[-1][0]
+        ):
+            last = ImportedExercise(name=exercise_name, notes=row.get("notes") or None)
+            workout.exercises.append(last)
+        if has_set:
+            last.sets.append(_set(line_number, set_number, row.get("weight"), row.get("reps")))
+    if workout is not None:
+        yield workout
+
+PARSERS = {
+    "csv": parse_csv,
+    "ndjson": parse_ndjson,
+}
+
+class WorkoutImporter:
+    """
+    Пакетная загрузка тренировок пользователя через COPY.
+
+    Тренировки накапливаются в буфере и записываются пачками: ID для
+    workouts, workout_exercises и workout_sets выделяются заранее из
+    последовательностей, после чего каждая таблица заполняется одним
+    COPY (asyncpg copy_records_to_table). Названия упражнений и типов
+    тренировок сопоставляются с ID по словарю в памяти; отсутствующие
+    в каталоге записи создаются. Личные рекорды обновляются после
+    каждой пачки, сводки по периодам - один раз в finish за весь
+    диапазон дат импорта. Транзакцию фиксирует вызывающий код. Ход
+    импорта после каждой пачки публикуется в import_progress.
+
+    Атрибуты:
+        workouts (int): Загружено тренировок
+        exercises (int): Загружено упражнений в тренировках
+        sets (int): Загружено подходов
+        batches (int): Записано пачек
+        created_exercises (list[str]): Упражнения, добавленные в каталог
+        created_workout_types (list[str]): Типы тренировок, добавленные в каталог
+    """
+
+    def __init__(self, session: AsyncSession, user_id: int, batch_size: int) -> None:
+        self.session = session
+        self.user_id = user_id
+        self.batch_size = batch_size
+        self._buffer: list[ImportedWorkout] = []
+        self._buffered_rows = 0
+        self._exercise_ids: dict[str, int] = {}
+        self._workout_type_ids: dict[str, int] = {}
+        self._started = time.perf_counter()
+        self.workouts = 0
+        self.exercises = 0
+        self.sets = 0
+        self.batches = 0
+        self.created_exercises: list[str] = []
+        self.created_workout_types: list[str] = []
+        self._created_at_bounds: list[datetime] = []
+        self.publish("running")
+
+    async def load_catalog(self) -> None:
+        """Загрузка словарей название -> ID упражнений и типов тренировок."""
+        result = await self.session.execute(
+            select(Exercise.name, func.min(Exercise.id))
+            .where(Exercise.user_id == self.user_id)
+            .group_by(Exercise.name)
+        )
+        self._exercise_ids = dict(result.all())
+        result = await self.session.execute(
+            select(WorkoutType.name, func.min(WorkoutType.id))
+            .where(WorkoutType.user_id == self.user_id)
+            .group_by(WorkoutType.name)
+        )
+        self._workout_type_ids = dict(result.all())
+
+    async def add(self, workout: ImportedWorkout) -> None:
+        """
+        Добавление тренировки в буфер; полный буфер записывается в БД.
+
+        Args:
+            workout (ImportedWorkout): Тренировка
+        """
+        self._buffer.append(workout)
+        self._buffered_rows += 1 + sum(1 + len(exercise.sets) for exercise in workout.exercises)
+        if self._buffered_rows >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Запись накопленных тренировок в БД."""
+        if not self._buffer:
+            return
+        workouts, self._buffer, self._buffered_rows = self._buffer, [], 0
+        dates = [workout.created_at for workout in workouts] + self._created_at_bounds
+        self._created_at_bounds = [min(dates), max(dates)]
+
+        await self._create_missing(
+            Exercise, self._exercise_ids, self.created_exercises,
+            {exercise.name for workout in workouts for exercise in workout.exercises},
+        )
+        await self._create_missing(
+            WorkoutType, self._workout_type_ids, self.created_workout_types,
+            {workout.workout_type for workout in workouts},
+        )
+
+        exercises_count = sum(len(workout.exercises) for workout in workouts)
+        sets_count = sum(len(exercise.sets) for workout in workouts for exercise in workout.exercises)
+        workout_ids = iter(await self._allocate_ids("workouts", len(workouts)))
+        exercise_ids = iter(await self._allocate_ids("workout_exercises", exercises_count))
+        set_ids = iter(await self._allocate_ids("workout_sets", sets_count))
+
+        # COPY не применяет значения по умолчанию на стороне Python
+        updated_at = datetime.utcnow()
+        workout_records = []
+        exercise_records = []
+        set_records = []
+        samples = []
+        for workout in workouts:
+            workout_id = next(workout_ids)
+            workout_records.append((
+                workout_id,
+                workout.name,
+                workout.description,
+                self._workout_type_ids[workout.workout_type],
+                self.user_id,
+                workout.created_at,
+                updated_at,
+            ))
+            for exercise in workout.exercises:
+                workout_exercise_id = next(exercise_ids)
+                exercise_id = self._exercise_ids[exercise.name]
+                exercise_records.append((
+                    workout_exercise_id, workout_id, self.user_id, exercise_id, exercise.notes, updated_at
+                ))
+                for set_number, weight, reps in exercise.sets:
+                    set_records.append((
+                        next(set_ids), workout_exercise_id, self.user_id, set_number, weight, reps, updated_at
+                    ))
+                    samples.append((workout_id, exercise_id, weight, reps))
+
+        await self._copy(
+            "workouts",
+            ("id", "name", "description", "workout_type_id", "user_id", "created_at", "updated_at"),
+            workout_records,
+        )
+        await self._copy(
+            "workout_exercises",
+            ("id", "workout_id", "user_id", "exercise_id", "notes", "updated_at"),
+            exercise_records,
+        )
+        await self._copy(
+            "workout_sets",
+            ("id", "workout_exercise_id", "user_id", "set_number", "weight", "reps", "updated_at"),
+            set_records,
+        )
+        await merge_records(self.session, self.user_id, samples)
+
+        self.workouts += len(workout_records)
+        self.exercises += len(exercise_records)
+        self.sets += len(set_records)
+        self.batches += 1
+        logger.info(
+            "Import user=%s batch=%s workouts=%s exercises=%s sets=%s elapsed=%.2fs",
+            self.user_id, self.batches, self.workouts, self.exercises, self.sets,
+            time.perf_counter() - self._started,
+        )
+        self.publish("running")
+
+    async def finish(self) -> None:
+        """Запись остатка буфера и пересчет сводок за период импорта."""
+        await self.flush()
+        await refresh_summaries(self.session, self.user_id, self._created_at_bounds)
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Итоги импорта.
+
+        Returns:
+            dict[str, Any]: Количество записей, пачек и созданных элементов каталога
+        """
+        return {
+            "workouts": self.workouts,
+            "exercises": self.exercises,
+            "sets": self.sets,
+            "batches": self.batches,
+            "created_exercises": self.created_exercises,
+            "created_workout_types": self.created_workout_types,
+            "elapsed_ms": round((time.perf_counter() - self._started) * 1000, 1),
+        }
+
+    def publish(self, state: str, error: Optional[str] = None) -> None:
+        """
+        Публикация хода импорта пользователя в import_progress.
+
+        Args:
+            state (str): running, done или failed
+            error (str, опционально): Причина ошибки для failed
+        """
+        import_progress[self.user_id] = {**self.summary(), "state": state, "error": error}
+
+    async def _create_missing(
+        self, model: Any, ids: dict[str, int], created: list[str], names: set[str]
+    ) -> None:
+        missing = sorted(names - ids.keys())
+        if not missing:
+            return
+        values = [{"name": name, "user_id": self.user_id} for name in missing]
+        if model is Exercise:
+            for value in values:
+                value["muscle_groups"] = []
+        result = await self.session.execute(
+            insert(model).returning(model.name, model.id),
+            values,
+        )
+        ids.update(result.tuples().all())
+        created.extend(missing)
+
+    async def _allocate_ids(self, table: str, count: int) -> list[int]:
+        if not count:
+            return []
+        result = await self.session.execute(
+            text("SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM generate_series(1, :count)"),
+            {"table": table, "count": count},
+        )
+        return list(result.scalars())
+
+    async def _copy(self, table: str, columns: tuple[str, ...], records: list[tuple]) -> None:
+        if not records:
+            return
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table, records=records, columns=columns
+        )
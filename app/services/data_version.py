@@ -0,0 +1,39 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+
+async def bump_data_version(db: AsyncSession, user_id: int) -> None:
+    """
+    Увеличение версии данных пользователя.
+
+    Вызывается изменяющими маршрутами до первой записи в транзакции: новая
+    версия становится видна вместе с изменениями, а ответы, закэшированные
+    со старой версией, больше не используются. Блокировка строки
+    пользователя упорядочивает параллельные записи одного пользователя,
+    поэтому версии ленты синхронизации (sync_version_seq), выделенные
+    после нее, растут в порядке фиксации его транзакций.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID пользователя
+    """
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(data_version=User.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+async def get_data_version(db: AsyncSession, user_id: int) -> int:
+    """
+    Текущая версия данных пользователя (чтение по первичному ключу).
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID пользователя
+
+    Returns:
+        int: Версия данных
+    """
+    return await db.scalar(select(User.data_version).where(User.id == user_id))
@@ -0,0 +1,203 @@
+import heapq
+import re
+from typing import Iterable, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.exercise import Exercise
+
+logger = get_logger(__name__)
+
+# SQLSTATE отмены запроса по statement_timeout
+QUERY_CANCELED = "57014"
+
+TOKEN_RE = re.compile(r"\w+")
+
+def tokenize(value: str) -> list[str]:
+    """
+    Слова строки в нижнем регистре.
+
+    Args:
+        value (str): Строка
+
+    Returns:
+        list[str]: Слова
+    """
+    return TOKEN_RE.findall(value.casefold())
+
+class _Node:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.ids: set[int] = set()
+
+class ExerciseTrie:
+    """
+    Префиксное дерево по словам названий упражнений пользователя.
+
+    Каждый узел хранит ID упражнений, в названии которых есть слово
+    с этим префиксом, поэтому поиск занимает время, пропорциональное
+    длине запроса, плюс сортировку найденного.
+
+    Атрибуты:
+        names (dict[int, str]): Названия упражнений по ID
+    """
+
+    def __init__(self, exercises: Iterable[tuple[int, str]] = ()) -> None:
+        self.names: dict[int, str] = {}
+        self._root = _Node()
+        for exercise_id, name in exercises:
+            self.add(exercise_id, name)
+
+    def add(self, exercise_id: int, name: str) -> None:
+        """
+        Добавление упражнения.
+
+        Args:
+            exercise_id (int): ID упражнения
+            name (str): Название
+        """
+        self.names[exercise_id] = name
+        for token in set(tokenize(name)):
+            node = self._root
+            for char in token:
+                node = node.children.setdefault(char, _Node())
+                node.ids.add(exercise_id)
+
+    def search(self, query: str, limit: int) -> list[tuple[int, str]]:
+        """
+        Упражнения, в названии которых каждое слово запроса - префикс слова.
+
+        Сначала идут названия, начинающиеся с запроса, затем более
+        короткие, затем по алфавиту.
+
+        Args:
+            query (str): Запрос
+            limit (int): Максимум результатов
+
+        Returns:
+            list[tuple[int, str]]: ID и названия упражнений
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        matches: Optional[set[int]] = None
+        for token in tokens:
+            node = self._root
+            for char in token:
+                node = node.children.get(char)
+                if node is None:
+                    return []
+            matches = node.ids if matches is None else matches & node.ids
+
+        prefix = " ".join(tokens)
+        def rank(exercise_id: int) -> tuple:
+            name = self.names[exercise_id]
+            return (not " ".join(tokenize(name)).startswith(prefix), len(name), name.casefold(), exercise_id)
+        return [(exercise_id, self.names[exercise_id]) for exercise_id in heapq.nsmallest(limit, matches, key=rank)]
+
+# Деревья пользователей: user_id -> (версия данных, дерево)
+exercise_tries = TTLCache(settings.EXERCISE_TRIE_CACHE_SIZE, settings.EXERCISE_TRIE_TTL_SECONDS)
+
+async def get_exercise_trie(db: AsyncSession, user_id: int, version: int) -> ExerciseTrie:
+    """
+    Дерево упражнений пользователя для текущей версии его данных.
+
+    Дерево строится одним запросом (ID и названия) и хранится в памяти
+    процесса, пока не изменится users.data_version.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID пользователя
+        version (int): Версия данных пользователя
+
+    Returns:
+        ExerciseTrie: Дерево упражнений
+    """
+    cached = exercise_tries.get(user_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    result = await db.execute(
+        select(Exercise.id, Exercise.name).where(Exercise.user_id == user_id)
+    )
+    trie = ExerciseTrie(result.tuples().all())
+    exercise_tries.set(user_id, (version, trie))
+    return trie
+
+def prefix_tsquery(query: str) -> Optional[str]:
+    """
+    Запрос to_tsquery, в котором каждое слово - префикс.
+
+    Args:
+        query (str): Строка поиска
+
+    Returns:
+        Optional[str]: Запрос вида 'bench:* & pr:*' или None без слов
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    return " & ".join(f"{token}:*" for token in tokens)
+
+async def search_exercises(
+    db: AsyncSession, user_id: int, query: str, limit: int
+) -> Optional[list[Exercise]]:
+    """
+    Полнотекстовый поиск упражнений по названию и описанию.
+
+    Используется GIN-индекс по search_vector. Совпадение начала названия
+    ранжируется выше, затем вес совпадения (название важнее описания).
+    Запрос ограничен EXERCISE_SEARCH_TIMEOUT_MS внутри точки сохранения,
+    поэтому таймаут не распространяется на следующие запросы транзакции.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID пользователя
+        query (str): Строка поиска
+        limit (int): Максимум результатов
+
+    Returns:
+        Optional[list[Exercise]]: Упражнения или None, если запрос
+            не уложился в бюджет времени (откатывается только точка
+            сохранения поиска)
+    """
+    tsquery = prefix_tsquery(query)
+    if tsquery is None:
+        return []
+    ts_query = func.to_tsquery("simple", tsquery)
+    stmt = (
+        select(Exercise)
+        .where(Exercise.user_id == user_id, Exercise.search_vector.op("@@")(ts_query))
+        .order_by(
+            func.lower(Exercise.name).startswith(" ".join(tokenize(query)), autoescape=True).desc(),
+            func.ts_rank(Exercise.search_vector, ts_query).desc(),
+            Exercise.name,
+            Exercise.id,
+        )
+        .limit(limit)
+    )
+    if settings.EXERCISE_SEARCH_TIMEOUT_MS <= 0:
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+
+    # Бюджет времени действует только внутри точки сохранения: откат к ней
+    # и после успешного чтения, и после отмены запроса возвращает прежний
+    # statement_timeout и не затрагивает остальную транзакцию запроса
+    savepoint = await db.begin_nested()
+    try:
+        await db.execute(text(f"SET LOCAL statement_timeout = {int(settings.EXERCISE_SEARCH_TIMEOUT_MS)}"))
+        result = await db.execute(stmt)
+        return list(result.scalars().all())
+    except DBAPIError as e:
+        if getattr(e.orig, "sqlstate", None) != QUERY_CANCELED:
+            raise
+        logger.warning("Exercise search exceeded %sms user=%s", settings.EXERCISE_SEARCH_TIMEOUT_MS, user_id)
+        return None
+    finally:
+        await savepoint.rollback()
@@ -0,0 +1,142 @@
+import csv
+import io
+import zlib
+from typing import AsyncIterator, Iterable
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.pagination import encode_cursor
+from app.core.serialization import get_type_adapter
+from app.models.workout import Workout
+from app.schemas.export import WorkoutExport
+
+# Колонки CSV: одна строка на подход; упражнения без подходов и тренировки
+# без упражнений выгружаются одной строкой с пустыми полями
+CSV_COLUMNS = (
+    "workout_id",
+    "workout_name",
+    "workout_description",
+    "workout_type",
+    "created_at",
+    "exercise_id",
+    "exercise_name",
+    "notes",
+    "set_number",
+    "weight",
+    "reps",
+    "cursor",
+)
+
+def render_ndjson(workouts: Iterable[Workout]) -> bytes:
+    """
+    Тренировки в формате NDJSON: одна строка JSON на тренировку.
+
+    Args:
+        workouts (Iterable[Workout]): Тренировки с загруженным деревом
+
+    Returns:
+        bytes: Строки NDJSON
+    """
+    adapter = get_type_adapter(WorkoutExport)
+    return b"".join(
+        adapter.dump_json(adapter.validate_python(workout, from_attributes=True)) + b"\n"
+        for workout in workouts
+    )
+
+def render_csv(workouts: Iterable[Workout], header: bool = False) -> bytes:
+    """
+    Тренировки в формате CSV, одна строка на подход.
+
+    Args:
+        workouts (Iterable[Workout]): Тренировки с загруженным деревом
+        header (bool): Добавить строку заголовка
+
+    Returns:
+        bytes: Строки CSV в UTF-8
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(CSV_COLUMNS)
+    for workout in workouts:
+        prefix = (
+            workout.id,
+            workout.name,
+            workout.description or "",
+            workout.workout_type.name,
+            workout.created_at.isoformat(),
+        )
+        cursor = encode_cursor(workout.created_at, workout.id)
+        if not workout.exercises:
+            writer.writerow(prefix + ("",) * 6 + (cursor,))
+        for workout_exercise in workout.exercises:
+            exercise = (
+                workout_exercise.exercise_id,
+                workout_exercise.exercise.name,
+                workout_exercise.notes or "",
+            )
+            if not workout_exercise.sets:
+                writer.writerow(prefix + exercise + ("",) * 3 + (cursor,))
+            for workout_set in workout_exercise.sets:
+                writer.writerow(
+                    prefix + exercise
+                    + (workout_set.set_number, workout_set.weight, workout_set.reps, cursor)
+                )
+    return buffer.getvalue().encode()
+
+async def stream_workouts(
+    session_factory: async_sessionmaker,
+    stmt: Select,
+    fmt: str,
+    batch_size: int,
+) -> AsyncIterator[bytes]:
+    """
+    Потоковая выгрузка тренировок через серверный курсор.
+
+    Тренировки читаются пачками по batch_size (yield_per); упражнения и
+    подходы каждой пачки догружаются selectinload. Identity map сессии
+    хранит слабые ссылки, поэтому отправленные пачки освобождаются и
+    память не зависит от объема истории.
+
+    Args:
+        session_factory (async_sessionmaker): Фабрика сессий
+        stmt (Select): Упорядоченный запрос дерева тренировок
+        fmt (str): Формат: ndjson или csv
+        batch_size (int): Размер пачки
+
+    Yields:
+        bytes: Очередная часть выгрузки
+    """
+    async with session_factory() as session:
+        result = await session.stream(stmt.execution_options(yield_per=batch_size))
+        first = True
+        async for partition in result.scalars().partitions():
+            if fmt == "csv":
+                yield render_csv(partition, header=first)
+            else:
+                yield render_ndjson(partition)
+            first = False
+        if first and fmt == "csv":
+            yield render_csv([], header=True)
+
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """
+    Потоковое сжатие gzip.
+
+    Каждая часть сбрасывается в выходной поток сразу (Z_SYNC_FLUSH),
+    чтобы клиент получал данные по мере выгрузки.
+
+    Args:
+        chunks (AsyncIterator[bytes]): Несжатые части
+        level (int): Уровень сжатия
+
+    Yields:
+        bytes: Сжатые части
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,175 @@
+from typing import Any, Optional
+
+import numpy as np
+from sqlalchemy import Float, cast, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.workout import Workout
+from app.models.workout_exercise import WorkoutExercise
+from app.models.workout_set import WorkoutSet
+
+SECONDS_PER_DAY = 86400.0
+
+# Ряды ответа по тренировкам
+SERIES = (
+    "tonnage", "e1rm_epley", "e1rm_brzycki", "top_weight", "average_load",
+    "intensity", "tonnage_rolling", "e1rm_rolling",
+)
+
+# Формула Бжицки не определена при 37 повторениях и больше
+BRZYCKI_MAX_REPS = 36
+
+async def load_set_columns(
+    db: AsyncSession, user_id: int, exercise_id: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Подходы упражнения одним запросом в виде колонок.
+
+    Каждая колонка собирается array_agg в массив PostgreSQL и декодируется
+    asyncpg целиком, поэтому строки и ORM-объекты WorkoutSet не создаются.
+    Подходы упорядочены по (created_at, id) тренировки; подходы без
+    повторений не учитываются.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID пользователя
+        exercise_id (int): ID упражнения
+
+    Returns:
+        tuple: ID тренировок, время тренировок (epoch, сек), веса и повторения
+    """
+    order = (Workout.created_at, Workout.id)
+    epoch = cast(func.extract("epoch", Workout.created_at), Float)
+    result = await db.execute(
+        select(
+            func.array_agg(aggregate_order_by(Workout.id, *order)),
+            func.array_agg(aggregate_order_by(epoch, *order)),
+            func.array_agg(aggregate_order_by(WorkoutSet.weight, *order)),
+            func.array_agg(aggregate_order_by(WorkoutSet.reps, *order)),
+        )
+        .select_from(WorkoutSet)
+        .join(WorkoutExercise, WorkoutExercise.id == WorkoutSet.workout_exercise_id)
+        .join(Workout, Workout.id == WorkoutExercise.workout_id)
+        .where(
+            WorkoutExercise.exercise_id == exercise_id,
+            Workout.user_id == user_id,
+            WorkoutSet.reps > 0,
+        )
+    )
+    workout_ids, epochs, weights, reps = result.one()
+    return (
+        np.asarray(workout_ids or [], dtype=np.int64),
+        np.asarray(epochs or [], dtype=np.float64),
+        np.asarray(weights or [], dtype=np.float64),
+        np.asarray(reps or [], dtype=np.float64),
+    )
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Скользящее среднее по последним window значениям.
+
+    Для первых window - 1 точек среднее берется по всем предыдущим.
+
+    Args:
+        values (np.ndarray): Ряд значений
+        window (int): Размер окна
+
+    Returns:
+        np.ndarray: Ряд средних той же длины
+    """
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    ends = np.arange(1, len(values) + 1)
+    starts = np.maximum(ends - window, 0)
+    return (cumsum[ends] - cumsum[starts]) / (ends - starts)
+
+def trend_per_week(days: np.ndarray, values: np.ndarray) -> Optional[float]:
+    """
+    Наклон линейного тренда в единицах значения за неделю.
+
+    Args:
+        days (np.ndarray): Дни от первой тренировки
+        values (np.ndarray): Значения
+
+    Returns:
+        Optional[float]: Наклон или None, если точек меньше двух
+            или все они в один день
+    """
+    if len(days) < 2 or np.ptp(days) == 0:
+        return None
+    slope, _ = np.polyfit(days, values, 1)
+    return round(float(slope * 7), 3)
+
+def _rounded(values: np.ndarray) -> list[Optional[float]]:
+    rounded = np.round(values, 2).astype(object)
+    rounded[np.isnan(values)] = None
+    return rounded.tolist()
+
+def compute_progress(
+    workout_ids: np.ndarray,
+    epochs: np.ndarray,
+    weights: np.ndarray,
+    reps: np.ndarray,
+    window: int,
+) -> dict[str, Any]:
+    """
+    Ряды прогресса по тренировкам из колонок load_set_columns.
+
+    Подходы одной тренировки идут подряд, поэтому значения по тренировкам
+    считаются np.*.reduceat по индексам начала тренировок.
+
+    Args:
+        workout_ids (np.ndarray): ID тренировки каждого подхода
+        epochs (np.ndarray): Время тренировки каждого подхода (epoch, сек)
+        weights (np.ndarray): Веса
+        reps (np.ndarray): Повторения
+        window (int): Окно скользящих средних в тренировках
+
+    Returns:
+        dict[str, Any]: Даты тренировок и ряды тоннажа, e1RM, интенсивности,
+            скользящих средних и наклоны трендов
+    """
+    if not len(workout_ids):
+        return {
+            "sessions": 0,
+            "window": window,
+            "dates": [],
+            **{name: [] for name in SERIES},
+            "tonnage_trend": None,
+            "e1rm_trend": None,
+        }
+
+    starts = np.flatnonzero(np.concatenate(([True], workout_ids[1:] != workout_ids[:-1])))
+
+    tonnage = np.add.reduceat(weights * reps, starts)
+    total_reps = np.add.reduceat(reps, starts)
+    top_weight = np.maximum.reduceat(weights, starts)
+    epley = np.maximum.reduceat(weights * (1 + reps / 30), starts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        brzycki_sets = np.where(reps <= BRZYCKI_MAX_REPS, weights * 36 / (37 - reps), np.nan)
+    # fmax пропускает NaN, пока в тренировке есть хотя бы одно значение
+    brzycki = np.fmax.reduceat(brzycki_sets, starts)
+
+    # Интенсивность: лучший вес тренировки относительно лучшего e1RM на эту дату
+    best_so_far = np.maximum.accumulate(epley)
+    intensity = np.divide(top_weight, best_so_far, out=np.zeros_like(top_weight), where=best_so_far > 0)
+
+    session_epochs = epochs[starts]
+    days = (session_epochs - session_epochs[0]) / SECONDS_PER_DAY
+    dates = np.datetime_as_string(session_epochs.astype("datetime64[s]"), unit="s")
+
+    return {
+        "sessions": len(starts),
+        "window": window,
+        "dates": dates.tolist(),
+        "tonnage": _rounded(tonnage),
+        "e1rm_epley": _rounded(epley),
+        "e1rm_brzycki": _rounded(brzycki),
+        "top_weight": _rounded(top_weight),
+        "average_load": _rounded(tonnage / total_reps),
+        "intensity": _rounded(intensity),
+        "tonnage_rolling": _rounded(rolling_mean(tonnage, window)),
+        "e1rm_rolling": _rounded(rolling_mean(epley, window)),
+        "tonnage_trend": trend_per_week(days, tonnage),
+        "e1rm_trend": trend_per_week(days, epley),
+    }
@@ -0,0 +1,207 @@
+from typing import Iterable, Optional
+
+from sqlalchemy import Float, cast, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.personal_record import PersonalRecord, RepRecord
+from app.models.workout import Workout
+from app.models.workout_exercise import WorkoutExercise
+from app.models.workout_set import WorkoutSet
+
+# Подход для обновления рекордов: (workout_id, exercise_id, weight, reps)
+SetSample = tuple[int, int, int, int]
+
+def estimate_1rm(weight: int, reps: int) -> float:
+    """
+    Расчетный разовый максимум по формуле Эпли.
+
+    Порядок операций совпадает с выражением в recompute_records, чтобы
+    значения из Python и из PostgreSQL (float8) были равны побитово.
+
+    Args:
+        weight (int): Вес
+        reps (int): Повторения
+
+    Returns:
+        float: Расчетный разовый максимум
+    """
+    return weight * (1 + reps / 30)
+
+def samples_from_tree(workout_exercises: Iterable[WorkoutExercise]) -> list[SetSample]:
+    """
+    Подходы упражнений с загруженными sets в формате merge_records.
+
+    Args:
+        workout_exercises (Iterable[WorkoutExercise]): Упражнения в тренировке
+
+    Returns:
+        list[SetSample]: Подходы
+    """
+    return [
+        (workout_exercise.workout_id, workout_exercise.exercise_id, workout_set.weight, workout_set.reps)
+        for workout_exercise in workout_exercises
+        for workout_set in workout_exercise.sets
+    ]
+
+def summarize_samples(
+    user_id: int, samples: Iterable[SetSample]
+) -> tuple[list[dict], list[dict]]:
+    """
+    Свертка подходов в строки personal_records и rep_records.
+
+    Объем тренировки считается по всем переданным подходам упражнения
+    в этой тренировке, поэтому подходы одной тренировки нужно передавать
+    вместе.
+
+    Args:
+        user_id (int): ID пользователя
+        samples (Iterable[SetSample]): Подходы
+
+    Returns:
+        tuple[list[dict], list[dict]]: Значения рекордов и рекордов повторений
+    """
+    records: dict[int, dict] = {}
+    volumes: dict[tuple[int, int], int] = {}
+    reps_by_weight: dict[tuple[int, int], int] = {}
+    for workout_id, exercise_id, weight, reps in samples:
+        if reps <= 0:
+            continue
+        e1rm = estimate_1rm(weight, reps)
+        record = records.get(exercise_id)
+        if record is None:
+            records[exercise_id] = {
+                "user_id": user_id,
+                "exercise_id": exercise_id,
+                "max_weight": weight,
+                "best_e1rm": e1rm,
+                "best_volume": 0,
+            }
+        else:
+            record["max_weight"] = max(record["max_weight"], weight)
+            record["best_e1rm"] = max(record["best_e1rm"], e1rm)
+        volumes[workout_id, exercise_id] = volumes.get((workout_id, exercise_id), 0) + weight * reps
+        reps_by_weight[exercise_id, weight] = max(reps_by_weight.get((exercise_id, weight), 0), reps)
+
+    for (_, exercise_id), volume in volumes.items():
+        record = records[exercise_id]
+        record["best_volume"] = max(record["best_volume"], volume)
+    rep_records = [
+        {"user_id": user_id, "exercise_id": exercise_id, "weight": weight, "reps": reps}
+        for (exercise_id, weight), reps in reps_by_weight.items()
+    ]
+    return list(records.values()), rep_records
+
+async def merge_records(db: AsyncSession, user_id: int, samples: Iterable[SetSample]) -> None:
+    """
+    Инкрементальное обновление рекордов новыми подходами.
+
+    Подходят только подходы новых тренировок: рекорд может лишь вырасти,
+    поэтому текущие значения объединяются с новыми через GREATEST
+    в INSERT ... ON CONFLICT - по одному выражению на таблицу.
+    Транзакцию фиксирует вызывающий код.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID пользователя
+        samples (Iterable[SetSample]): Подходы новых тренировок
+    """
+    records, rep_records = summarize_samples(user_id, samples)
+    if records:
+        stmt = insert(PersonalRecord)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PersonalRecord.user_id, PersonalRecord.exercise_id],
+                set_={
+                    "max_weight": func.greatest(PersonalRecord.max_weight, stmt.excluded.max_weight),
+                    "best_e1rm": func.greatest(PersonalRecord.best_e1rm, stmt.excluded.best_e1rm),
+                    "best_volume": func.greatest(PersonalRecord.best_volume, stmt.excluded.best_volume),
+                    "updated_at": func.now(),
+                },
+            ),
+            records,
+        )
+    if rep_records:
+        stmt = insert(RepRecord)
+        await db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[RepRecord.user_id, RepRecord.exercise_id, RepRecord.weight],
+                set_={"reps": func.greatest(RepRecord.reps, stmt.excluded.reps)},
+            ),
+            rep_records,
+        )
+
+async def recompute_records(
+    db: AsyncSession,
+    user_id: Optional[int] = None,
+    exercise_ids: Optional[Iterable[int]] = None,
+) -> None:
+    """
+    Пересчет рекордов по истории подходов.
+
+    Нужен, когда подходы изменяются или удаляются: уменьшившийся рекорд
+    нельзя вычислить из предыдущего значения. Пересчитываются только
+    переданные упражнения пользователя (индекс по exercise_id в
+    workout_exercises), без аргументов - все рекорды всех пользователей.
+    Транзакцию фиксирует вызывающий код.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int, опционально): ID пользователя
+        exercise_ids (Iterable[int], опционально): ID упражнений
+    """
+    ids = set(exercise_ids) if exercise_ids is not None else None
+    if ids is not None and not ids:
+        return
+
+    for model in (PersonalRecord, RepRecord):
+        conditions = []
+        if user_id is not None:
+            conditions.append(model.user_id == user_id)
+        if ids is not None:
+            conditions.append(model.exercise_id.in_(ids))
+        await db.execute(delete(model).where(*conditions))
+
+    filters = [WorkoutSet.reps > 0]
+    if user_id is not None:
+        filters.append(Workout.user_id == user_id)
+    if ids is not None:
+        filters.append(WorkoutExercise.exercise_id.in_(ids))
+    history = (
+        select(Workout.user_id, WorkoutExercise.exercise_id)
+        .select_from(WorkoutSet)
+        .join(WorkoutExercise, WorkoutExercise.id == WorkoutSet.workout_exercise_id)
+        .join(Workout, Workout.id == WorkoutExercise.workout_id)
+        .where(*filters)
+    )
+    sessions = (
+        history.add_columns(
+            WorkoutExercise.workout_id,
+            func.max(WorkoutSet.weight).label("max_weight"),
+            func.max(
+                cast(WorkoutSet.weight, Float) * (1 + cast(WorkoutSet.reps, Float) / 30)
+            ).label("best_e1rm"),
+            func.sum(WorkoutSet.weight * WorkoutSet.reps).label("volume"),
+        )
+        .group_by(Workout.user_id, WorkoutExercise.exercise_id, WorkoutExercise.workout_id)
+        .subquery()
+    )
+    await db.execute(
+        insert(PersonalRecord).from_select(
+            ["user_id", "exercise_id", "max_weight", "best_e1rm", "best_volume"],
+            select(
+                sessions.c.user_id,
+                sessions.c.exercise_id,
+                func.max(sessions.c.max_weight),
+                func.max(sessions.c.best_e1rm),
+                func.max(sessions.c.volume),
+            ).group_by(sessions.c.user_id, sessions.c.exercise_id),
+        )
+    )
+    await db.execute(
+        insert(RepRecord).from_select(
+            ["user_id", "exercise_id", "weight", "reps"],
+            history.add_columns(WorkoutSet.weight, func.max(WorkoutSet.reps))
+            .group_by(Workout.user_id, WorkoutExercise.exercise_id, WorkoutSet.weight),
+        )
+    )
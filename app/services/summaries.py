@@ -0,0 +1,128 @@
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import Date, case, cast, delete, func, insert, literal, select
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.exercise import Exercise
+from app.models.training_summary import TrainingSummary
+from app.models.workout import Workout
+from app.models.workout_exercise import WorkoutExercise
+from app.models.workout_set import WorkoutSet
+
+PERIODS = ("week", "month")
+
+# Группа для упражнений без muscle_groups
+UNASSIGNED_MUSCLE_GROUP = "other"
+
+def period_start(period: str, moment: date) -> date:
+    """
+    Первый день периода, как date_trunc в PostgreSQL.
+
+    Args:
+        period (str): week или month
+        moment (date): Дата или время
+
+    Returns:
+        date: Понедельник недели или первое число месяца
+    """
+    day = moment.date() if isinstance(moment, datetime) else moment
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+def shift_period(period: str, start: date, count: int) -> date:
+    """
+    Начало периода, отстоящего от start на count периодов.
+
+    Args:
+        period (str): week или month
+        start (date): Начало периода
+        count (int): Сдвиг, может быть отрицательным
+
+    Returns:
+        date: Начало периода
+    """
+    if period == "week":
+        return start + timedelta(weeks=count)
+    months = start.year * 12 + start.month - 1 + count
+    return date(months // 12, months % 12 + 1, 1)
+
+async def refresh_summaries(
+    db: AsyncSession,
+    user_id: Optional[int] = None,
+    moments: Optional[Iterable[datetime]] = None,
+) -> None:
+    """
+    Пересчет сводок за периоды, в которые попадают переданные моменты.
+
+    Пересчитывается непрерывный диапазон периодов от самого раннего до
+    самого позднего момента: строки диапазона удаляются и собираются
+    заново из тренировок этого диапазона (индекс по user_id, created_at),
+    по два выражения на вид периода. Без moments пересчитывается вся
+    история. Транзакцию фиксирует вызывающий код.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int, опционально): ID пользователя; None - все пользователи
+        moments (Iterable[datetime], опционально): Время измененных тренировок
+    """
+    bounds = None
+    if moments is not None:
+        moments = list(moments)
+        if not moments:
+            return
+        bounds = (min(moments), max(moments))
+
+    muscle_groups = case(
+        (func.cardinality(Exercise.muscle_groups) > 0, Exercise.muscle_groups),
+        else_=array([UNASSIGNED_MUSCLE_GROUP]),
+    )
+    for period in PERIODS:
+        stale = delete(TrainingSummary).where(TrainingSummary.period == period)
+        filters = []
+        if user_id is not None:
+            stale = stale.where(TrainingSummary.user_id == user_id)
+            filters.append(Workout.user_id == user_id)
+        if bounds is not None:
+            first = period_start(period, bounds[0])
+            last = period_start(period, bounds[1])
+            stale = stale.where(TrainingSummary.period_start.between(first, last))
+            filters.extend((
+                Workout.created_at >= datetime.combine(first, datetime.min.time()),
+                Workout.created_at < datetime.combine(shift_period(period, last, 1), datetime.min.time()),
+            ))
+        await db.execute(stale)
+
+        sets = (
+            select(
+                Workout.user_id,
+                cast(func.date_trunc(period, Workout.created_at), Date).label("period_start"),
+                Workout.id.label("workout_id"),
+                WorkoutSet.weight,
+                WorkoutSet.reps,
+                func.unnest(muscle_groups).label("muscle_group"),
+            )
+            .select_from(WorkoutSet)
+            .join(WorkoutExercise, WorkoutExercise.id == WorkoutSet.workout_exercise_id)
+            .join(Workout, Workout.id == WorkoutExercise.workout_id)
+            .join(Exercise, Exercise.id == WorkoutExercise.exercise_id)
+            .where(*filters)
+            .subquery()
+        )
+        await db.execute(
+            insert(TrainingSummary).from_select(
+                ["user_id", "period", "period_start", "muscle_group", "volume", "sets", "reps", "workouts"],
+                select(
+                    sets.c.user_id,
+                    literal(period),
+                    sets.c.period_start,
+                    sets.c.muscle_group,
+                    func.sum(sets.c.weight * sets.c.reps),
+                    func.count(),
+                    func.sum(sets.c.reps),
+                    func.count(sets.c.workout_id.distinct()),
+                ).group_by(sets.c.user_id, sets.c.period_start, sets.c.muscle_group),
+            )
+        )
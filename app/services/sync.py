@@ -0,0 +1,132 @@
+import base64
+import json
+from typing import Any, Iterable, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+
+from app.models.exercise import Exercise
+from app.models.sync import SyncTombstone
+from app.models.workout import Workout
+from app.models.workout_exercise import WorkoutExercise
+from app.models.workout_set import WorkoutSet
+from app.models.workout_type import WorkoutType
+
+# Синхронизируемые таблицы в порядке зависимостей: родители раньше детей
+SYNC_ENTITIES: dict[str, Any] = {
+    "workout_types": WorkoutType,
+    "exercises": Exercise,
+    "workouts": Workout,
+    "workout_exercises": WorkoutExercise,
+    "workout_sets": WorkoutSet,
+}
+
+def encode_sync_token(version: int) -> str:
+    """
+    Кодирование версии, до которой клиент получил изменения.
+
+    Args:
+        version (int): Версия последнего полученного изменения
+
+    Returns:
+        str: Токен в формате base64url
+    """
+    raw = json.dumps([version], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_sync_token(token: Optional[str]) -> int:
+    """
+    Декодирование токена синхронизации; без токена - с начала истории.
+
+    Args:
+        token (str, опционально): Токен из encode_sync_token
+
+    Returns:
+        int: Версия, после которой нужны изменения
+
+    Raises:
+        HTTPException: Если токен поврежден
+    """
+    if not token:
+        return 0
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        [version] = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return int(version)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Некорректный токен синхронизации")
+
+async def record_deletions(
+    db: AsyncSession, user_id: int, entity: str, entity_ids: Iterable[int]
+) -> None:
+    """
+    Запись удаленных записей в журнал удалений одним выражением.
+
+    Вызывается в транзакции удаления после bump_data_version, чтобы версии
+    удалений шли в порядке фиксации транзакций пользователя.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID владельца записей
+        entity (str): Имя таблицы из SYNC_ENTITIES
+        entity_ids (Iterable[int]): ID удаленных записей
+    """
+    values = [
+        {"user_id": user_id, "entity": entity, "entity_id": entity_id}
+        for entity_id in entity_ids
+    ]
+    if values:
+        await db.execute(insert(SyncTombstone), values)
+
+async def load_changes(db: AsyncSession, user_id: int, since: int, limit: int) -> dict[str, Any]:
+    """
+    Страница ленты изменений пользователя после версии since.
+
+    Изменения всех таблиц и удаления упорядочены общей версией из
+    sync_version_seq. Из каждой таблицы читается не больше limit + 1
+    строк после since по индексу (user_id, sync_version): чтение не
+    затрагивает изменения других пользователей. Затем строки сливаются
+    по версии и обрезаются до limit; токен следующей страницы - версия
+    последней возвращенной строки.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID пользователя
+        since (int): Версия, после которой нужны изменения
+        limit (int): Максимум строк на странице (изменения и удаления вместе)
+
+    Returns:
+        dict[str, Any]: Измененные строки по таблицам, удаления, токен
+            следующей страницы и признак, что изменения еще есть
+    """
+    changes: list[tuple[int, str, Any]] = []
+    for entity, model in SYNC_ENTITIES.items():
+        stmt = (
+            select(model)
+            .where(model.user_id == user_id, model.sync_version > since)
+            .order_by(model.sync_version)
+            .limit(limit + 1)
+            .options(raiseload("*"))
+        )
+        result = await db.scalars(stmt)
+        changes.extend((row.sync_version, entity, row) for row in result)
+
+    result = await db.scalars(
+        select(SyncTombstone)
+        .where(SyncTombstone.user_id == user_id, SyncTombstone.sync_version > since)
+        .order_by(SyncTombstone.sync_version)
+        .limit(limit + 1)
+    )
+    changes.extend((tombstone.sync_version, "deleted", tombstone) for tombstone in result)
+
+    changes.sort(key=lambda change: change[0])
+    page = changes[:limit]
+    feed: dict[str, Any] = {entity: [] for entity in SYNC_ENTITIES}
+    feed["deleted"] = []
+    for _, entity, row in page:
+        feed[entity].append(row)
+    feed["next_token"] = encode_sync_token(page[-1][0] if page else since)
+    feed["has_more"] = len(changes) > limit
+    return feed
@@ -0,0 +1,63 @@
+from sqlalchemy import Select, select
+from sqlalchemy.orm import joinedload, load_only, selectinload
+
+from app.models.exercise import Exercise
+from app.models.workout import Workout
+from app.models.workout_exercise import WorkoutExercise
+from app.models.workout_set import WorkoutSet
+from app.models.workout_type import WorkoutType
+
+# Стратегия загрузки дерева тренировки для WorkoutResponse.
+# Загружаются только поля, которые сериализует схема ответа:
+#   1. workouts + workout_types (JOIN, многие-к-одному)
+#   2. workout_exercises + exercises (SELECT ... IN, JOIN)
+#   3. workout_sets (SELECT ... IN)
+# Обратные связи (WorkoutExercise.workout, WorkoutType.workouts) не загружаются.
+WORKOUT_TREE_OPTIONS = (
+    load_only(
+        Workout.id,
+        Workout.name,
+        Workout.description,
+        Workout.workout_type_id,
+        Workout.user_id,
+        Workout.created_at,
+    ),
+    joinedload(Workout.workout_type).load_only(
+        WorkoutType.id,
+        WorkoutType.name,
+        WorkoutType.description,
+        WorkoutType.icon_url,
+        WorkoutType.created_at,
+    ),
+    selectinload(Workout.exercises)
+    .load_only(
+        WorkoutExercise.id,
+        WorkoutExercise.workout_id,
+        WorkoutExercise.exercise_id,
+        WorkoutExercise.notes,
+    )
+    .options(
+        joinedload(WorkoutExercise.exercise).load_only(
+            Exercise.id,
+            Exercise.name,
+            Exercise.description,
+            Exercise.muscle_groups,
+        ),
+        selectinload(WorkoutExercise.sets).load_only(
+            WorkoutSet.id,
+            WorkoutSet.workout_exercise_id,
+            WorkoutSet.set_number,
+            WorkoutSet.weight,
+            WorkoutSet.reps,
+        ),
+    ),
+)
+
+def select_workout_tree() -> Select:
+    """
+    Запрос тренировок с упражнениями и подходами для WorkoutResponse.
+
+    Returns:
+        Select: Запрос, к которому добавляются фильтры и пагинация
+    """
+    return select(Workout).options(*WORKOUT_TREE_OPTIONS)
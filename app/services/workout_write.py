@@ -0,0 +1,302 @@
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.models.exercise import Exercise
+from app.models.workout_exercise import WorkoutExercise
+from app.models.workout_set import WorkoutSet
+from app.schemas.workout_exercise import WorkoutExerciseCreate, WorkoutExerciseUpdate
+from app.schemas.workout_set import WorkoutSetUpdate
+from app.services.sync import record_deletions
+
+async def load_exercises(
+    db: AsyncSession, user_id: int, exercise_ids: Iterable[int]
+) -> dict[int, Exercise]:
+    """
+    Загрузка упражнений пользователя одним запросом.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID владельца упражнений
+        exercise_ids (Iterable[int]): ID упражнений
+
+    Returns:
+        dict[int, Exercise]: Упражнения по ID
+
+    Raises:
+        HTTPException: Если хотя бы одно упражнение не найдено
+    """
+    ids = set(exercise_ids)
+    if not ids:
+        return {}
+    result = await db.execute(
+        select(Exercise).where(Exercise.id.in_(ids), Exercise.user_id == user_id)
+    )
+    exercises = {exercise.id: exercise for exercise in result.scalars()}
+    missing = ids - exercises.keys()
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Упражнения не найдены: {', '.join(map(str, sorted(missing)))}"
+        )
+    return exercises
+
+async def insert_workout_exercises(
+    db: AsyncSession,
+    user_id: int,
+    workout_id: int,
+    exercises_data: Sequence[WorkoutExerciseCreate],
+    exercises: dict[int, Exercise],
+) -> list[WorkoutExercise]:
+    """
+    Добавление упражнений с подходами в тренировку.
+
+    Упражнения и подходы вставляются двумя INSERT ... RETURNING на любое
+    количество строк. Связи exercise и sets заполняются из возвращенных
+    строк, поэтому объекты готовы к сериализации без повторного SELECT.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID владельца тренировки
+        workout_id (int): ID тренировки
+        exercises_data (Sequence[WorkoutExerciseCreate]): Упражнения с подходами
+        exercises (dict[int, Exercise]): Упражнения из load_exercises
+
+    Returns:
+        list[WorkoutExercise]: Созданные упражнения в порядке exercises_data
+    """
+    if not exercises_data:
+        return []
+
+    # sort_by_parameter_order гарантирует порядок RETURNING, совпадающий
+    # с порядком параметров, даже при разбиении вставки на пакеты;
+    # render_nulls не дает разбить вставку по строкам с пустыми notes
+    result = await db.scalars(
+        insert(WorkoutExercise)
+        .returning(WorkoutExercise, sort_by_parameter_order=True)
+        .execution_options(render_nulls=True),
+        [
+            {"workout_id": workout_id, "user_id": user_id, "exercise_id": data.exercise_id, "notes": data.notes}
+            for data in exercises_data
+        ],
+    )
+    workout_exercises = list(result.all())
+
+    sets_params = [
+        {"workout_exercise_id": workout_exercise.id, "user_id": user_id, **set_data.dict()}
+        for workout_exercise, data in zip(workout_exercises, exercises_data)
+        for set_data in data.sets
+    ]
+    sets_by_exercise: dict[int, list[WorkoutSet]] = {
+        workout_exercise.id: [] for workout_exercise in workout_exercises
+    }
+    if sets_params:
+        result = await db.scalars(
+            insert(WorkoutSet).returning(WorkoutSet, sort_by_parameter_order=True),
+            sets_params,
+        )
+        for workout_set in result.all():
+            sets_by_exercise[workout_set.workout_exercise_id].append(workout_set)
+
+    for workout_exercise in workout_exercises:
+        sets = sorted(sets_by_exercise[workout_exercise.id], key=lambda s: s.set_number)
+        set_committed_value(workout_exercise, "sets", sets)
+        set_committed_value(workout_exercise, "exercise", exercises[workout_exercise.exercise_id])
+    return workout_exercises
+
+
+@dataclass
+class WorkoutTreeDiff:
+    """
+    Изменения упражнений и подходов тренировки, сгруппированные по операциям.
+
+    Атрибуты:
+        exercise_inserts (list): Новые упражнения и значения их подходов
+        exercise_updates (list[dict]): Новые значения упражнений по ID
+        exercise_deletes (list[int]): ID удаляемых упражнений
+        set_inserts (list[dict]): Новые подходы существующих упражнений
+        set_updates (list[dict]): Новые значения подходов по ID
+        set_deletes (list[int]): ID удаляемых подходов
+        affected_exercise_ids (set[int]): ID упражнений каталога, подходы
+            которых добавляются, изменяются или удаляются (для пересчета рекордов)
+    """
+    exercise_inserts: list[tuple[dict[str, Any], list[dict[str, Any]]]] = field(default_factory=list)
+    exercise_updates: list[dict[str, Any]] = field(default_factory=list)
+    exercise_deletes: list[int] = field(default_factory=list)
+    set_inserts: list[dict[str, Any]] = field(default_factory=list)
+    set_updates: list[dict[str, Any]] = field(default_factory=list)
+    set_deletes: list[int] = field(default_factory=list)
+    affected_exercise_ids: set[int] = field(default_factory=set)
+
+    @property
+    def exercise_ids(self) -> set[int]:
+        """ID упражнений каталога, на которые ссылаются новые и измененные записи."""
+        ids = {values["exercise_id"] for values, _ in self.exercise_inserts}
+        ids.update(values["exercise_id"] for values in self.exercise_updates)
+        return ids
+
+def _new_set_values(set_data: WorkoutSetUpdate) -> dict[str, Any]:
+    if set_data.set_number is None:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Поле 'set_number' обязательно для новых подходов (сетов). Входные данные для сета: {set_data.dict()}"
+        )
+    return {
+        "set_number": set_data.set_number,
+        "weight": set_data.weight if set_data.weight is not None else 0,
+        "reps": set_data.reps if set_data.reps is not None else 0,
+    }
+
+def _diff_sets(
+    diff: WorkoutTreeDiff,
+    workout_exercise: WorkoutExercise,
+    sets_data: Sequence[WorkoutSetUpdate],
+) -> None:
+    current = {workout_set.id: workout_set for workout_set in workout_exercise.sets}
+    kept = set()
+    for set_data in sets_data:
+        if set_data.id is None:
+            diff.set_inserts.append(
+                {"workout_exercise_id": workout_exercise.id, **_new_set_values(set_data)}
+            )
+            diff.affected_exercise_ids.add(workout_exercise.exercise_id)
+            continue
+        db_set = current.get(set_data.id)
+        if db_set is None:
+            # Подход с чужим ID пропускается
+            continue
+        kept.add(set_data.id)
+        values = {
+            "set_number": set_data.set_number if set_data.set_number is not None else db_set.set_number,
+            "weight": set_data.weight if set_data.weight is not None else db_set.weight,
+            "reps": set_data.reps if set_data.reps is not None else db_set.reps,
+        }
+        if values != {"set_number": db_set.set_number, "weight": db_set.weight, "reps": db_set.reps}:
+            diff.set_updates.append({"id": db_set.id, **values})
+            diff.affected_exercise_ids.add(workout_exercise.exercise_id)
+    deleted = [set_id for set_id in current if set_id not in kept]
+    if deleted:
+        diff.set_deletes.extend(deleted)
+        diff.affected_exercise_ids.add(workout_exercise.exercise_id)
+
+def diff_workout_exercises(
+    current: Sequence[WorkoutExercise],
+    exercises_data: Sequence[WorkoutExerciseUpdate],
+    delete_missing: bool = True,
+) -> WorkoutTreeDiff:
+    """
+    Сравнение загруженных упражнений тренировки с присланными данными.
+
+    Упражнения и подходы без ID создаются, с ID - обновляются только
+    в изменившихся полях. Список sets, если передан, задает итоговый
+    набор подходов упражнения: отсутствующие в нем подходы удаляются.
+
+    Args:
+        current (Sequence[WorkoutExercise]): Упражнения с загруженными подходами
+        exercises_data (Sequence[WorkoutExerciseUpdate]): Присланные упражнения
+        delete_missing (bool): Удалять упражнения, отсутствующие в exercises_data
+
+    Returns:
+        WorkoutTreeDiff: Изменения для apply_workout_diff
+
+    Raises:
+        HTTPException: Если упражнение с указанным ID не найдено в тренировке
+            или для новой записи не хватает обязательных полей
+    """
+    current_map = {workout_exercise.id: workout_exercise for workout_exercise in current}
+    diff = WorkoutTreeDiff()
+    kept = set()
+    for data in exercises_data:
+        if data.id is None:
+            if data.exercise_id is None:
+                raise HTTPException(
+                    status_code=422,
+                    detail="Поле 'exercise_id' обязательно для новых упражнений"
+                )
+            diff.exercise_inserts.append((
+                {"exercise_id": data.exercise_id, "notes": data.notes},
+                [_new_set_values(set_data) for set_data in data.sets or []],
+            ))
+            diff.affected_exercise_ids.add(data.exercise_id)
+            continue
+
+        workout_exercise = current_map.get(data.id)
+        if workout_exercise is None:
+            raise HTTPException(status_code=404, detail=f"Упражнение в тренировке с ID {data.id} не найдено")
+        kept.add(data.id)
+
+        changes = data.dict(exclude_unset=True)
+        values = {
+            "exercise_id": data.exercise_id if data.exercise_id is not None else workout_exercise.exercise_id,
+            "notes": changes["notes"] if "notes" in changes else workout_exercise.notes,
+        }
+        if values != {"exercise_id": workout_exercise.exercise_id, "notes": workout_exercise.notes}:
+            diff.exercise_updates.append({"id": workout_exercise.id, **values})
+            if values["exercise_id"] != workout_exercise.exercise_id:
+                diff.affected_exercise_ids.update((workout_exercise.exercise_id, values["exercise_id"]))
+        if changes.get("sets") is not None:
+            _diff_sets(diff, workout_exercise, data.sets)
+
+    if delete_missing:
+        for workout_exercise_id, workout_exercise in current_map.items():
+            if workout_exercise_id not in kept:
+                diff.exercise_deletes.append(workout_exercise_id)
+                diff.affected_exercise_ids.add(workout_exercise.exercise_id)
+    return diff
+
+async def apply_workout_diff(
+    db: AsyncSession, user_id: int, workout_id: int, diff: WorkoutTreeDiff
+) -> None:
+    """
+    Применение изменений: не больше одного выражения на операцию и таблицу.
+
+    Обновления выполняются пакетно по первичному ключу (executemany), объекты
+    в сессии не синхронизируются - дерево нужно перечитать с populate_existing.
+    Удаленные упражнения и подходы записываются в журнал удалений; подходы
+    удаленных упражнений отдельно не журналируются.
+    Транзакцию фиксирует вызывающий код.
+
+    Args:
+        db (AsyncSession): Сессия базы данных
+        user_id (int): ID владельца тренировки
+        workout_id (int): ID тренировки
+        diff (WorkoutTreeDiff): Изменения из diff_workout_exercises
+    """
+    if diff.set_deletes or diff.exercise_deletes:
+        await db.execute(
+            delete(WorkoutSet)
+            .where(or_(
+                WorkoutSet.id.in_(diff.set_deletes),
+                WorkoutSet.workout_exercise_id.in_(diff.exercise_deletes),
+            ))
+            .execution_options(synchronize_session=False)
+        )
+    if diff.exercise_deletes:
+        await db.execute(
+            delete(WorkoutExercise)
+            .where(WorkoutExercise.id.in_(diff.exercise_deletes))
+            .execution_options(synchronize_session=False)
+        )
+    await record_deletions(db, user_id, "workout_exercises", diff.exercise_deletes)
+    await record_deletions(db, user_id, "workout_sets", diff.set_deletes)
+    if diff.exercise_updates:
+        await db.execute(update(WorkoutExercise), diff.exercise_updates)
+    if diff.set_updates:
+        await db.execute(update(WorkoutSet), diff.set_updates)
+
+    set_inserts = list(diff.set_inserts)
+    if diff.exercise_inserts:
+        result = await db.scalars(
+            insert(WorkoutExercise)
+            .returning(WorkoutExercise.id, sort_by_parameter_order=True)
+            .execution_options(render_nulls=True),
+            [{"workout_id": workout_id, "user_id": user_id, **values} for values, _ in diff.exercise_inserts],
+        )
+        for workout_exercise_id, (_, sets) in zip(result.all(), diff.exercise_inserts):
+            set_inserts.extend({"workout_exercise_id": workout_exercise_id, **values} for values in sets)
+    if set_inserts:
+        await db.execute(insert(WorkoutSet), [{"user_id": user_id, **values} for values in set_inserts])
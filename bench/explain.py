@@ -0,0 +1,215 @@
+"""
+EXPLAIN ANALYZE основных запросов API на заполненной базе.
+
+Запросы выполняются тем же кодом, что и в роутерах; каждый выданный SQL
+перехватывается и повторно выполняется с EXPLAIN (ANALYZE, BUFFERS).
+Последовательное сканирование больших таблиц считается регрессией.
+
+Запуск:
+    BENCH_DATABASE_URL=... python -m bench.explain --seed --users 50 --workouts 500
+    BENCH_DATABASE_URL=... python -m bench.explain --output explain.json
+"""
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from app.core.pagination import encode_cursor, keyset_page
+from app.models import Exercise, Workout, WorkoutExercise, WorkoutType
+from app.services.workout_query import select_workout_tree
+from bench.seed import add_seed_arguments, get_bench_database_url, seed_config_from_args, seed_database
+
+# Таблицы, по которым полный просмотр недопустим
+LARGE_TABLES = {"workouts", "workout_exercises", "workout_sets"}
+
+Scenario = Callable[[AsyncSession, int], Awaitable[Any]]
+
+async def _workout_list(db: AsyncSession, user_id: int) -> None:
+    stmt = keyset_page(
+        select_workout_tree().where(Workout.user_id == user_id),
+        Workout.created_at, Workout.id, None, 50, descending=True,
+    )
+    await db.execute(stmt)
+
+async def _workout_list_deep_page(db: AsyncSession, user_id: int) -> None:
+    # Страница из середины истории: проверка, что курсор не деградирует как OFFSET
+    middle = await db.execute(
+        select(Workout.created_at, Workout.id)
+        .where(Workout.user_id == user_id)
+        .order_by(Workout.created_at, Workout.id)
+        .offset(await _count_workouts(db, user_id) // 2)
+        .limit(1)
+    )
+    row = middle.one()
+    stmt = keyset_page(
+        select_workout_tree().where(Workout.user_id == user_id),
+        Workout.created_at, Workout.id, encode_cursor(row.created_at, row.id), 50, descending=True,
+    )
+    await db.execute(stmt)
+
+async def _count_workouts(db: AsyncSession, user_id: int) -> int:
+    return await db.scalar(select(func.count()).select_from(Workout).where(Workout.user_id == user_id))
+
+async def _workout_detail(db: AsyncSession, user_id: int) -> None:
+    workout_id = await db.scalar(select(func.max(Workout.id)).where(Workout.user_id == user_id))
+    await db.execute(select_workout_tree().where(Workout.id == workout_id))
+
+async def _exercise_list(db: AsyncSession, user_id: int) -> None:
+    await db.execute(keyset_page(
+        select(Exercise).where(Exercise.user_id == user_id),
+        Exercise.created_at, Exercise.id, None, 100,
+    ))
+
+async def _exercise_filter(db: AsyncSession, user_id: int) -> None:
+    groups = await db.scalar(
+        select(Exercise.muscle_groups).where(Exercise.user_id == user_id).limit(1)
+    )
+    for condition in (Exercise.muscle_groups.overlap(groups[:1]), Exercise.muscle_groups.contains(groups)):
+        await db.execute(keyset_page(
+            select(Exercise).where(Exercise.user_id == user_id, condition),
+            Exercise.created_at, Exercise.id, None, 100,
+        ))
+
+async def _muscle_group_counts(db: AsyncSession, user_id: int) -> None:
+    groups = (
+        select(func.unnest(Exercise.muscle_groups).label("muscle_group"))
+        .where(Exercise.user_id == user_id)
+        .subquery()
+    )
+    await db.execute(
+        select(groups.c.muscle_group, func.count()).group_by(groups.c.muscle_group)
+    )
+
+async def _workout_type_list(db: AsyncSession, user_id: int) -> None:
+    await db.execute(keyset_page(
+        select(WorkoutType).where(WorkoutType.user_id == user_id),
+        WorkoutType.created_at, WorkoutType.id, None, 100,
+    ))
+
+async def _exercise_history(db: AsyncSession, user_id: int) -> None:
+    exercise_id = await db.scalar(select(func.min(Exercise.id)).where(Exercise.user_id == user_id))
+    await db.execute(
+        select(WorkoutExercise.id)
+        .join(Workout, Workout.id == WorkoutExercise.workout_id)
+        .where(WorkoutExercise.exercise_id == exercise_id, Workout.user_id == user_id)
+    )
+
+SCENARIOS: dict[str, Scenario] = {
+    "workout_list": _workout_list,
+    "workout_list_deep_page": _workout_list_deep_page,
+    "workout_detail": _workout_detail,
+    "exercise_list": _exercise_list,
+    "exercise_filter": _exercise_filter,
+    "muscle_group_counts": _muscle_group_counts,
+    "workout_type_list": _workout_type_list,
+    "exercise_history": _exercise_history,
+}
+
+async def capture_statements(engine: AsyncEngine, scenario: Scenario, user_id: int) -> list[tuple[str, Any]]:
+    """
+    Выполнение сценария с перехватом выданных SQL-запросов.
+
+    Returns:
+        list[tuple[str, Any]]: Пары (SQL, параметры драйвера)
+    """
+    captured: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        async with AsyncSession(engine) as db:
+            await scenario(db, user_id)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    return captured
+
+def _walk_plan(node: dict[str, Any]):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk_plan(child)
+
+async def explain(engine: AsyncEngine, statement: str, parameters: Any) -> dict[str, Any]:
+    """
+    EXPLAIN ANALYZE одного запроса.
+
+    Returns:
+        dict[str, Any]: Время планирования и выполнения, узлы плана и полные сканирования
+    """
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+        )
+        plan = result.scalar_one()
+        await conn.rollback()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    root = plan[0]
+    nodes = list(_walk_plan(root["Plan"]))
+    return {
+        "statement": " ".join(statement.split()),
+        "planning_ms": root["Planning Time"],
+        "execution_ms": root["Execution Time"],
+        "nodes": sorted({
+            f"{node['Node Type']} on {node['Relation Name']}" if "Relation Name" in node else node["Node Type"]
+            for node in nodes
+        }),
+        "seq_scans": sorted({
+            node["Relation Name"] for node in nodes
+            if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in LARGE_TABLES
+        }),
+    }
+
+async def run(engine: AsyncEngine, user_id: int) -> dict[str, list[dict[str, Any]]]:
+    """EXPLAIN ANALYZE всех сценариев для пользователя user_id."""
+    report: dict[str, list[dict[str, Any]]] = {}
+    for name, scenario in SCENARIOS.items():
+        statements = await capture_statements(engine, scenario, user_id)
+        report[name] = [
+            await explain(engine, statement, parameters)
+            for statement, parameters in statements
+            if statement.lstrip().upper().startswith("SELECT")
+        ]
+    return report
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN ANALYZE основных запросов API")
+    parser.add_argument("--seed", action="store_true", help="пересоздать и заполнить базу перед запуском")
+    parser.add_argument("--user-id", type=int, default=1, help="пользователь, от имени которого выполняются запросы")
+    parser.add_argument("--max-ms", type=float, default=50.0, help="порог времени выполнения одного запроса")
+    parser.add_argument("--output", help="файл для отчета в формате JSON")
+    add_seed_arguments(parser)
+    args = parser.parse_args()
+
+    engine = create_async_engine(get_bench_database_url())
+    try:
+        if args.seed:
+            print(f"Seeded: {await seed_database(engine, seed_config_from_args(args))}")
+        report = await run(engine, args.user_id)
+    finally:
+        await engine.dispose()
+
+    failures = []
+    for name, plans in report.items():
+        for plan in plans:
+            print(f"{name:24} {plan['execution_ms']:8.2f} ms  {', '.join(plan['nodes'])}")
+            if plan["seq_scans"]:
+                failures.append(f"{name}: Seq Scan on {', '.join(plan['seq_scans'])}")
+            if plan["execution_ms"] > args.max_ms:
+                failures.append(f"{name}: {plan['execution_ms']:.2f} ms > {args.max_ms} ms")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for failure in failures:
+        print(f"REGRESSION {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,330 @@
+"""
+Нагрузочный прогон API: смесь входа, списка тренировок и изменения тренировки.
+
+Виртуальные пользователи (--concurrency) входят под пользователями набора
+данных bench.seed и выполняют сценарии, выбранные случайно по весам --mix.
+Запросы идут в приложение в этом же процессе (httpx ASGITransport, база из
+BENCH_DATABASE_URL) или на запущенный сервер (--base-url). Для каждого
+сценария считаются пропускная способность, перцентили времени ответа и
+количество выражений SQL из заголовка Server-Timing.
+
+Запуск:
+    BENCH_DATABASE_URL=... python -m bench.load --seed --users 20 --workouts 200 --output load.json
+    python -m bench.load --base-url http://localhost:8000 --users 20 --duration 60
+    BENCH_DATABASE_URL=... python -m bench.load --compare load.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from bench.seed import (
+    BENCH_PASSWORD,
+    add_seed_arguments,
+    get_bench_database_url,
+    seed_config_from_args,
+    seed_database,
+    user_email,
+)
+
+API = "/api/v1"
+DB_TIMING_RE = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+@dataclass
+class ScenarioStats:
+    """
+    Результаты одного сценария.
+
+    Атрибуты:
+        latencies (list[float]): Время ответа, сек
+        queries (list[int]): Выражений SQL на запрос
+        db_time (list[float]): Время БД на запрос, мс
+        errors (int): Ответы с кодом 4xx/5xx и ошибки соединения
+    """
+    latencies: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    db_time: list[float] = field(default_factory=list)
+    errors: int = 0
+
+@dataclass
+class VirtualUser:
+    """
+    Виртуальный пользователь: учетная запись набора данных и ее тренировки.
+
+    Атрибуты:
+        email (str): Email для входа
+        headers (dict[str, str]): Заголовок авторизации
+        workout_ids (list[int]): ID тренировок для изменения
+    """
+    email: str
+    headers: dict[str, str] = field(default_factory=dict)
+    workout_ids: list[int] = field(default_factory=list)
+
+class LoadRunner:
+    """
+    Выполнение сценариев и сбор статистики.
+
+    Атрибуты:
+        client (httpx.AsyncClient): Клиент API
+        stats (dict[str, ScenarioStats]): Статистика по сценариям
+    """
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self.client = client
+        self.stats: dict[str, ScenarioStats] = {name: ScenarioStats() for name in SCENARIOS}
+
+    async def request(self, scenario: str, method: str, url: str, **kwargs: Any) -> Optional[httpx.Response]:
+        """
+        Запрос с замером времени; ответ учитывается в статистике сценария.
+
+        Returns:
+            Optional[httpx.Response]: Ответ или None при ошибке соединения
+        """
+        stats = self.stats[scenario]
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            stats.errors += 1
+            return None
+        stats.latencies.append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            stats.errors += 1
+        timing = DB_TIMING_RE.search(response.headers.get("Server-Timing", ""))
+        if timing is not None:
+            stats.db_time.append(float(timing.group(1)))
+            stats.queries.append(int(timing.group(2)))
+        return response
+
+    async def login(self, user: VirtualUser) -> None:
+        response = await self.request(
+            "login", "POST", f"{API}/auth/login", data={"username": user.email, "password": BENCH_PASSWORD}
+        )
+        if response is not None and response.status_code == 200:
+            user.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    async def list_workouts(self, user: VirtualUser, rng: random.Random) -> None:
+        response = await self.request(
+            "list_workouts", "GET", f"{API}/workouts/", params={"limit": 20}, headers=user.headers
+        )
+        if response is not None and response.status_code == 200 and not user.workout_ids:
+            user.workout_ids = [workout["id"] for workout in response.json()]
+
+    async def patch_workout(self, user: VirtualUser, rng: random.Random) -> None:
+        if not user.workout_ids:
+            await self.list_workouts(user, rng)
+            return
+        workout_id = rng.choice(user.workout_ids)
+        await self.request(
+            "patch_workout", "PATCH", f"{API}/workouts/{workout_id}",
+            json={"name": f"Workout {rng.randrange(1_000_000)}"}, headers=user.headers,
+        )
+
+    async def relogin(self, user: VirtualUser, rng: random.Random) -> None:
+        await self.login(user)
+
+Scenario = Callable[[LoadRunner, VirtualUser, random.Random], Awaitable[None]]
+
+SCENARIOS: dict[str, Scenario] = {
+    "login": LoadRunner.relogin,
+    "list_workouts": LoadRunner.list_workouts,
+    "patch_workout": LoadRunner.patch_workout,
+}
+
+DEFAULT_MIX = "list_workouts=70,patch_workout=25,login=5"
+
+def parse_mix(value: str) -> dict[str, float]:
+    """
+    Веса сценариев из строки вида "list_workouts=70,patch_workout=25,login=5".
+
+    Raises:
+        argparse.ArgumentTypeError: Если сценарий неизвестен или вес не число
+    """
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Неизвестный сценарий '{name}': {', '.join(SCENARIOS)}")
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Вес сценария '{name}' должен быть числом")
+    return mix
+
+async def run_load(
+    client: httpx.AsyncClient,
+    users: int,
+    concurrency: int,
+    duration: float,
+    mix: dict[str, float],
+    seed: int,
+) -> tuple[LoadRunner, float]:
+    """
+    Нагрузочный прогон.
+
+    Args:
+        client (httpx.AsyncClient): Клиент API
+        users (int): Пользователей в наборе данных
+        concurrency (int): Виртуальных пользователей
+        duration (float): Длительность, сек
+        mix (dict[str, float]): Веса сценариев
+        seed (int): Seed генератора случайных чисел
+
+    Returns:
+        tuple[LoadRunner, float]: Статистика и фактическая длительность, сек
+    """
+    runner = LoadRunner(client)
+    names, weights = list(mix), list(mix.values())
+
+    async def virtual_user(index: int) -> None:
+        rng = random.Random(seed * 1000 + index)
+        user = VirtualUser(email=user_email(index % users + 1))
+        await runner.login(user)
+        while time.perf_counter() < deadline:
+            scenario = SCENARIOS[rng.choices(names, weights)[0]]
+            await scenario(runner, user, rng)
+
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*(virtual_user(i) for i in range(concurrency)))
+    return runner, time.perf_counter() - started
+
+def percentile(values: list[float], q: float) -> float:
+    """Перцентиль q (0..100) методом ближайшего ранга."""
+    ordered = sorted(values)
+    return ordered[max(int(round(q / 100 * len(ordered))) - 1, 0)]
+
+def summarize(runner: LoadRunner, elapsed: float) -> dict[str, dict[str, Any]]:
+    """
+    Итог по сценариям: запросы в секунду, перцентили в мс, выражения SQL.
+
+    Returns:
+        dict[str, dict[str, Any]]: Итог по сценариям с непустой статистикой
+    """
+    summary = {}
+    for name, stats in runner.stats.items():
+        if not stats.latencies:
+            continue
+        latencies_ms = [latency * 1000 for latency in stats.latencies]
+        summary[name] = {
+            "requests": len(latencies_ms),
+            "errors": stats.errors,
+            "rps": round(len(latencies_ms) / elapsed, 2),
+            "p50_ms": round(percentile(latencies_ms, 50), 3),
+            "p90_ms": round(percentile(latencies_ms, 90), 3),
+            "p99_ms": round(percentile(latencies_ms, 99), 3),
+            "max_ms": round(max(latencies_ms), 3),
+            "queries_avg": round(sum(stats.queries) / len(stats.queries), 2) if stats.queries else None,
+            "queries_max": max(stats.queries) if stats.queries else None,
+            "db_ms_avg": round(sum(stats.db_time) / len(stats.db_time), 3) if stats.db_time else None,
+        }
+    return summary
+
+def git_revision() -> Optional[str]:
+    """Текущий коммит для сравнения прогонов."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def print_comparison(report: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """Изменение rps, p50 и p99 относительно сохраненного прогона."""
+    print(f"\nСравнение с {baseline.get('revision')} ({baseline.get('started_at')}):")
+    for name, current in report["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+        deltas = []
+        for key in ("rps", "p50_ms", "p99_ms", "queries_avg"):
+            if current[key] is None or not previous.get(key):
+                continue
+            deltas.append(f"{key} {previous[key]} -> {current[key]} ({(current[key] / previous[key] - 1) * 100:+.1f}%)")
+        print(f"{name:16} {'; '.join(deltas)}")
+
+def asgi_client(engine: AsyncEngine) -> httpx.AsyncClient:
+    """Клиент приложения в этом же процессе с сессиями базы бенчмарков."""
+    from app.database.session import get_db, get_session_factory
+    from app.main import app
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def bench_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = bench_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон API")
+    parser.add_argument("--seed", action="store_true", help="пересоздать и заполнить базу перед запуском")
+    parser.add_argument("--base-url", help="адрес запущенного сервера; без него приложение запускается в процессе")
+    parser.add_argument("--concurrency", type=int, default=10, help="виртуальных пользователей")
+    parser.add_argument("--duration", type=float, default=30.0, help="длительность прогона, сек")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX), help=f"веса сценариев, по умолчанию {DEFAULT_MIX}")
+    parser.add_argument("--output", help="файл для отчета в формате JSON")
+    parser.add_argument("--compare", help="отчет предыдущего прогона для сравнения")
+    add_seed_arguments(parser)
+    args = parser.parse_args()
+    config = seed_config_from_args(args)
+
+    engine = None
+    if args.seed or not args.base_url:
+        engine = create_async_engine(get_bench_database_url())
+    try:
+        if args.seed:
+            print(f"Seeded: {await seed_database(engine, config)}")
+        if args.base_url:
+            client = httpx.AsyncClient(base_url=args.base_url, timeout=30)
+        else:
+            client = asgi_client(engine)
+        started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        async with client:
+            runner, elapsed = await run_load(
+                client, config.users, args.concurrency, args.duration, args.mix, config.seed
+            )
+    finally:
+        if engine is not None:
+            await engine.dispose()
+
+    report = {
+        "revision": git_revision(),
+        "started_at": started_at,
+        "target": args.base_url or "asgi",
+        "concurrency": args.concurrency,
+        "duration_s": round(elapsed, 3),
+        "mix": args.mix,
+        "dataset": {"users": config.users, "workouts": config.workouts, "seed": config.seed},
+        "scenarios": summarize(runner, elapsed),
+    }
+    print(f"{'scenario':16} {'requests':>8} {'errors':>6} {'rps':>8} {'p50':>8} {'p90':>8} {'p99':>8} {'queries':>7}")
+    for name, row in report["scenarios"].items():
+        print(
+            f"{name:16} {row['requests']:8} {row['errors']:6} {row['rps']:8.1f} "
+            f"{row['p50_ms']:8.2f} {row['p90_ms']:8.2f} {row['p99_ms']:8.2f} {row['queries_avg'] or '-':>7}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            print_comparison(report, json.load(f))
+    errors = sum(row["errors"] for row in report["scenarios"].values())
+    return 1 if errors else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
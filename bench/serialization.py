@@ -0,0 +1,146 @@
+"""
+Сравнение сериализации списка тренировок: стандартный путь FastAPI
+(валидация response_model, jsonable_encoder, json.dumps) и TypeAdapter.
+
+Дерево тренировок строится из ORM-объектов в памяти, база данных не нужна.
+
+Запуск:
+    python -m bench.serialization --workouts 500 --exercises 6 --sets 4
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.core.serialization import dump_json, get_type_adapter, orjson
+from app.models import Exercise, Workout, WorkoutExercise, WorkoutSet, WorkoutType
+from app.schemas.workout import WorkoutResponse
+
+def build_workouts(workouts: int, exercises: int, sets: int) -> list[Workout]:
+    """
+    Построение дерева тренировок без обращения к базе данных.
+
+    Args:
+        workouts (int): Количество тренировок
+        exercises (int): Упражнений в тренировке
+        sets (int): Подходов в упражнении
+
+    Returns:
+        list[Workout]: Тренировки с типом, упражнениями и подходами
+    """
+    started = datetime(2024, 1, 1)
+    workout_type = WorkoutType(
+        id=1, name="Strength", description="Силовая", icon_url=None, user_id=1, created_at=started
+    )
+    catalog = [
+        Exercise(id=i, name=f"Exercise {i}", description=None, muscle_groups=["legs", "back"], user_id=1)
+        for i in range(1, exercises + 1)
+    ]
+    result = []
+    for w in range(workouts):
+        workout = Workout(
+            id=w + 1,
+            name=f"Workout {w}",
+            description="Тренировка",
+            workout_type_id=1,
+            user_id=1,
+            created_at=started + timedelta(days=w),
+        )
+        workout.workout_type = workout_type
+        for e, exercise in enumerate(catalog):
+            workout_exercise = WorkoutExercise(
+                id=w * exercises + e + 1, workout_id=workout.id, exercise_id=exercise.id, notes=None
+            )
+            workout_exercise.exercise = exercise
+            workout_exercise.sets = [
+                WorkoutSet(
+                    id=(w * exercises + e) * sets + s + 1,
+                    workout_exercise_id=workout_exercise.id,
+                    set_number=s + 1,
+                    weight=60 + s * 5,
+                    reps=10 - s,
+                )
+                for s in range(sets)
+            ]
+            workout.exercises.append(workout_exercise)
+        result.append(workout)
+    return result
+
+_loop = asyncio.new_event_loop()
+_response_field = create_response_field(name="response", type_=list[WorkoutResponse])
+
+def default_path(workouts: list[Workout]) -> bytes:
+    """Путь FastAPI для маршрута с response_model=list[WorkoutResponse]."""
+    content = _loop.run_until_complete(
+        serialize_response(field=_response_field, response_content=workouts, is_coroutine=True)
+    )
+    return JSONResponse(content).body
+
+def adapter_path(workouts: list[Workout]) -> bytes:
+    """TypeAdapter: одна валидация и сериализация pydantic-core в байты."""
+    return dump_json(list[WorkoutResponse], workouts)
+
+def adapter_orjson_path(workouts: list[Workout]) -> bytes:
+    """TypeAdapter для валидации и orjson для кодирования."""
+    adapter = get_type_adapter(list[WorkoutResponse])
+    return orjson.dumps(adapter.dump_python(adapter.validate_python(workouts, from_attributes=True)))
+
+def measure(func: Callable[[list[Workout]], bytes], workouts: list[Workout], repeat: int) -> dict[str, Any]:
+    """
+    Замер времени сериализации.
+
+    Args:
+        func (Callable): Способ сериализации
+        workouts (list[Workout]): Тренировки
+        repeat (int): Количество повторов
+
+    Returns:
+        dict[str, Any]: Медиана и минимум в миллисекундах, размер ответа
+    """
+    body = func(workouts)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(workouts)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "bytes": len(body),
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Сравнение сериализации WorkoutResponse")
+    parser.add_argument("--workouts", type=int, default=500, help="тренировок в ответе")
+    parser.add_argument("--exercises", type=int, default=6, help="упражнений в тренировке")
+    parser.add_argument("--sets", type=int, default=4, help="подходов в упражнении")
+    parser.add_argument("--repeat", type=int, default=20, help="количество замеров")
+    args = parser.parse_args()
+
+    workouts = build_workouts(args.workouts, args.exercises, args.sets)
+    paths: dict[str, Callable[[list[Workout]], bytes]] = {
+        "fastapi_default": default_path,
+        "type_adapter": adapter_path,
+    }
+    if orjson is not None:
+        paths["type_adapter_orjson"] = adapter_orjson_path
+
+    baseline = None
+    for name, func in paths.items():
+        result = measure(func, workouts, args.repeat)
+        baseline = baseline or result["median_ms"]
+        print(
+            f"{name:22} {result['median_ms']:9.2f} ms (min {result['min_ms']:.2f})"
+            f"  x{baseline / result['median_ms']:.1f}  {result['bytes']} bytes"
+        )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""add keyset pagination indexes
+
+Revision ID: 3f1c2a7b9d04
+Revises: 89489902da6f
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a7b9d04'
+down_revision: Union[str, None] = '89489902da6f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_workouts_user_id_created_at_id', 'workouts', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_exercises_user_id_created_at_id', 'exercises', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_workout_types_user_id_created_at_id', 'workout_types', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workout_types_user_id_created_at_id', table_name='workout_types')
+    op.drop_index('ix_exercises_user_id_created_at_id', table_name='exercises')
+    op.drop_index('ix_workouts_user_id_created_at_id', table_name='workouts')
@@ -0,0 +1,40 @@
+"""add foreign key indexes
+
+Revision ID: b7e4d15a62c8
+Revises: 3f1c2a7b9d04
+Create Date: 2026-10-18 09:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4d15a62c8'
+down_revision: Union[str, None] = '3f1c2a7b9d04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (имя индекса, таблица, колонки)
+# Список тренировок пользователя по (user_id, created_at) уже покрыт
+# индексом ix_workouts_user_id_created_at_id из ревизии 3f1c2a7b9d04.
+INDEXES = [
+    ('ix_workouts_workout_type_id', 'workouts', ['workout_type_id']),
+    ('ix_workout_exercises_workout_id', 'workout_exercises', ['workout_id']),
+    ('ix_workout_exercises_exercise_id_workout_id', 'workout_exercises', ['exercise_id', 'workout_id']),
+    ('ix_workout_sets_workout_exercise_id_set_number', 'workout_sets', ['workout_exercise_id', 'set_number']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY не блокирует запись в таблицы, но не может выполняться в транзакции
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""add training summaries
+
+Revision ID: 9a6b3f17c2e5
+Revises: 5d2e8c41a7f3
+Create Date: 2026-10-18 10:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a6b3f17c2e5'
+down_revision: Union[str, None] = '5d2e8c41a7f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Таблица создается пустой; заполнение по истории:
+#     python -m scripts.rebuild_summaries
+def upgrade() -> None:
+    op.create_table(
+        'training_summaries',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('period', sa.String(length=5), nullable=False),
+        sa.Column('period_start', sa.Date(), nullable=False),
+        sa.Column('muscle_group', sa.String(), nullable=False),
+        sa.Column('volume', sa.BigInteger(), nullable=False),
+        sa.Column('sets', sa.Integer(), nullable=False),
+        sa.Column('reps', sa.Integer(), nullable=False),
+        sa.Column('workouts', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'period', 'period_start', 'muscle_group'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('training_summaries')
@@ -0,0 +1,74 @@
+"""add sync versions and tombstones
+
+Revision ID: e8f05b3d6a21
+Revises: c41d7e2a9b36
+Create Date: 2026-10-18 11:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8f05b3d6a21'
+down_revision: Union[str, None] = 'c41d7e2a9b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Таблицы ленты синхронизации и колонка, из которой заполняется updated_at
+SYNCED_TABLES = {
+    'workout_types': 'created_at',
+    'exercises': 'created_at',
+    'workouts': 'created_at',
+    'workout_exercises': None,
+    'workout_sets': None,
+}
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence('sync_version_seq')))
+    for table, created_at in SYNCED_TABLES.items():
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute(
+            f"UPDATE {table} SET updated_at = "
+            + (created_at if created_at else "timezone('utc', now())")
+        )
+        op.alter_column(table, 'updated_at', nullable=False)
+        # Существующие строки получают версии из последовательности
+        op.add_column(table, sa.Column(
+            'sync_version', sa.BigInteger(),
+            server_default=sa.text("nextval('sync_version_seq')"), nullable=False,
+        ))
+    op.create_index('ix_workout_types_user_id_sync_version', 'workout_types', ['user_id', 'sync_version'])
+    op.create_index('ix_exercises_user_id_sync_version', 'exercises', ['user_id', 'sync_version'])
+    op.create_index('ix_workouts_user_id_sync_version', 'workouts', ['user_id', 'sync_version'])
+    op.create_index('ix_workout_exercises_sync_version', 'workout_exercises', ['sync_version'])
+    op.create_index('ix_workout_sets_sync_version', 'workout_sets', ['sync_version'])
+
+    op.create_table(
+        'sync_tombstones',
+        sa.Column('sync_version', sa.BigInteger(), server_default=sa.text("nextval('sync_version_seq')"), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('entity', sa.String(length=32), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('sync_version'),
+    )
+    op.create_index('ix_sync_tombstones_user_id_sync_version', 'sync_tombstones', ['user_id', 'sync_version'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sync_tombstones_user_id_sync_version', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+    op.drop_index('ix_workout_sets_sync_version', table_name='workout_sets')
+    op.drop_index('ix_workout_exercises_sync_version', table_name='workout_exercises')
+    op.drop_index('ix_workouts_user_id_sync_version', table_name='workouts')
+    op.drop_index('ix_exercises_user_id_sync_version', table_name='exercises')
+    op.drop_index('ix_workout_types_user_id_sync_version', table_name='workout_types')
+    for table in SYNCED_TABLES:
+        op.drop_column(table, 'sync_version')
+        op.drop_column(table, 'updated_at')
+    op.execute(sa.schema.DropSequence(sa.Sequence('sync_version_seq')))
@@ -0,0 +1,32 @@
+"""add muscle group indexes
+
+Revision ID: 7f3a1c5e9b42
+Revises: 2b7c9e4f1d58
+Create Date: 2026-10-18 12:30:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a1c5e9b42'
+down_revision: Union[str, None] = '2b7c9e4f1d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_exercises_muscle_groups', 'exercises', ['muscle_groups'], postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_exercises_user_id_muscle_groups', 'exercises', ['user_id'],
+        postgresql_include=['muscle_groups'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exercises_user_id_muscle_groups', table_name='exercises')
+    op.drop_index('ix_exercises_muscle_groups', table_name='exercises')
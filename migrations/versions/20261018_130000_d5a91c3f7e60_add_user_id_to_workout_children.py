@@ -0,0 +1,46 @@
+"""add user_id to workout exercises and sets
+
+Revision ID: d5a91c3f7e60
+Revises: 7f3a1c5e9b42
+Create Date: 2026-10-18 13:00:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a91c3f7e60'
+down_revision: Union[str, None] = '7f3a1c5e9b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Владелец копируется из workouts: лента изменений читает строки
+    # пользователя по (user_id, sync_version) без соединения с workouts
+    op.add_column('workout_exercises', sa.Column('user_id', sa.Integer(), nullable=True))
+    op.add_column('workout_sets', sa.Column('user_id', sa.Integer(), nullable=True))
+    op.execute(
+        "UPDATE workout_exercises SET user_id = workouts.user_id "
+        "FROM workouts WHERE workouts.id = workout_exercises.workout_id"
+    )
+    op.execute(
+        "UPDATE workout_sets SET user_id = workout_exercises.user_id "
+        "FROM workout_exercises WHERE workout_exercises.id = workout_sets.workout_exercise_id"
+    )
+    for table in ('workout_exercises', 'workout_sets'):
+        op.alter_column(table, 'user_id', nullable=False)
+        op.create_foreign_key(f'{table}_user_id_fkey', table, 'users', ['user_id'], ['id'])
+        op.drop_index(f'ix_{table}_sync_version', table_name=table)
+        op.create_index(f'ix_{table}_user_id_sync_version', table, ['user_id', 'sync_version'])
+
+
+def downgrade() -> None:
+    for table in ('workout_sets', 'workout_exercises'):
+        op.drop_index(f'ix_{table}_user_id_sync_version', table_name=table)
+        op.create_index(f'ix_{table}_sync_version', table, ['sync_version'])
+        op.drop_constraint(f'{table}_user_id_fkey', table, type_='foreignkey')
+        op.drop_column(table, 'user_id')
@@ -0,0 +1,54 @@
+"""
+Пересчет личных рекордов по истории подходов.
+
+Нужен после миграции, добавившей таблицы рекордов, и после правок
+workout_sets в обход API. Пересчет выполняется в одной транзакции.
+
+Запуск:
+    python -m scripts.rebuild_records
+    python -m scripts.rebuild_records --user-id 42
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import Optional
+
+from sqlalchemy import func, select
+
+from app.database.session import AsyncSessionLocal, engine
+from app.models.personal_record import PersonalRecord
+from app.services.records import recompute_records
+
+async def rebuild(user_id: Optional[int]) -> int:
+    """
+    Пересчет рекордов одного или всех пользователей.
+
+    Args:
+        user_id (int, опционально): ID пользователя; None - все пользователи
+
+    Returns:
+        int: Количество строк personal_records после пересчета
+    """
+    async with AsyncSessionLocal() as session:
+        await recompute_records(session, user_id)
+        stmt = select(func.count()).select_from(PersonalRecord)
+        if user_id is not None:
+            stmt = stmt.where(PersonalRecord.user_id == user_id)
+        count = await session.scalar(stmt)
+        await session.commit()
+    await engine.dispose()
+    return count
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Пересчет личных рекордов")
+    parser.add_argument("--user-id", type=int, default=None, help="только этот пользователь")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    count = asyncio.run(rebuild(args.user_id))
+    print(f"personal_records: {count} rows in {time.perf_counter() - started:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Пересчет недельных и месячных сводок по истории тренировок.
+
+Нужен после миграции, добавившей training_summaries, и после правок
+тренировок в обход API. Пересчет выполняется в одной транзакции.
+
+Запуск:
+    python -m scripts.rebuild_summaries
+    python -m scripts.rebuild_summaries --user-id 42
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import Optional
+
+from sqlalchemy import func, select
+
+from app.database.session import AsyncSessionLocal, engine
+from app.models.training_summary import TrainingSummary
+from app.services.summaries import refresh_summaries
+
+async def rebuild(user_id: Optional[int]) -> int:
+    """
+    Пересчет сводок одного или всех пользователей.
+
+    Args:
+        user_id (int, опционально): ID пользователя; None - все пользователи
+
+    Returns:
+        int: Количество строк training_summaries после пересчета
+    """
+    async with AsyncSessionLocal() as session:
+        await refresh_summaries(session, user_id)
+        stmt = select(func.count()).select_from(TrainingSummary)
+        if user_id is not None:
+            stmt = stmt.where(TrainingSummary.user_id == user_id)
+        count = await session.scalar(stmt)
+        await session.commit()
+    await engine.dispose()
+    return count
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Пересчет сводок тренировок")
+    parser.add_argument("--user-id", type=int, default=None, help="только этот пользователь")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    count = asyncio.run(rebuild(args.user_id))
+    print(f"training_summaries: {count} rows in {time.perf_counter() - started:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,5 +22,8 @@ setup(
         "email-validator==2.1.0",
         "passlib[bcrypt]==1.7.4",
         "python-jose[cryptography]==3.3.0",
+        "numpy==1.26.4",
+        "orjson==3.9.15",
+        "prometheus-client==0.20.0",
     ],
 ) 
\ No newline at end of file
@@ -120,4 +120,103 @@ async def test_get_current_user(ac: AsyncClient, auth_headers: dict):
     data = response.json()
     assert data["email"] == "test@example.com"
     assert data["username"] == "testuser"
-    assert "password" not in data 
\ No newline at end of file
+    assert "password" not in data 
+async def test_current_user_cache(ac: AsyncClient, auth_headers: dict, count_queries):
+    """Test that the user lookup is cached between requests."""
+    await ac.get("/api/v1/workouts/", headers=auth_headers)
+    with count_queries() as statements:
+        response = await ac.get("/api/v1/workouts/", headers=auth_headers)
+    assert response.status_code == 200
+    assert not any("users.username" in statement for statement in statements)
+
+async def test_current_user_cache_invalidation(ac: AsyncClient, auth_headers: dict):
+    """Test that profile changes are visible right after the update."""
+    response = await ac.get("/api/v1/users/me", headers=auth_headers)
+    assert response.json()["email"] == "test@example.com"
+
+    response = await ac.put(
+        "/api/v1/users/me", json={"email": "changed@example.com"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    response = await ac.get("/api/v1/users/me", headers=auth_headers)
+    assert response.json()["email"] == "changed@example.com"
+
+    response = await ac.delete("/api/v1/users/me", headers=auth_headers)
+    assert response.status_code == 200
+    response = await ac.get("/api/v1/workouts/", headers=auth_headers)
+    assert response.status_code == 401
+
+async def test_token_claims(ac: AsyncClient, auth_headers: dict, count_queries, monkeypatch):
+    """Test resolving the user from token claims without a database lookup."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "AUTH_TOKEN_CLAIMS", True)
+    response = await ac.post(
+        "/api/v1/auth/login",
+        data={"username": "test@example.com", "password": "testpass123"}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    with count_queries() as statements:
+        response = await ac.get("/api/v1/workouts/", headers=headers)
+    assert response.status_code == 200
+    # Версия данных для кэша ответов и сам список; пользователь по имени не ищется
+    assert len(statements) == 2
+    assert all("users.username" not in statement for statement in statements)
+
+    # Профиль всегда читается из БД
+    response = await ac.get("/api/v1/users/me", headers=headers)
+    assert response.json()["email"] == "test@example.com"
+
+    token = create_access_token({"sub": "testuser", "uid": 1, "active": False})
+    response = await ac.get("/api/v1/workouts/", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 400
+
+async def test_login_rehashes_outdated_password(ac: AsyncClient, auth_headers: dict):
+    """Test that a hash with outdated bcrypt cost is replaced on login."""
+    from passlib.context import CryptContext
+    from sqlalchemy import select, update
+    from app.core.security import pwd_context
+    from app.database.session import get_db
+    from app.main import app
+
+    outdated = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash("testpass123")
+    assert pwd_context.needs_update(outdated)
+    async for session in app.dependency_overrides[get_db]():
+        await session.execute(update(User).values(hashed_password=outdated))
+        await session.commit()
+
+    response = await ac.post(
+        "/api/v1/auth/login",
+        data={"username": "test@example.com", "password": "testpass123"}
+    )
+    assert response.status_code == 200
+
+    async for session in app.dependency_overrides[get_db]():
+        hashed_password = await session.scalar(select(User.hashed_password))
+    assert hashed_password != outdated
+    assert not pwd_context.needs_update(hashed_password)
+    assert pwd_context.verify("testpass123", hashed_password)
+
+async def test_password_hasher_queue_limit(monkeypatch):
+    """Test bounded concurrency and queue overflow of the password hasher."""
+    import asyncio
+    from fastapi import HTTPException
+    from app.core.config import settings
+    from app.core.security import hash_password, password_hasher_stats
+
+    password_hasher_stats.reset()
+    hashes = await asyncio.gather(*(hash_password(f"password-{i}") for i in range(10)))
+    assert len(set(hashes)) == 10
+    stats = password_hasher_stats.as_dict()
+    assert stats["completed"] == 10
+    assert stats["waiting"] == stats["running"] == 0
+    assert stats["max_waiting"] >= 10 - settings.PASSWORD_HASH_WORKERS
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_QUEUE", 2)
+    results = await asyncio.gather(
+        *(hash_password("password") for _ in range(10)), return_exceptions=True
+    )
+    rejected = [r for r in results if isinstance(r, HTTPException)]
+    assert rejected and all(r.status_code == 503 for r in rejected)
+    assert password_hasher_stats.rejected == len(rejected)
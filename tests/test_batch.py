@@ -0,0 +1,145 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.routers import exercise
+from app.routers.batch import BATCH_ROUTES
+
+pytestmark = pytest.mark.asyncio
+
+async def create_workout(ac: AsyncClient, auth_headers: dict) -> tuple[dict, int]:
+    """Создание тренировки с одним упражнением и ID второго упражнения каталога."""
+    response = await ac.post("/api/v1/workout-types/", json={"name": "Legs"}, headers=auth_headers)
+    workout_type_id = response.json()["id"]
+    exercise_ids = []
+    for name in ("Squat", "Lunge"):
+        response = await ac.post("/api/v1/exercises/", json={"name": name}, headers=auth_headers)
+        exercise_ids.append(response.json()["id"])
+    response = await ac.post(
+        "/api/v1/workouts/",
+        json={
+            "name": "Day 1",
+            "workout_type_id": workout_type_id,
+            "exercises": [{
+                "exercise_id": exercise_ids[0],
+                "sets": [{"set_number": 1, "weight": 100, "reps": 5}],
+            }],
+        },
+        headers=auth_headers
+    )
+    return response.json(), exercise_ids[1]
+
+async def test_batch_operations(ac: AsyncClient, auth_headers: dict, count_queries):
+    """Тест выполнения операций пакета в одной транзакции."""
+    workout, lunge_id = await create_workout(ac, auth_headers)
+    workout_id = workout["id"]
+    squat = workout["exercises"][0]
+
+    with count_queries() as statements:
+        response = await ac.post("/api/v1/batch/", json={"operations": [
+            {
+                "method": "POST",
+                "path": f"/workouts/{workout_id}/exercises",
+                "body": {"exercise_id": lunge_id, "sets": [{"set_number": 1, "weight": 40, "reps": 12}]},
+            },
+            {
+                "method": "PUT",
+                "path": f"/workouts/{workout_id}/exercises/{squat['id']}",
+                "body": {"sets": [
+                    {"id": squat["sets"][0]["id"], "reps": 6},
+                    {"set_number": 2, "weight": 110, "reps": 3},
+                ]},
+            },
+            {"method": "PATCH", "path": f"/workouts/{workout_id}", "body": {"name": "Leg day"}},
+            {"method": "POST", "path": "/exercises", "body": {"name": "Calf raise"}},
+        ]}, headers=auth_headers)
+    assert response.status_code == 200
+    batch = response.json()
+    assert batch["committed"]
+    assert [result["status"] for result in batch["results"]] == [200, 200, 200, 201]
+    assert batch["results"][0]["body"]["exercise_id"] == lunge_id
+    assert [s["reps"] for s in batch["results"][1]["body"]["sets"]] == [6, 3]
+    assert batch["results"][3]["body"]["name"] == "Calf raise"
+    # Каждая операция выполняется в своем SAVEPOINT
+    assert sum(statement.startswith("RELEASE SAVEPOINT") for statement in statements) == 4
+
+    response = await ac.get(f"/api/v1/workouts/{workout_id}", headers=auth_headers)
+    stored = response.json()
+    assert stored["name"] == "Leg day"
+    assert [len(exercise["sets"]) for exercise in stored["exercises"]] == [2, 1]
+
+async def test_batch_atomic_rollback(ac: AsyncClient, auth_headers: dict):
+    """Тест отката всего атомарного пакета при ошибке операции."""
+    response = await ac.post("/api/v1/batch/", json={"operations": [
+        {"method": "POST", "path": "/exercises/", "body": {"name": "Deadlift"}},
+        {"method": "DELETE", "path": "/workouts/999999"},
+        {"method": "POST", "path": "/exercises/", "body": {"name": "Row"}},
+    ]}, headers=auth_headers)
+    batch = response.json()
+    assert not batch["committed"]
+    assert [result["status"] for result in batch["results"]] == [201, 404]
+
+    response = await ac.get("/api/v1/exercises/", headers=auth_headers)
+    assert response.json() == []
+
+async def test_batch_partial(ac: AsyncClient, auth_headers: dict):
+    """Тест неатомарного пакета: откатывается только ошибочная операция."""
+    response = await ac.post("/api/v1/batch/", json={"atomic": False, "operations": [
+        {"method": "POST", "path": "/exercises/", "body": {"name": "Deadlift"}},
+        {"method": "POST", "path": "/exercises/", "body": {"name": "Deadlift"}},
+        {"method": "POST", "path": "/exercises/", "body": {}},
+        {"method": "PATCH", "path": "/exercises/1", "body": {"name": "Row"}},
+        {"method": "POST", "path": "/users/me"},
+        {"method": "POST", "path": "/exercises/", "body": {"name": "Row"}},
+    ]}, headers=auth_headers)
+    batch = response.json()
+    assert batch["committed"]
+    assert [result["status"] for result in batch["results"]] == [201, 400, 422, 405, 404, 201]
+
+    response = await ac.get("/api/v1/exercises/", headers=auth_headers)
+    assert sorted(exercise["name"] for exercise in response.json()) == ["Deadlift", "Row"]
+
+async def test_batch_database_errors(ac: AsyncClient, auth_headers: dict, monkeypatch):
+    """Тест: ошибка БД откатывает только SAVEPOINT операции."""
+    workout, _ = await create_workout(ac, auth_headers)
+    squat_id = workout["exercises"][0]["exercise_id"]
+
+    async def broken_endpoint(db, current_user, **kwargs):
+        await db.execute(text("SELECT * FROM missing_table"))
+
+    # Упражнение используется в тренировке: нарушение ограничения при удалении
+    response = await ac.post("/api/v1/batch/", json={"atomic": False, "operations": [
+        {"method": "DELETE", "path": f"/exercises/{squat_id}"},
+        {"method": "PATCH", "path": f"/workouts/{workout['id']}", "body": {"name": "Leg day"}},
+    ]}, headers=auth_headers)
+    batch = response.json()
+    assert batch["committed"]
+    assert [result["status"] for result in batch["results"]] == [409, 200]
+
+    route = next(route for route in BATCH_ROUTES if route.endpoint is exercise.create_exercise)
+    monkeypatch.setattr(route, "endpoint", broken_endpoint)
+    response = await ac.post("/api/v1/batch/", json={"atomic": False, "operations": [
+        {"method": "POST", "path": "/exercises/", "body": {"name": "Row"}},
+        {"method": "PATCH", "path": f"/workouts/{workout['id']}", "body": {"name": "Leg day 2"}},
+    ]}, headers=auth_headers)
+    batch = response.json()
+    assert batch["committed"]
+    assert [result["status"] for result in batch["results"]] == [500, 200]
+
+    response = await ac.get(f"/api/v1/workouts/{workout['id']}", headers=auth_headers)
+    assert response.json()["name"] == "Leg day 2"
+    assert len(response.json()["exercises"]) == 1
+
+async def test_batch_foreign_delete(ac: AsyncClient, auth_headers: dict, other_headers: dict):
+    """Тест: пакет не удаляет чужие тренировки и упражнения в них."""
+    workout, _ = await create_workout(ac, auth_headers)
+    workout_exercise_id = workout["exercises"][0]["id"]
+
+    response = await ac.post("/api/v1/batch/", json={"atomic": False, "operations": [
+        {"method": "DELETE", "path": f"/workouts/{workout['id']}/exercises/{workout_exercise_id}"},
+        {"method": "DELETE", "path": f"/workouts/{workout['id']}"},
+    ]}, headers=other_headers)
+    assert [result["status"] for result in response.json()["results"]] == [404, 404]
+
+    response = await ac.get(f"/api/v1/workouts/{workout['id']}", headers=auth_headers)
+    assert response.json()["exercises"] == workout["exercises"]
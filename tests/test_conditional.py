@@ -0,0 +1,74 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.conditional import etag_matches, make_etag
+
+def test_etag_matches():
+    """Тест слабого сравнения If-None-Match."""
+    etag = make_etag(1, 5)
+    assert etag == 'W/"1.5"'
+    assert etag_matches('W/"1.5"', etag)
+    assert etag_matches('"1.5"', etag)
+    assert etag_matches('W/"1.4", W/"1.5"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('W/"1.4"', etag)
+    assert not etag_matches(None, etag)
+
+@pytest.mark.asyncio
+async def test_not_modified_skips_loading(ac: AsyncClient, auth_headers: dict, count_queries):
+    """Тест 304 без загрузки тренировок и смены ETag после записи."""
+    response = await ac.post("/api/v1/workout-types/", json={"name": "Legs"}, headers=auth_headers)
+    workout_type_id = response.json()["id"]
+    await ac.post(
+        "/api/v1/workouts/",
+        json={"name": "Workout", "workout_type_id": workout_type_id},
+        headers=auth_headers
+    )
+
+    first = await ac.get("/api/v1/workouts/", headers=auth_headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    with count_queries() as statements:
+        second = await ac.get(
+            "/api/v1/workouts/", headers={**auth_headers, "If-None-Match": etag}
+        )
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert not any("FROM workouts" in statement for statement in statements)
+
+    await ac.post(
+        "/api/v1/workouts/",
+        json={"name": "Another", "workout_type_id": workout_type_id},
+        headers=auth_headers
+    )
+    third = await ac.get("/api/v1/workouts/", headers={**auth_headers, "If-None-Match": etag})
+    assert third.status_code == 200
+    assert third.headers["etag"] != etag
+    assert len(third.json()) == 2
+
+@pytest.mark.asyncio
+async def test_catalog_etags(ac: AsyncClient, auth_headers: dict):
+    """Тест ETag у упражнений и типов тренировок."""
+    response = await ac.post("/api/v1/workout-types/", json={"name": "Legs"}, headers=auth_headers)
+    workout_type_id = response.json()["id"]
+    response = await ac.post("/api/v1/exercises/", json={"name": "Squat"}, headers=auth_headers)
+    exercise_id = response.json()["id"]
+
+    for url in (
+        "/api/v1/exercises/",
+        f"/api/v1/exercises/{exercise_id}",
+        f"/api/v1/exercises/{exercise_id}/progress",
+        "/api/v1/workout-types/",
+        f"/api/v1/workout-types/{workout_type_id}",
+    ):
+        response = await ac.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        conditional = await ac.get(
+            url, headers={**auth_headers, "If-None-Match": response.headers["etag"]}
+        )
+        assert conditional.status_code == 304
+
+    missing = await ac.get("/api/v1/exercises/999999", headers=auth_headers)
+    assert missing.status_code == 404
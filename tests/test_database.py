@@ -0,0 +1,42 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.pool import NullPool
+
+from app.core.config import Settings
+from app.database.session import InstrumentedQueuePool, build_engine_options, get_pool_stats
+
+pytestmark = pytest.mark.asyncio
+
+async def test_prod_profile_engine_options():
+    """Тест параметров движка для профиля prod."""
+    options = build_engine_options(Settings(DB_PROFILE="prod").db_profile)
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 20
+    assert options["echo"] is False
+    assert options["connect_args"]["server_settings"]["statement_timeout"] == "15000"
+
+async def test_profile_overrides():
+    """Тест переопределения параметров профиля переменными окружения."""
+    profile = Settings(DB_PROFILE="prod", DB_POOL_SIZE=7, DB_ECHO=True).db_profile
+    assert profile["pool_size"] == 7
+    assert profile["echo"] is True
+    assert profile["max_overflow"] == 10
+
+async def test_test_profile_uses_null_pool():
+    """Тест профиля test без пула соединений."""
+    options = build_engine_options(Settings(DB_PROFILE="test").db_profile)
+    assert options["poolclass"] is NullPool
+    assert "pool_size" not in options
+
+async def test_unknown_profile():
+    """Тест неизвестного профиля."""
+    with pytest.raises(ValueError):
+        Settings(DB_PROFILE="staging").db_profile
+
+async def test_pool_status(ac: AsyncClient):
+    """Тест состояния пула и его метрик на /metrics."""
+    response = await ac.get("/metrics")
+    assert "\ndb_pool_timeouts" in response.text
+    data = get_pool_stats()
+    assert data["profile"] == "test"
+    assert "checkouts" in data
@@ -0,0 +1,93 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.services.exercise_search import ExerciseTrie, prefix_tsquery
+
+EXERCISES = [
+    ("Incline bench press", "Barbell, 30 degrees"),
+    ("Bench press", "Flat barbell bench"),
+    ("Squat", None),
+    ("Front squat", "Barbell on the front delts"),
+    ("Жим лежа", "Штанга"),
+]
+
+def test_trie_search():
+    """Тест префиксного дерева: слова запроса - префиксы слов названия."""
+    trie = ExerciseTrie(enumerate(name for name, _ in EXERCISES))
+    assert trie.search("bench", 10) == [(1, "Bench press"), (0, "Incline bench press")]
+    assert trie.search("pr inc", 10) == [(0, "Incline bench press")]
+    assert trie.search("SQU", 10) == [(2, "Squat"), (3, "Front squat")]
+    assert trie.search("жим", 10) == [(4, "Жим лежа")]
+    assert trie.search("deadlift", 10) == []
+    assert trie.search("  ", 10) == []
+    assert len(trie.search("s", 1)) == 1
+
+def test_prefix_tsquery():
+    """Тест построения запроса to_tsquery из пользовательской строки."""
+    assert prefix_tsquery("Bench  pr") == "bench:* & pr:*"
+    assert prefix_tsquery("a' | !b") == "a:* & b:*"
+    assert prefix_tsquery("&|!") is None
+
+async def create_exercises(ac: AsyncClient, auth_headers: dict) -> None:
+    for name, description in EXERCISES:
+        response = await ac.post(
+            "/api/v1/exercises/", json={"name": name, "description": description}, headers=auth_headers
+        )
+        assert response.status_code == 201
+
+@pytest.mark.asyncio
+async def test_autocomplete(ac: AsyncClient, auth_headers: dict, count_queries):
+    """Тест автодополнения по дереву в памяти и его перестроения после записи."""
+    await create_exercises(ac, auth_headers)
+    response = await ac.get("/api/v1/exercises/autocomplete?q=bench", headers=auth_headers)
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Bench press", "Incline bench press"]
+
+    with count_queries() as statements:
+        response = await ac.get("/api/v1/exercises/autocomplete?q=squ", headers=auth_headers)
+    assert [item["name"] for item in response.json()] == ["Squat", "Front squat"]
+    assert not any("FROM exercises" in statement for statement in statements)
+
+    await ac.post("/api/v1/exercises/", json={"name": "Split squat"}, headers=auth_headers)
+    response = await ac.get("/api/v1/exercises/autocomplete?q=squ", headers=auth_headers)
+    assert [item["name"] for item in response.json()] == ["Squat", "Front squat", "Split squat"]
+
+@pytest.mark.asyncio
+async def test_search(ac: AsyncClient, auth_headers: dict, monkeypatch):
+    """Тест полнотекстового поиска по названию и описанию."""
+    await create_exercises(ac, auth_headers)
+    response = await ac.get("/api/v1/exercises/search?q=bench", headers=auth_headers)
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Bench press", "Incline bench press"]
+
+    # Описание тоже участвует в поиске, но с меньшим весом
+    response = await ac.get("/api/v1/exercises/search?q=barb", headers=auth_headers)
+    assert {item["name"] for item in response.json()} == {"Bench press", "Incline bench press", "Front squat"}
+
+    response = await ac.get("/api/v1/exercises/search?q=front+delt", headers=auth_headers)
+    assert [item["name"] for item in response.json()] == ["Front squat"]
+
+@pytest.mark.asyncio
+async def test_search_timeout_falls_back_to_trie(
+    ac: AsyncClient, auth_headers: dict, session_factory, monkeypatch
+):
+    """Тест: отмененный по statement_timeout поиск отвечает по дереву названий."""
+    await create_exercises(ac, auth_headers)
+    monkeypatch.setattr(settings, "EXERCISE_SEARCH_TIMEOUT_MS", 20)
+
+    # Каждое чтение exercises длится 50 мс: поиск превышает бюджет, а
+    # построение дерева и выборка найденного проходят, только если таймаут
+    # не пережил точку сохранения поиска
+    def slow_exercises(conn, cursor, statement, parameters, context, executemany):
+        return statement.replace("FROM exercises", "FROM (SELECT pg_sleep(0.05)) AS slow, exercises"), parameters
+
+    engine = session_factory.kw["bind"].sync_engine
+    event.listen(engine, "before_cursor_execute", slow_exercises, retval=True)
+    try:
+        response = await ac.get("/api/v1/exercises/search?q=front", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", slow_exercises)
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()] == ["Front squat"]
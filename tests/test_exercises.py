@@ -122,4 +122,59 @@ async def test_delete_exercise(ac: AsyncClient, auth_headers: dict):
     
     # Проверяем, что упражнение удалено
     get_response = await ac.get(f"/api/v1/exercises/{exercise_id}", headers=auth_headers)
-    assert get_response.status_code == 404 
\ No newline at end of file
+    assert get_response.status_code == 404 
+async def test_get_exercises_cursor_pagination(ac: AsyncClient, auth_headers: dict):
+    """Тест курсорной пагинации списка упражнений."""
+    for i in range(3):
+        await ac.post(
+            "/api/v1/exercises/",
+            json={"name": f"Exercise {i}", "muscle_groups": ["chest"]},
+            headers=auth_headers
+        )
+
+    response = await ac.get("/api/v1/exercises/?limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    assert [ex["name"] for ex in response.json()] == ["Exercise 0", "Exercise 1"]
+
+    response = await ac.get(
+        "/api/v1/exercises/",
+        params={"limit": 2, "cursor": response.headers["X-Next-Cursor"]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert [ex["name"] for ex in response.json()] == ["Exercise 2"]
+    assert "X-Next-Cursor" not in response.headers
+
+async def test_filter_and_count_muscle_groups(ac: AsyncClient, auth_headers: dict):
+    """Тест фильтра по группам мышц (any/all) и количества упражнений по группам."""
+    for name, groups in (
+        ("Bench press", ["chest", "triceps"]),
+        ("Push-up", ["chest", "triceps", "core"]),
+        ("Row", ["back"]),
+    ):
+        await ac.post(
+            "/api/v1/exercises/",
+            json={"name": name, "muscle_groups": groups},
+            headers=auth_headers
+        )
+
+    response = await ac.get(
+        "/api/v1/exercises/", params={"muscle_groups": ["core", "back"]}, headers=auth_headers
+    )
+    assert [ex["name"] for ex in response.json()] == ["Push-up", "Row"]
+
+    response = await ac.get(
+        "/api/v1/exercises/",
+        params={"muscle_groups": ["chest", "triceps"], "match": "all"},
+        headers=auth_headers
+    )
+    assert [ex["name"] for ex in response.json()] == ["Bench press", "Push-up"]
+
+    response = await ac.get("/api/v1/exercises/muscle-groups", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == [
+        {"muscle_group": "chest", "exercises": 2},
+        {"muscle_group": "triceps", "exercises": 2},
+        {"muscle_group": "back", "exercises": 1},
+        {"muscle_group": "core", "exercises": 1},
+    ]
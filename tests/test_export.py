@@ -0,0 +1,100 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+
+pytestmark = pytest.mark.asyncio
+
+async def create_history(ac: AsyncClient, auth_headers: dict, count: int) -> list[int]:
+    """Создание тренировок с упражнением и подходами для выгрузки."""
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs"]},
+        headers=auth_headers
+    )
+    exercise_id = response.json()["id"]
+    response = await ac.post(
+        "/api/v1/workout-types/",
+        json={"name": "Legs", "description": "Leg day"},
+        headers=auth_headers
+    )
+    workout_type_id = response.json()["id"]
+
+    ids = []
+    for i in range(count):
+        response = await ac.post(
+            "/api/v1/workouts/",
+            json={
+                "name": f"Workout {i}",
+                "workout_type_id": workout_type_id,
+                "exercises": [{
+                    "exercise_id": exercise_id,
+                    "sets": [
+                        {"set_number": 1, "weight": 100, "reps": 5},
+                        {"set_number": 2, "weight": 105, "reps": 3},
+                    ],
+                }] if i % 2 == 0 else [],
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+async def test_export_ndjson(ac: AsyncClient, auth_headers: dict, monkeypatch):
+    """Тест потоковой выгрузки NDJSON пачками и продолжения по курсору."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    ids = await create_history(ac, auth_headers, 5)
+
+    response = await ac.get(
+        "/api/v1/export/workouts", headers={**auth_headers, "Accept-Encoding": "identity"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["id"] for r in records] == ids
+    assert records[0]["workout_type"]["name"] == "Legs"
+    assert [s["weight"] for s in records[0]["exercises"][0]["sets"]] == [100, 105]
+    assert records[1]["exercises"] == []
+
+    response = await ac.get(
+        "/api/v1/export/workouts", params={"cursor": records[1]["cursor"]}, headers=auth_headers
+    )
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == ids[2:]
+
+async def test_export_csv_gzip(ac: AsyncClient, auth_headers: dict):
+    """Тест выгрузки CSV со сжатием gzip."""
+    ids = await create_history(ac, auth_headers, 3)
+
+    response = await ac.get(
+        "/api/v1/export/workouts",
+        params={"format": "csv"},
+        headers={**auth_headers, "Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    # Две строки подходов у четных тренировок, одна пустая строка у нечетной
+    assert [int(r["workout_id"]) for r in rows] == [ids[0], ids[0], ids[1], ids[2], ids[2]]
+    assert rows[1]["exercise_name"] == "Squat"
+    assert rows[1]["weight"] == "105"
+    assert rows[2]["set_number"] == ""
+
+async def test_export_empty_and_invalid_cursor(ac: AsyncClient, auth_headers: dict):
+    """Тест выгрузки пустой истории и некорректного курсора."""
+    response = await ac.get(
+        "/api/v1/export/workouts", params={"format": "csv"}, headers=auth_headers
+    )
+    assert response.text.splitlines() == [
+        "workout_id,workout_name,workout_description,workout_type,created_at,"
+        "exercise_id,exercise_name,notes,set_number,weight,reps,cursor"
+    ]
+
+    response = await ac.get(
+        "/api/v1/export/workouts", params={"cursor": "broken"}, headers=auth_headers
+    )
+    assert response.status_code == 400
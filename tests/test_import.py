@@ -0,0 +1,179 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+pytestmark = pytest.mark.asyncio
+
+CSV_HEADER = "workout_name,workout_type,created_at,exercise_name,notes,set_number,weight,reps\n"
+
+async def test_import_csv(ac: AsyncClient, auth_headers: dict, monkeypatch):
+    """Тест импорта CSV пачками с созданием упражнений и типов тренировок."""
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "IMPORT_BATCH_SIZE", 50)
+
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs"]},
+        headers=auth_headers
+    )
+    squat_id = response.json()["id"]
+
+    rows = []
+    for day in range(40):
+        created_at = f"2024-01-{day % 28 + 1:02d}T{day // 28 + 8:02d}:00:00"
+        for exercise in ("Squat", "Deadlift"):
+            for set_number in (1, 2, 3):
+                rows.append(f"Day {day},Strength,{created_at},{exercise},,{set_number},{100 + set_number},5\n")
+    response = await ac.post(
+        "/api/v1/import/workouts",
+        files={"file": ("history.csv", CSV_HEADER + "".join(rows), "text/csv")},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    result = response.json()
+    assert (result["workouts"], result["exercises"], result["sets"]) == (40, 80, 240)
+    assert result["batches"] > 1
+    assert result["created_exercises"] == ["Deadlift"]
+    assert result["created_workout_types"] == ["Strength"]
+
+    response = await ac.get("/api/v1/workouts/?limit=200", headers=auth_headers)
+    workouts = response.json()
+    assert len(workouts) == 40
+    workout = next(w for w in workouts if w["name"] == "Day 0")
+    assert workout["workout_type"]["name"] == "Strength"
+    assert [e["exercise_id"] for e in workout["exercises"]][0] == squat_id
+    assert [s["weight"] for s in workout["exercises"][1]["sets"]] == [101, 102, 103]
+
+    # ID выделены из последовательностей: обычное создание не конфликтует
+    response = await ac.post(
+        "/api/v1/workouts/",
+        json={"name": "After import", "workout_type_id": workout["workout_type_id"]},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+
+async def test_import_export_roundtrip(ac: AsyncClient, auth_headers: dict):
+    """Тест повторной загрузки выгрузки NDJSON."""
+    response = await ac.post(
+        "/api/v1/workout-types/", json={"name": "Legs"}, headers=auth_headers
+    )
+    workout_type_id = response.json()["id"]
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs"]},
+        headers=auth_headers
+    )
+    exercise_id = response.json()["id"]
+    await ac.post(
+        "/api/v1/workouts/",
+        json={
+            "name": "Leg day",
+            "workout_type_id": workout_type_id,
+            "exercises": [{
+                "exercise_id": exercise_id,
+                "notes": "heavy, \"paused\"",
+                "sets": [{"set_number": 1, "weight": 100, "reps": 5}],
+            }],
+        },
+        headers=auth_headers
+    )
+
+    # Каждая загрузка удваивает историю: 1 + 1 после NDJSON, 2 + 2 после CSV
+    for fmt, expected_sets in (("ndjson", 1), ("csv", 2)):
+        exported = await ac.get(
+            "/api/v1/export/workouts", params={"format": fmt}, headers=auth_headers
+        )
+        response = await ac.post(
+            "/api/v1/import/workouts",
+            files={"file": (f"history.{fmt}", exported.content)},
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+        assert response.json()["sets"] == expected_sets
+        assert response.json()["created_exercises"] == []
+
+    exported = await ac.get("/api/v1/export/workouts", headers=auth_headers)
+    records = [json.loads(line) for line in exported.text.splitlines()]
+    assert len(records) == 4
+    assert {r["created_at"] for r in records} == {records[0]["created_at"]}
+    assert all(r["exercises"][0]["notes"] == "heavy, \"paused\"" for r in records)
+
+async def test_import_invalid_file(ac: AsyncClient, auth_headers: dict):
+    """Тест отката импорта при ошибке в файле."""
+    content = CSV_HEADER + "Day 1,Strength,2024-01-01,Squat,,1,100,5\nDay 2,Strength,2024-01-02,Squat,,1,heavy,5\n"
+    response = await ac.post(
+        "/api/v1/import/workouts",
+        files={"file": ("history.csv", content)},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert "weight" in response.json()["detail"]
+
+    response = await ac.post(
+        "/api/v1/import/workouts",
+        files={"file": ("history.txt", "data")},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+
+    response = await ac.get("/api/v1/workouts/", headers=auth_headers)
+    assert response.json() == []
+    response = await ac.get("/api/v1/exercises/", headers=auth_headers)
+    assert response.json() == []
+
+async def test_import_value_out_of_range(ac: AsyncClient, auth_headers: dict):
+    """Тест: значение вне диапазона колонки отклоняется до COPY с номером строки."""
+    content = CSV_HEADER + "Day 1,Strength,2024-01-01,Squat,,1,100,5\nDay 1,Strength,2024-01-01,Squat,,2,3000000000,5\n"
+    response = await ac.post(
+        "/api/v1/import/workouts",
+        files={"file": ("history.csv", content)},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Строка 3:")
+    assert "weight" in response.json()["detail"]
+
+    record = {
+        "name": "Day 1", "workout_type": "Strength",
+        "exercises": [{"exercise": "Squat", "sets": [{"set_number": 1, "weight": 100, "reps": -1}]}],
+    }
+    response = await ac.post(
+        "/api/v1/import/workouts",
+        files={"file": ("history.ndjson", "\n" + json.dumps(record) + "\n")},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Строка 2:")
+    assert "reps" in response.json()["detail"]
+
+    response = await ac.get("/api/v1/workouts/", headers=auth_headers)
+    assert response.json() == []
+
+async def test_import_status(ac: AsyncClient, auth_headers: dict):
+    """Тест хода импорта: итоги успешной загрузки и причина ошибки."""
+    response = await ac.get("/api/v1/import/workouts/status", headers=auth_headers)
+    assert response.status_code == 404
+
+    content = CSV_HEADER + "Day 1,Strength,2024-01-01,Squat,,1,100,5\nDay 1,Strength,2024-01-01,Squat,,2,100,5\n"
+    response = await ac.post(
+        "/api/v1/import/workouts",
+        files={"file": ("history.csv", content)},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    response = await ac.get("/api/v1/import/workouts/status", headers=auth_headers)
+    status = response.json()
+    assert (status["state"], status["error"]) == ("done", None)
+    assert (status["workouts"], status["sets"], status["batches"]) == (1, 2, 1)
+
+    response = await ac.post(
+        "/api/v1/import/workouts",
+        files={"file": ("history.csv", CSV_HEADER + "Day 2,Strength,2024-01-02,Squat,,1,heavy,5\n")},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+    response = await ac.get("/api/v1/import/workouts/status", headers=auth_headers)
+    status = response.json()
+    assert status["state"] == "failed"
+    assert status["error"] == "Строка 2: поле 'weight' должно быть целым числом"
@@ -0,0 +1,46 @@
+import json
+import logging
+import queue
+import sys
+
+from app.core.logging import DroppingQueueHandler, JsonFormatter, SamplingFilter
+
+def make_record(name: str, level: int = logging.INFO, msg: str = "message", args: tuple = ()) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+def test_json_formatter():
+    """Тест вывода записи одной строкой JSON с полями extra и исключением."""
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord("app.test", logging.ERROR, __file__, 1, "user=%s", (7,), None)
+        record.exc_info = sys.exc_info()
+    record.request_id = "abc"
+    data = json.loads(JsonFormatter().format(record))
+    assert data["level"] == "ERROR"
+    assert data["logger"] == "app.test"
+    assert data["message"] == "user=7"
+    assert data["request_id"] == "abc"
+    assert "ValueError: boom" in data["exc"]
+
+def test_sampling_filter():
+    """Тест выборки по имени логгера: предупреждения проходят всегда."""
+    sampling = SamplingFilter({"app.main": 0.25, "app.quiet": 0})
+    kept = [sampling.filter(make_record("app.main")) for _ in range(8)]
+    assert kept.count(True) == 2
+    # Доля логгера действует на его потомков
+    assert not any(sampling.filter(make_record("app.quiet.child")) for _ in range(3))
+    assert sampling.filter(make_record("app.quiet", logging.WARNING))
+    assert all(sampling.filter(make_record("app.other")) for _ in range(3))
+    assert sampling.sampled_out == 9
+
+def test_queue_handler_drops_when_full():
+    """Тест отбрасывания записей при заполненной очереди вместо ожидания."""
+    log_queue: queue.Queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+    for i in range(5):
+        handler.handle(make_record("app.test", msg="n=%s", args=(i,)))
+    assert handler.dropped == 3
+    record = log_queue.get_nowait()
+    assert record.getMessage() == "n=0"
+    assert record.args is None
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from httpx import AsyncClient
+
+# Процесс записывает наблюдение в общий каталог метрик и завершается
+OBSERVE_SCRIPT = """
+from app.core.metrics import REQUEST_LATENCY
+REQUEST_LATENCY.labels("GET", "/api/v1/workouts/", "200").observe(0.02)
+"""
+
+RENDER_SCRIPT = """
+from app.core.metrics import render_metrics
+print(render_metrics()[0].decode())
+"""
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(ac: AsyncClient, auth_headers: dict):
+    """Тест гистограмм по шаблону маршрута и метрик процесса на /metrics."""
+    await ac.get("/api/v1/workouts/999999", headers=auth_headers)
+    await ac.get("/api/v1/no-such-path")
+
+    response = await ac.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/workouts/{workout_id}",status="404"}'
+        in body
+    )
+    assert 'route="<unmatched>"' in body
+    assert 'http_request_db_queries_count{method="GET",route="/api/v1/workouts/{workout_id}"}' in body
+    for name in ("http_requests_in_progress", "event_loop_lag_seconds", "db_pool_checked_out",
+                 "auth_cache_hits", "password_hash_waiting", "response_cache_hits", "log_records_dropped"):
+        assert f"\n{name}" in body
+
+def test_multiprocess_registry(tmp_path):
+    """Тест суммирования метрик нескольких процессов через PROMETHEUS_MULTIPROC_DIR."""
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", OBSERVE_SCRIPT], env=env, check=True)
+    result = subprocess.run(
+        [sys.executable, "-c", RENDER_SCRIPT], env=env, check=True, capture_output=True, text=True
+    )
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/api/v1/workouts/",status="200"} 2.0'
+        in result.stdout
+    )
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from httpx import AsyncClient
+
+from app.services.progress import compute_progress, rolling_mean
+
+DAY = 86400.0
+
+def test_rolling_mean():
+    """Тест скользящего среднего с неполным окном в начале ряда."""
+    values = np.array([2.0, 4.0, 6.0, 8.0])
+    assert rolling_mean(values, 2).tolist() == [2.0, 3.0, 5.0, 7.0]
+    assert rolling_mean(values, 10).tolist() == [2.0, 3.0, 4.0, 5.0]
+
+def test_compute_progress():
+    """Тест рядов по тренировкам из колонок подходов."""
+    progress = compute_progress(
+        workout_ids=np.array([1, 1, 2, 3, 3]),
+        epochs=np.array([0.0, 0.0, 7 * DAY, 14 * DAY, 14 * DAY]),
+        weights=np.array([100.0, 90.0, 100.0, 110.0, 20.0]),
+        reps=np.array([5.0, 10.0, 3.0, 3.0, 40.0]),
+        window=2,
+    )
+    assert progress["sessions"] == 3
+    assert progress["dates"] == ["1970-01-01T00:00:00", "1970-01-08T00:00:00", "1970-01-15T00:00:00"]
+    assert progress["tonnage"] == [1400.0, 300.0, 1130.0]
+    assert progress["top_weight"] == [100.0, 100.0, 110.0]
+    assert progress["e1rm_epley"] == [120.0, 110.0, 121.0]
+    # 40 повторений вне области формулы Бжицки
+    assert progress["e1rm_brzycki"] == [120.0, 105.88, 116.47]
+    assert progress["tonnage_rolling"] == [1400.0, 850.0, 715.0]
+    assert progress["intensity"] == [0.83, 0.83, 0.91]
+    assert progress["e1rm_trend"] == 0.5
+
+def test_compute_progress_empty():
+    """Тест прогресса без подходов."""
+    progress = compute_progress(np.array([]), np.array([]), np.array([]), np.array([]), window=4)
+    assert progress["sessions"] == 0
+    assert progress["tonnage"] == []
+    assert progress["e1rm_trend"] is None
+
+@pytest.mark.asyncio
+async def test_get_exercise_progress(ac: AsyncClient, auth_headers: dict):
+    """Тест эндпоинта прогресса в упражнении."""
+    response = await ac.post(
+        "/api/v1/workout-types/", json={"name": "Strength"}, headers=auth_headers
+    )
+    workout_type_id = response.json()["id"]
+    response = await ac.post(
+        "/api/v1/exercises/", json={"name": "Squat", "muscle_groups": []}, headers=auth_headers
+    )
+    exercise_id = response.json()["id"]
+
+    response = await ac.get(f"/api/v1/exercises/{exercise_id}/progress", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["sessions"] == 0
+
+    for day, weight in enumerate((100, 105, 110)):
+        response = await ac.post(
+            "/api/v1/workouts/",
+            json={
+                "name": f"Day {day}",
+                "workout_type_id": workout_type_id,
+                "exercises": [{
+                    "exercise_id": exercise_id,
+                    "sets": [
+                        {"set_number": 1, "weight": weight, "reps": 5},
+                        {"set_number": 2, "weight": weight, "reps": 0},
+                    ],
+                }],
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+
+    response = await ac.get(
+        f"/api/v1/exercises/{exercise_id}/progress", params={"window": 2}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    progress = response.json()
+    assert progress["sessions"] == 3
+    assert progress["window"] == 2
+    assert progress["tonnage"] == [500.0, 525.0, 550.0]
+    assert progress["top_weight"] == [100.0, 105.0, 110.0]
+    assert len(progress["dates"]) == 3
+
+    response = await ac.get("/api/v1/exercises/999999/progress", headers=auth_headers)
+    assert response.status_code == 404
@@ -0,0 +1,202 @@
+from typing import Any, Callable
+
+import pytest
+from fastapi.routing import APIRoute
+from httpx import AsyncClient
+
+from app.main import app
+
+# Тренировок в наборе данных
+WORKOUTS = 5
+
+# Размеры набора данных: наибольшее количество упражнений в тренировке и
+# подходов в упражнении. Каждый маршрут проверяется на обоих с одним
+# бюджетом: N+1 по тренировкам, упражнениям или подходам выводит больший за бюджет
+SIZES: dict[str, tuple[int, int]] = {
+    "small": (2, 2),
+    "large": (8, 4),
+}
+
+# Бюджет SQL-выражений на запрос по "МЕТОД шаблон пути" - для каждого маршрута /api/v1;
+# другой вариант запроса к тому же маршруту - с суффиксом " [вариант]".
+# Бюджет равен измеренному количеству и не зависит от объема данных;
+# увеличивать его - осознанное решение в ревью.
+QUERY_BUDGETS: dict[str, int] = {
+    "POST /api/v1/auth/register": 3,
+    "POST /api/v1/auth/login": 1,
+    "GET /api/v1/users/me": 0,
+    "PUT /api/v1/users/me": 3,
+    "DELETE /api/v1/users/me": 6,
+    "POST /api/v1/workouts/": 13,
+    "GET /api/v1/workouts/": 4,
+    "GET /api/v1/workouts/{workout_id}": 4,
+    "PATCH /api/v1/workouts/{workout_id}": 8,
+    "PATCH /api/v1/workouts/{workout_id} [exercises]": 23,
+    "DELETE /api/v1/workouts/{workout_id}": 14,
+    "POST /api/v1/workouts/{workout_id}/exercises": 13,
+    "PUT /api/v1/workouts/{workout_id}/exercises/{workout_exercise_id}": 18,
+    "DELETE /api/v1/workouts/{workout_id}/exercises/{workout_exercise_id}": 14,
+    "POST /api/v1/workout-types/": 4,
+    "GET /api/v1/workout-types/": 2,
+    "GET /api/v1/workout-types/{workout_type_id}": 2,
+    "PATCH /api/v1/workout-types/{workout_type_id}": 5,
+    "DELETE /api/v1/workout-types/{workout_type_id}": 5,
+    "POST /api/v1/exercises/": 4,
+    "GET /api/v1/exercises/": 2,
+    "GET /api/v1/exercises/muscle-groups": 2,
+    "GET /api/v1/exercises/autocomplete": 2,
+    "GET /api/v1/exercises/search": 5,
+    "GET /api/v1/exercises/{exercise_id}": 2,
+    "GET /api/v1/exercises/{exercise_id}/progress": 3,
+    "PUT /api/v1/exercises/{exercise_id}": 4,
+    "DELETE /api/v1/exercises/{exercise_id}": 5,
+    "GET /api/v1/export/workouts": 3,
+    "POST /api/v1/import/workouts": 12,
+    "GET /api/v1/import/workouts/status": 0,
+    "GET /api/v1/records/": 1,
+    "GET /api/v1/records/{exercise_id}": 2,
+    "GET /api/v1/stats/summary": 1,
+    "GET /api/v1/sync/": 6,
+    "POST /api/v1/batch/": 18,
+}
+
+# Параметры запроса, кроме пути, по ID набора данных
+REQUEST_ARGS: dict[str, Callable[[dict[str, int]], dict[str, Any]]] = {
+    "POST /api/v1/auth/register": lambda ids: {
+        "json": {"email": "new@example.com", "username": "newuser", "password": "newpass123"}
+    },
+    "POST /api/v1/auth/login": lambda ids: {
+        "data": {"username": "test@example.com", "password": "testpass123"}
+    },
+    "PUT /api/v1/users/me": lambda ids: {"json": {"username": "renamed"}},
+    "POST /api/v1/workouts/": lambda ids: {"json": workout_body(ids, "Extra")},
+    "PATCH /api/v1/workouts/{workout_id}": lambda ids: {"json": {"name": "Renamed"}},
+    # Изменение подхода, новый подход, удаление остальных подходов и упражнений, новое упражнение
+    "PATCH /api/v1/workouts/{workout_id} [exercises]": lambda ids: {"json": {"exercises": [
+        {"id": ids["workout_exercise_id"], "sets": [
+            {"id": ids["set_id"], "weight": 110},
+            {"set_number": 10, "weight": 90, "reps": 8},
+        ]},
+        {"exercise_id": ids["free_exercise_id"], "sets": [{"set_number": 1, "weight": 40, "reps": 10}]},
+    ]}},
+    "POST /api/v1/workouts/{workout_id}/exercises": lambda ids: {"json": {
+        "exercise_id": ids["free_exercise_id"],
+        "sets": [{"set_number": 1, "weight": 40, "reps": 10}],
+    }},
+    "PUT /api/v1/workouts/{workout_id}/exercises/{workout_exercise_id}": lambda ids: {"json": {
+        "sets": [{"id": ids["set_id"], "reps": 6}, {"set_number": 10, "weight": 90, "reps": 3}],
+    }},
+    "POST /api/v1/workout-types/": lambda ids: {"json": {"name": "Mobility"}},
+    "PATCH /api/v1/workout-types/{workout_type_id}": lambda ids: {"json": {"name": "Power"}},
+    "POST /api/v1/exercises/": lambda ids: {"json": {"name": "Deadlift", "muscle_groups": ["back"]}},
+    "GET /api/v1/exercises/autocomplete": lambda ids: {"params": {"q": "squ"}},
+    "GET /api/v1/exercises/search": lambda ids: {"params": {"q": "squat"}},
+    "PUT /api/v1/exercises/{exercise_id}": lambda ids: {"json": {"name": "Back squat"}},
+    "POST /api/v1/import/workouts": lambda ids: {"files": {"file": (
+        "history.csv",
+        "workout_name,workout_type,created_at,exercise_name,notes,set_number,weight,reps\n"
+        + "".join(f"Day {day},Strength,2024-02-{day:02d}T08:00:00,Squat,,1,100,5\n" for day in range(1, WORKOUTS + 1)),
+        "text/csv",
+    )}},
+    "POST /api/v1/batch/": lambda ids: {"json": {"operations": [
+        {"method": "PATCH", "path": f"/workouts/{ids['workout_id']}", "body": {"name": "Batch"}},
+        {"method": "POST", "path": "/exercises", "body": {"name": "Lunge"}},
+    ]}},
+}
+
+# Запрос, выполняемый до измерения, чтобы маршруту было что вернуть
+SETUP_REQUESTS: dict[str, str] = {
+    "GET /api/v1/import/workouts/status": "POST /api/v1/import/workouts",
+}
+
+# Маршруты, удаляющие объект набора данных, и ID, который они получают
+PATH_OVERRIDES: dict[str, dict[str, str]] = {
+    "DELETE /api/v1/workout-types/{workout_type_id}": {"workout_type_id": "free_workout_type_id"},
+    "DELETE /api/v1/exercises/{exercise_id}": {"exercise_id": "free_exercise_id"},
+}
+
+def workout_body(ids: dict[str, int], name: str, exercises: int = 2, sets: int = 2) -> dict[str, Any]:
+    """Тренировка из exercises упражнений по sets, sets - 1, ... подходов (не меньше одного)."""
+    catalog = (ids["exercise_id"], ids["second_exercise_id"])
+    return {
+        "name": name,
+        "workout_type_id": ids["workout_type_id"],
+        "exercises": [
+            {
+                "exercise_id": catalog[i % len(catalog)],
+                "sets": [
+                    {"set_number": n, "weight": 60 + 10 * n, "reps": 8 - n}
+                    for n in range(1, max(sets - i, 1) + 1)
+                ],
+            }
+            for i in range(exercises)
+        ],
+    }
+
+async def create_dataset(ac: AsyncClient, auth_headers: dict, size: str) -> dict[str, int]:
+    """
+    Каталог и WORKOUTS тренировок с разным количеством упражнений и подходов.
+
+    Последняя тренировка, ID которой получают маршруты, - самая большая
+    для размера size.
+    """
+    max_exercises, max_sets = SIZES[size]
+    ids = {}
+    for key, name in (("workout_type_id", "Strength"), ("free_workout_type_id", "Cardio")):
+        response = await ac.post("/api/v1/workout-types/", json={"name": name}, headers=auth_headers)
+        ids[key] = response.json()["id"]
+    for key, name, groups in (
+        ("exercise_id", "Squat", ["legs"]),
+        ("second_exercise_id", "Bench press", ["chest"]),
+        ("free_exercise_id", "Row", ["back"]),
+    ):
+        response = await ac.post(
+            "/api/v1/exercises/", json={"name": name, "muscle_groups": groups}, headers=auth_headers
+        )
+        ids[key] = response.json()["id"]
+    for i in range(WORKOUTS):
+        body = workout_body(
+            ids, f"Day {i}",
+            exercises=1 + i * (max_exercises - 1) // (WORKOUTS - 1),
+            sets=1 + i * (max_sets - 1) // (WORKOUTS - 1),
+        )
+        response = await ac.post("/api/v1/workouts/", json=body, headers=auth_headers)
+        assert response.status_code == 201
+    workout = response.json()
+    ids["workout_id"] = workout["id"]
+    ids["workout_exercise_id"] = workout["exercises"][0]["id"]
+    ids["set_id"] = workout["exercises"][0]["sets"][0]["id"]
+    return ids
+
+def api_routes() -> set[str]:
+    return {
+        f"{method} {route.path}"
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.path.startswith("/api/v1/")
+        for method in route.methods
+    }
+
+def test_every_route_has_budget():
+    """Тест наличия бюджета запросов у каждого маршрута API."""
+    assert api_routes() == {endpoint.partition(" [")[0] for endpoint in QUERY_BUDGETS}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", list(SIZES))
+@pytest.mark.parametrize("endpoint", list(QUERY_BUDGETS))
+async def test_query_budget(endpoint: str, size: str, ac: AsyncClient, auth_headers: dict, query_budget):
+    """Тест количества SQL-выражений на запрос к маршруту."""
+    ids = await create_dataset(ac, auth_headers, size)
+    method, path = endpoint.partition(" [")[0].split(" ", 1)
+    path_ids = {**ids, **{name: ids[key] for name, key in PATH_OVERRIDES.get(endpoint, {}).items()}}
+    kwargs = REQUEST_ARGS.get(endpoint, lambda ids: {})(ids)
+    if endpoint in SETUP_REQUESTS:
+        setup_method, setup_path = SETUP_REQUESTS[endpoint].split(" ", 1)
+        await ac.request(
+            setup_method, setup_path, headers=auth_headers, **REQUEST_ARGS[SETUP_REQUESTS[endpoint]](ids)
+        )
+
+    with query_budget(QUERY_BUDGETS[endpoint]) as statements:
+        response = await ac.request(method, path.format(**path_ids), headers=auth_headers, **kwargs)
+    assert response.status_code < 300, response.text
+    # Бюджет выше измеренного скрыл бы рост количества запросов - его нужно снизить
+    assert len(statements) == QUERY_BUDGETS[endpoint]
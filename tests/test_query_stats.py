@@ -0,0 +1,45 @@
+import logging
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.database.instrumentation import describe_parameters, normalize_statement
+
+SERVER_TIMING_RE = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries", app;dur=([\d.]+)')
+
+def test_describe_parameters():
+    """Тест описания параметров выражения без значений."""
+    assert describe_parameters((1, "a", None), False) == "(int, str, NoneType)"
+    assert describe_parameters({"id": 1}, False) == "{id: int}"
+    assert describe_parameters([(1, 2.5), (2, 3.5)], True) == "2 x (int, float)"
+    assert normalize_statement("SELECT *\n  FROM  workouts\n") == "SELECT * FROM workouts"
+
+@pytest.mark.asyncio
+async def test_server_timing_header(ac: AsyncClient, auth_headers: dict, count_queries):
+    """Тест заголовка Server-Timing и статистики запросов по маршрутам."""
+    response = await ac.post("/api/v1/workout-types/", json={"name": "Legs"}, headers=auth_headers)
+    response = await ac.post(
+        "/api/v1/workouts/",
+        json={"name": "Day 1", "workout_type_id": response.json()["id"], "exercises": []},
+        headers=auth_headers
+    )
+    workout_id = response.json()["id"]
+
+    with count_queries() as statements:
+        response = await ac.get(f"/api/v1/workouts/{workout_id}", headers=auth_headers)
+    match = SERVER_TIMING_RE.fullmatch(response.headers["Server-Timing"])
+    assert match is not None
+    assert int(match.group(2)) == len(statements)
+    assert float(match.group(1)) <= float(match.group(3))
+
+@pytest.mark.asyncio
+async def test_slow_query_log(ac: AsyncClient, auth_headers: dict, monkeypatch, caplog):
+    """Тест лога медленных выражений: выражение в одну строку и форма параметров."""
+    monkeypatch.setattr(settings, "SQL_SLOW_QUERY_MS", 0.000001)
+    with caplog.at_level(logging.WARNING, logger="app.database.instrumentation"):
+        await ac.get("/api/v1/exercises/", headers=auth_headers)
+    messages = [record.getMessage() for record in caplog.records if record.name == "app.database.instrumentation"]
+    assert any("FROM exercises" in message and "params=(int" in message for message in messages)
+    assert not any("\n" in message for message in messages)
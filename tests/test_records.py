@@ -0,0 +1,169 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.models.personal_record import PersonalRecord, RepRecord
+from app.services.records import estimate_1rm, recompute_records
+
+pytestmark = pytest.mark.asyncio
+
+async def create_catalog(ac: AsyncClient, auth_headers: dict) -> tuple[int, int, int]:
+    """Создание типа тренировки и двух упражнений."""
+    response = await ac.post(
+        "/api/v1/workout-types/", json={"name": "Strength"}, headers=auth_headers
+    )
+    workout_type_id = response.json()["id"]
+    exercise_ids = []
+    for name in ("Squat", "Bench"):
+        response = await ac.post(
+            "/api/v1/exercises/", json={"name": name, "muscle_groups": []}, headers=auth_headers
+        )
+        exercise_ids.append(response.json()["id"])
+    return workout_type_id, exercise_ids[0], exercise_ids[1]
+
+async def create_workout(ac: AsyncClient, auth_headers: dict, name: str, workout_type_id: int, exercises: list) -> dict:
+    """Создание тренировки; exercises - список (exercise_id, [(weight, reps), ...])."""
+    response = await ac.post(
+        "/api/v1/workouts/",
+        json={
+            "name": name,
+            "workout_type_id": workout_type_id,
+            "exercises": [
+                {
+                    "exercise_id": exercise_id,
+                    "sets": [
+                        {"set_number": i + 1, "weight": weight, "reps": reps}
+                        for i, (weight, reps) in enumerate(sets)
+                    ],
+                }
+                for exercise_id, sets in exercises
+            ],
+        },
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    return response.json()
+
+async def snapshot(session_factory) -> tuple[list, list]:
+    """Содержимое таблиц рекордов без времени изменения."""
+    async with session_factory() as session:
+        records = await session.execute(
+            select(
+                PersonalRecord.user_id, PersonalRecord.exercise_id, PersonalRecord.max_weight,
+                PersonalRecord.best_e1rm, PersonalRecord.best_volume,
+            ).order_by(PersonalRecord.user_id, PersonalRecord.exercise_id)
+        )
+        reps = await session.execute(
+            select(RepRecord.user_id, RepRecord.exercise_id, RepRecord.weight, RepRecord.reps)
+            .order_by(RepRecord.user_id, RepRecord.exercise_id, RepRecord.weight)
+        )
+        return records.all(), reps.all()
+
+async def test_records_on_create(ac: AsyncClient, auth_headers: dict):
+    """Тест рекордов после создания тренировок."""
+    workout_type_id, squat_id, bench_id = await create_catalog(ac, auth_headers)
+    await create_workout(ac, auth_headers, "Day 1", workout_type_id, [
+        (squat_id, [(100, 5), (110, 3)]),
+        (bench_id, [(60, 8)]),
+        (squat_id, [(100, 6)]),
+    ])
+    await create_workout(ac, auth_headers, "Day 2", workout_type_id, [
+        (squat_id, [(90, 10), (120, 0)]),
+    ])
+
+    response = await ac.get(f"/api/v1/records/{squat_id}", headers=auth_headers)
+    assert response.status_code == 200
+    record = response.json()
+    # Подход без повторений не считается рекордом
+    assert record["max_weight"] == 110
+    assert record["best_e1rm"] == max(estimate_1rm(110, 3), estimate_1rm(100, 6), estimate_1rm(90, 10))
+    # Объем тренировки складывается из обоих вхождений упражнения: 500 + 330 + 600
+    assert record["best_volume"] == 1430
+    assert record["rep_records"] == [
+        {"weight": 90, "reps": 10}, {"weight": 100, "reps": 6}, {"weight": 110, "reps": 3}
+    ]
+
+    response = await ac.get("/api/v1/records/", headers=auth_headers)
+    assert [r["exercise_id"] for r in response.json()] == sorted([squat_id, bench_id])
+
+async def test_records_follow_updates_and_deletes(ac: AsyncClient, auth_headers: dict, session_factory):
+    """Тест пересчета рекордов при изменении и удалении подходов."""
+    workout_type_id, squat_id, bench_id = await create_catalog(ac, auth_headers)
+    first = await create_workout(ac, auth_headers, "Day 1", workout_type_id, [(squat_id, [(100, 5)])])
+    second = await create_workout(ac, auth_headers, "Day 2", workout_type_id, [(squat_id, [(140, 1)])])
+
+    # Снижение веса рекордного подхода уменьшает рекорд
+    workout_exercise = second["exercises"][0]
+    response = await ac.put(
+        f"/api/v1/workouts/{second['id']}/exercises/{workout_exercise['id']}",
+        json={"sets": [{"id": workout_exercise["sets"][0]["id"], "weight": 95}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    response = await ac.get(f"/api/v1/records/{squat_id}", headers=auth_headers)
+    assert response.json()["max_weight"] == 100
+
+    # Перенос подходов на другое упражнение переносит и рекорды
+    response = await ac.patch(
+        f"/api/v1/workouts/{second['id']}",
+        json={"exercises": [{"id": workout_exercise["id"], "exercise_id": bench_id}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    response = await ac.get(f"/api/v1/records/{bench_id}", headers=auth_headers)
+    assert response.json()["max_weight"] == 95
+
+    # Добавление упражнения в существующую тренировку
+    response = await ac.post(
+        f"/api/v1/workouts/{first['id']}/exercises",
+        json={"exercise_id": squat_id, "sets": [{"set_number": 1, "weight": 50, "reps": 10}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    response = await ac.get(f"/api/v1/records/{squat_id}", headers=auth_headers)
+    assert response.json()["best_volume"] == 1000
+
+    # Инкрементальные значения совпадают с полным пересчетом
+    before = await snapshot(session_factory)
+    async with session_factory() as session:
+        await recompute_records(session)
+        await session.commit()
+    assert await snapshot(session_factory) == before
+
+    response = await ac.delete(f"/api/v1/workouts/{second['id']}", headers=auth_headers)
+    assert response.status_code == 200
+    response = await ac.get(f"/api/v1/records/{bench_id}", headers=auth_headers)
+    assert response.status_code == 404
+
+    response = await ac.delete(
+        f"/api/v1/workouts/{first['id']}/exercises/{first['exercises'][0]['id']}",
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    response = await ac.get(f"/api/v1/records/{squat_id}", headers=auth_headers)
+    assert response.json()["rep_records"] == [{"weight": 50, "reps": 10}]
+
+async def test_records_after_import(ac: AsyncClient, auth_headers: dict, session_factory):
+    """Тест рекордов после импорта совпадают с полным пересчетом."""
+    rows = [
+        f"Day {day},Strength,2024-02-{day + 1:02d}T08:00:00,Squat,,{set_number},{80 + day * 5 + set_number},{6 - set_number}\n"
+        for day in range(10)
+        for set_number in (1, 2, 3)
+    ]
+    response = await ac.post(
+        "/api/v1/import/workouts",
+        files={"file": (
+            "history.csv",
+            "workout_name,workout_type,created_at,exercise_name,notes,set_number,weight,reps\n" + "".join(rows),
+            "text/csv",
+        )},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+
+    imported = await snapshot(session_factory)
+    assert imported[0][0].max_weight == 80 + 45 + 3
+    async with session_factory() as session:
+        await recompute_records(session)
+        await session.commit()
+    assert await snapshot(session_factory) == imported
@@ -0,0 +1,154 @@
+from typing import Any, Optional
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.core.response_cache import ResponseCache, get_response_cache, response_cache
+from app.main import app
+from app.routers import workout
+
+pytestmark = pytest.mark.asyncio
+
+class RemoteBackendStandIn:
+    """Замена внешнего хранилища: общие байты для нескольких экземпляров кэша."""
+
+    def __init__(self, storage: dict[str, bytes], fail: bool = False) -> None:
+        self.storage = storage
+        self.fail = fail
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if self.fail:
+            raise ConnectionError("backend is down")
+        return self.storage.get(key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        if self.fail:
+            raise ConnectionError("backend is down")
+        self.storage[key] = bytes(value)
+
+    async def clear(self) -> None:
+        self.storage.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {"size": len(self.storage)}
+
+@pytest.fixture
+def use_cache():
+    """Подмена кэша ответов на время теста."""
+    def _use(cache: Optional[ResponseCache]) -> None:
+        app.dependency_overrides[get_response_cache] = lambda: cache
+    yield _use
+    app.dependency_overrides.pop(get_response_cache, None)
+
+async def create_workout_type(ac: AsyncClient, auth_headers: dict, name: str) -> int:
+    response = await ac.post("/api/v1/workout-types/", json={"name": name}, headers=auth_headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+async def test_response_cache_invalidation(ac: AsyncClient, auth_headers: dict, count_queries):
+    """Тест попадания в кэш и точной инвалидации после записи."""
+    workout_type_id = await create_workout_type(ac, auth_headers, "Legs")
+    for i in range(3):
+        await ac.post(
+            "/api/v1/workouts/",
+            json={"name": f"Workout {i}", "workout_type_id": workout_type_id},
+            headers=auth_headers
+        )
+
+    first = await ac.get("/api/v1/workouts/?limit=2", headers=auth_headers)
+    hits = response_cache.hits
+    with count_queries() as statements:
+        second = await ac.get("/api/v1/workouts/?limit=2", headers=auth_headers)
+    # Из БД читается только версия данных
+    assert len(statements) == 1
+    assert response_cache.hits == hits + 1
+    assert second.json() == first.json()
+    assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    # Любая запись меняет ключ: новый ответ без устаревших данных
+    response = await ac.patch(
+        f"/api/v1/workout-types/{workout_type_id}", json={"name": "Legs 2"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    response = await ac.get("/api/v1/workouts/?limit=2", headers=auth_headers)
+    assert response.json()[0]["workout_type"]["name"] == "Legs 2"
+
+    response = await ac.get("/api/v1/workout-types/", headers=auth_headers)
+    assert [t["name"] for t in response.json()] == ["Legs 2"]
+    await create_workout_type(ac, auth_headers, "Arms")
+    response = await ac.get("/api/v1/workout-types/", headers=auth_headers)
+    assert [t["name"] for t in response.json()] == ["Legs 2", "Arms"]
+
+    stats = response_cache.stats()
+    assert stats["backend"] == "MemoryBackend"
+    assert stats["hits"] >= 1 and stats["misses"] >= 1
+
+async def test_response_cache_is_per_user(ac: AsyncClient, auth_headers: dict):
+    """Тест изоляции ответов разных пользователей."""
+    workout_type_id = await create_workout_type(ac, auth_headers, "Legs")
+    response = await ac.post(
+        "/api/v1/workouts/",
+        json={"name": "Private", "workout_type_id": workout_type_id},
+        headers=auth_headers
+    )
+    workout_id = response.json()["id"]
+    assert (await ac.get(f"/api/v1/workouts/{workout_id}", headers=auth_headers)).status_code == 200
+
+    await ac.post(
+        "/api/v1/auth/register",
+        json={"email": "other@example.com", "username": "other", "password": "otherpass123"}
+    )
+    response = await ac.post(
+        "/api/v1/auth/login", data={"username": "other@example.com", "password": "otherpass123"}
+    )
+    other_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    assert (await ac.get(f"/api/v1/workouts/{workout_id}", headers=other_headers)).status_code == 404
+    assert (await ac.get("/api/v1/workouts/", headers=other_headers)).json() == []
+
+async def test_response_cache_keeps_serializer(ac: AsyncClient, auth_headers: dict, monkeypatch):
+    """Тест: промах кэша сериализует ответ так же, как маршрут без кэша."""
+    calls = []
+
+    def tracking_fast_json_response(*args, **kwargs):
+        calls.append(args[0])
+        return fast_json_response(*args, **kwargs)
+
+    fast_json_response = workout.fast_json_response
+    monkeypatch.setattr(workout, "fast_json_response", tracking_fast_json_response)
+    workout_type_id = await create_workout_type(ac, auth_headers, "Legs")
+    await ac.post(
+        "/api/v1/workouts/", json={"name": "Day 1", "workout_type_id": workout_type_id}, headers=auth_headers
+    )
+
+    response = await ac.get("/api/v1/workouts/", headers=auth_headers)
+    assert response.json()[0]["name"] == "Day 1"
+    assert calls == []
+
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    await response_cache.clear()
+    fast = await ac.get("/api/v1/workouts/", headers=auth_headers)
+    assert len(calls) == 1
+    assert fast.json() == response.json()
+
+async def test_remote_backend_stand_in(ac: AsyncClient, auth_headers: dict, use_cache):
+    """Тест общего хранилища: ответ, сохраненный одним процессом, читает другой."""
+    storage: dict[str, bytes] = {}
+    use_cache(ResponseCache(RemoteBackendStandIn(storage)))
+    await create_workout_type(ac, auth_headers, "Legs")
+    response = await ac.get("/api/v1/workout-types/", headers=auth_headers)
+    assert response.status_code == 200
+    assert len(storage) == 1
+
+    other_process = ResponseCache(RemoteBackendStandIn(storage))
+    use_cache(other_process)
+    cached = await ac.get("/api/v1/workout-types/", headers=auth_headers)
+    assert cached.json() == response.json()
+    assert other_process.hits == 1
+
+    # Недоступное хранилище не ломает чтение
+    broken = ResponseCache(RemoteBackendStandIn(storage, fail=True))
+    use_cache(broken)
+    response = await ac.get("/api/v1/workout-types/", headers=auth_headers)
+    assert response.status_code == 200
+    assert broken.errors == 2
@@ -0,0 +1,137 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.models.training_summary import TrainingSummary
+from app.services.summaries import period_start, refresh_summaries, shift_period
+
+pytestmark = pytest.mark.asyncio
+
+CSV_HEADER = "workout_name,workout_type,created_at,exercise_name,notes,set_number,weight,reps\n"
+
+def test_period_bounds():
+    """Тест начала периода и сдвига на несколько периодов."""
+    assert period_start("week", date(2024, 3, 7)) == date(2024, 3, 4)
+    assert period_start("month", date(2024, 3, 7)) == date(2024, 3, 1)
+    assert shift_period("week", date(2024, 3, 4), -1) == date(2024, 2, 26)
+    assert shift_period("month", date(2024, 1, 1), -1) == date(2023, 12, 1)
+    assert shift_period("month", date(2024, 11, 1), 3) == date(2025, 2, 1)
+
+async def snapshot(session_factory) -> list:
+    """Содержимое training_summaries."""
+    async with session_factory() as session:
+        result = await session.execute(
+            select(
+                TrainingSummary.user_id, TrainingSummary.period, TrainingSummary.period_start,
+                TrainingSummary.muscle_group, TrainingSummary.volume, TrainingSummary.sets,
+                TrainingSummary.reps, TrainingSummary.workouts,
+            ).order_by(
+                TrainingSummary.period, TrainingSummary.period_start, TrainingSummary.muscle_group
+            )
+        )
+        return result.all()
+
+async def test_training_summary(ac: AsyncClient, auth_headers: dict, session_factory):
+    """Тест сводок после импорта, изменения и удаления тренировок."""
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs", "glutes"]},
+        headers=auth_headers
+    )
+    squat_id = response.json()["id"]
+
+    # Две тренировки на неделе 4 марта 2024, одна на следующей, одна в апреле;
+    # Plank без групп мышц попадает в группу other
+    rows = [
+        "Mon,Strength,2024-03-04T08:00:00,Squat,,1,100,5\n",
+        "Mon,Strength,2024-03-04T08:00:00,Squat,,2,100,5\n",
+        "Thu,Strength,2024-03-07T08:00:00,Squat,,1,80,10\n",
+        "Thu,Strength,2024-03-07T08:00:00,Plank,,1,0,1\n",
+        "Next,Strength,2024-03-11T08:00:00,Squat,,1,120,2\n",
+        "April,Strength,2024-04-02T08:00:00,Squat,,1,50,10\n",
+    ]
+    response = await ac.post(
+        "/api/v1/import/workouts",
+        files={"file": ("history.csv", CSV_HEADER + "".join(rows), "text/csv")},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+
+    response = await ac.get(
+        "/api/v1/stats/summary",
+        params={"period": "week", "start": "2024-03-01", "end": "2024-03-12"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    summary = [(r["period_start"], r["muscle_group"], r["volume"], r["sets"], r["workouts"]) for r in response.json()]
+    assert summary == [
+        ("2024-03-04", "glutes", 1800, 3, 2),
+        ("2024-03-04", "legs", 1800, 3, 2),
+        ("2024-03-04", "other", 0, 1, 1),
+        ("2024-03-11", "glutes", 240, 1, 1),
+        ("2024-03-11", "legs", 240, 1, 1),
+    ]
+
+    response = await ac.get(
+        "/api/v1/stats/summary",
+        params={"period": "month", "start": "2024-03-01", "end": "2024-04-30"},
+        headers=auth_headers
+    )
+    legs = [(r["period_start"], r["volume"]) for r in response.json() if r["muscle_group"] == "legs"]
+    assert legs == [("2024-03-01", 2040), ("2024-04-01", 500)]
+
+    # Изменение подхода пересчитывает только период тренировки
+    response = await ac.get("/api/v1/workouts/?limit=10", headers=auth_headers)
+    workouts = {w["name"]: w for w in response.json()}
+    workout_exercise = workouts["Next"]["exercises"][0]
+    response = await ac.put(
+        f"/api/v1/workouts/{workouts['Next']['id']}/exercises/{workout_exercise['id']}",
+        json={"sets": [{"id": workout_exercise["sets"][0]["id"], "reps": 3}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    response = await ac.delete(f"/api/v1/workouts/{workouts['Mon']['id']}", headers=auth_headers)
+    assert response.status_code == 200
+
+    # Смена групп мышц упражнения переносит объем в новые группы
+    response = await ac.put(
+        f"/api/v1/exercises/{squat_id}", json={"muscle_groups": ["legs"]}, headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    response = await ac.get(
+        "/api/v1/stats/summary",
+        params={"period": "week", "start": "2024-03-01", "end": "2024-03-12"},
+        headers=auth_headers
+    )
+    summary = [(r["period_start"], r["muscle_group"], r["volume"], r["workouts"]) for r in response.json()]
+    assert summary == [
+        ("2024-03-04", "legs", 800, 1),
+        ("2024-03-04", "other", 0, 1),
+        ("2024-03-11", "legs", 360, 1),
+    ]
+
+    # Пересчитанные по частям сводки совпадают с полным пересчетом
+    before = await snapshot(session_factory)
+    async with session_factory() as session:
+        await refresh_summaries(session)
+        await session.commit()
+    assert await snapshot(session_factory) == before
+
+async def test_training_summary_range(ac: AsyncClient, auth_headers: dict):
+    """Тест диапазона сводок."""
+    response = await ac.get("/api/v1/stats/summary", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == []
+
+    response = await ac.get(
+        "/api/v1/stats/summary",
+        params={"start": "2024-03-12", "end": "2024-03-01"},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+
+    response = await ac.get("/api/v1/stats/summary", params={"period": "day"}, headers=auth_headers)
+    assert response.status_code == 422
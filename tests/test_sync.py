@@ -0,0 +1,157 @@
+import pytest
+from httpx import AsyncClient
+
+pytestmark = pytest.mark.asyncio
+
+ENTITIES = ("workout_types", "exercises", "workouts", "workout_exercises", "workout_sets")
+
+async def create_catalog(ac: AsyncClient, auth_headers: dict) -> tuple[int, int, int]:
+    """Создание типа тренировки и двух упражнений."""
+    response = await ac.post(
+        "/api/v1/workout-types/", json={"name": "Strength"}, headers=auth_headers
+    )
+    workout_type_id = response.json()["id"]
+    exercise_ids = []
+    for name in ("Squat", "Bench"):
+        response = await ac.post("/api/v1/exercises/", json={"name": name}, headers=auth_headers)
+        exercise_ids.append(response.json()["id"])
+    return workout_type_id, exercise_ids[0], exercise_ids[1]
+
+async def create_workout(ac: AsyncClient, auth_headers: dict, name: str, workout_type_id: int, exercises: list) -> dict:
+    """Создание тренировки; exercises - список (exercise_id, [(weight, reps), ...])."""
+    response = await ac.post(
+        "/api/v1/workouts/",
+        json={
+            "name": name,
+            "workout_type_id": workout_type_id,
+            "exercises": [
+                {
+                    "exercise_id": exercise_id,
+                    "sets": [
+                        {"set_number": i + 1, "weight": weight, "reps": reps}
+                        for i, (weight, reps) in enumerate(sets)
+                    ],
+                }
+                for exercise_id, sets in exercises
+            ],
+        },
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    return response.json()
+
+async def sync(ac: AsyncClient, auth_headers: dict, since: str = None, limit: int = None) -> dict:
+    params = {}
+    if since is not None:
+        params["since"] = since
+    if limit is not None:
+        params["limit"] = limit
+    response = await ac.get("/api/v1/sync/", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+def ids(page: dict, entity: str) -> list[int]:
+    return [row["id"] for row in page[entity]]
+
+async def test_sync_delta(ac: AsyncClient, auth_headers: dict):
+    """Тест полной синхронизации, затем только изменений и удалений."""
+    workout_type_id, squat_id, bench_id = await create_catalog(ac, auth_headers)
+    workout = await create_workout(ac, auth_headers, "Day 1", workout_type_id, [
+        (squat_id, [(100, 5), (110, 3)]),
+        (bench_id, [(60, 8)]),
+    ])
+
+    full = await sync(ac, auth_headers)
+    assert not full["has_more"]
+    assert ids(full, "workout_types") == [workout_type_id]
+    assert sorted(ids(full, "exercises")) == sorted([squat_id, bench_id])
+    assert ids(full, "workouts") == [workout["id"]]
+    assert len(full["workout_exercises"]) == 2
+    assert len(full["workout_sets"]) == 3
+    assert full["deleted"] == []
+
+    empty = await sync(ac, auth_headers, full["next_token"])
+    assert all(empty[entity] == [] for entity in ENTITIES)
+    assert empty["next_token"] == full["next_token"]
+
+    squat, bench = workout["exercises"]
+    squat_sets = squat["sets"]
+    response = await ac.put(
+        f"/api/v1/workouts/{workout['id']}/exercises/{squat['id']}",
+        json={"sets": [
+            {"id": squat_sets[0]["id"], "weight": 105},
+            {"id": squat_sets[1]["id"]},
+        ]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    response = await ac.delete(
+        f"/api/v1/workouts/{workout['id']}/exercises/{bench['id']}", headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    delta = await sync(ac, auth_headers, full["next_token"])
+    assert ids(delta, "workout_sets") == [squat_sets[0]["id"]]
+    assert delta["workout_sets"][0]["weight"] == 105
+    assert delta["workouts"] == [] and delta["workout_exercises"] == []
+    assert [(row["entity"], row["entity_id"]) for row in delta["deleted"]] == [
+        ("workout_exercises", bench["id"])
+    ]
+
+async def test_sync_pages(ac: AsyncClient, auth_headers: dict):
+    """Тест постраничной ленты: страницы без пропусков и повторов."""
+    workout_type_id, squat_id, _ = await create_catalog(ac, auth_headers)
+    for day in range(3):
+        await create_workout(ac, auth_headers, f"Day {day}", workout_type_id, [
+            (squat_id, [(100, 5), (100, 5)]),
+        ])
+    full = await sync(ac, auth_headers)
+
+    token, pages, versions = None, 0, []
+    while True:
+        page = await sync(ac, auth_headers, token, limit=4)
+        pages += 1
+        for entity in ENTITIES:
+            versions.extend(row["sync_version"] for row in page[entity])
+            assert len(page[entity]) <= 4
+        token = page["next_token"]
+        if not page["has_more"]:
+            break
+    total = sum(len(full[entity]) for entity in ENTITIES)
+    assert len(versions) == len(set(versions)) == total
+    assert pages == -(-total // 4)
+    assert token == full["next_token"]
+
+async def test_sync_isolation_and_bad_token(ac: AsyncClient, auth_headers: dict):
+    """Тест: чужие изменения не попадают в ленту, поврежденный токен - 400."""
+    await create_catalog(ac, auth_headers)
+    await ac.post(
+        "/api/v1/auth/register",
+        json={"username": "other", "email": "other@example.com", "password": "password123"},
+    )
+    response = await ac.post(
+        "/api/v1/auth/login", data={"username": "other@example.com", "password": "password123"}
+    )
+    other_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    page = await sync(ac, other_headers)
+    assert all(page[entity] == [] for entity in ENTITIES)
+
+    response = await ac.get("/api/v1/sync/?since=not-a-token", headers=auth_headers)
+    assert response.status_code == 400
+
+async def test_sync_child_feeds_by_user(
+    ac: AsyncClient, auth_headers: dict, other_headers: dict, count_queries
+):
+    """Тест: ленты подходов и упражнений тренировки выбираются по user_id без JOIN."""
+    workout_type_id, squat_id, _ = await create_catalog(ac, auth_headers)
+    await create_workout(ac, auth_headers, "Day 1", workout_type_id, [(squat_id, [(100, 5)])])
+    other_type_id, other_squat_id, _ = await create_catalog(ac, other_headers)
+    await create_workout(ac, other_headers, "Day 1", other_type_id, [(other_squat_id, [(50, 5)])])
+
+    with count_queries() as statements:
+        page = await sync(ac, auth_headers)
+    assert len(page["workout_exercises"]) == 1 and len(page["workout_sets"]) == 1
+    assert page["workout_sets"][0]["weight"] == 100
+    feeds = [s for s in statements if "FROM workout_exercises" in s or "FROM workout_sets" in s]
+    assert len(feeds) == 2
+    assert all("JOIN" not in s and "user_id" in s for s in feeds)
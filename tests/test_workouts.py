@@ -0,0 +1,446 @@
+import pytest
+from httpx import AsyncClient
+from typing import Optional
+
+pytestmark = pytest.mark.asyncio
+
+async def create_workout_type(ac: AsyncClient, auth_headers: dict) -> int:
+    """Создание типа тренировки для тестов."""
+    response = await ac.post(
+        "/api/v1/workout-types/",
+        json={"name": "Legs", "description": "Leg day"},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    return response.json()["id"]
+
+async def create_workouts(
+    ac: AsyncClient,
+    auth_headers: dict,
+    count: int,
+    prefix: str = "Workout",
+    workout_type_id: Optional[int] = None,
+) -> list[int]:
+    """Создание нескольких тренировок для тестов."""
+    if workout_type_id is None:
+        workout_type_id = await create_workout_type(ac, auth_headers)
+    ids = []
+    for i in range(count):
+        response = await ac.post(
+            "/api/v1/workouts/",
+            json={"name": f"{prefix} {i}", "workout_type_id": workout_type_id},
+            headers=auth_headers
+        )
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+async def test_get_workouts_cursor_pagination(ac: AsyncClient, auth_headers: dict):
+    """Тест курсорной пагинации списка тренировок."""
+    ids = await create_workouts(ac, auth_headers, 5)
+
+    response = await ac.get("/api/v1/workouts/?limit=2", headers=auth_headers)
+    assert response.status_code == 200
+    first_page = [w["id"] for w in response.json()]
+    cursor = response.headers["X-Next-Cursor"]
+
+    seen = list(first_page)
+    while cursor:
+        response = await ac.get(
+            "/api/v1/workouts/", params={"limit": 2, "cursor": cursor}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        seen.extend(w["id"] for w in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+
+    # Тренировки возвращаются от новых к старым без повторов и пропусков
+    assert seen == list(reversed(ids))
+
+async def test_get_workouts_page_size_limit(ac: AsyncClient, auth_headers: dict):
+    """Тест ограничения размера страницы."""
+    response = await ac.get("/api/v1/workouts/?limit=100000", headers=auth_headers)
+    assert response.status_code == 422
+
+async def test_get_workouts_invalid_cursor(ac: AsyncClient, auth_headers: dict):
+    """Тест некорректного курсора."""
+    response = await ac.get("/api/v1/workouts/?cursor=broken", headers=auth_headers)
+    assert response.status_code == 400
+
+async def add_exercise_with_sets(ac: AsyncClient, auth_headers: dict, workout_id: int, exercise_id: int):
+    """Добавление упражнения с подходами в тренировку."""
+    response = await ac.post(
+        f"/api/v1/workouts/{workout_id}/exercises",
+        json={"exercise_id": exercise_id},
+        headers=auth_headers
+    )
+    workout_exercise_id = response.json()["id"]
+    response = await ac.put(
+        f"/api/v1/workouts/{workout_id}/exercises/{workout_exercise_id}",
+        json={"sets": [
+            {"set_number": 1, "weight": 100, "reps": 5},
+            {"set_number": 2, "weight": 105, "reps": 3},
+        ]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+
+async def test_get_workouts_statement_count(ac: AsyncClient, auth_headers: dict, count_queries):
+    """Тест постоянного числа SQL-запросов при получении списка тренировок."""
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs"]},
+        headers=auth_headers
+    )
+    exercise_id = response.json()["id"]
+
+    workout_type_id = await create_workout_type(ac, auth_headers)
+
+    counts = []
+    for workouts_count in (1, 4):
+        workout_ids = await create_workouts(
+            ac, auth_headers, workouts_count, f"Batch {workouts_count}", workout_type_id
+        )
+        for workout_id in workout_ids:
+            await add_exercise_with_sets(ac, auth_headers, workout_id, exercise_id)
+
+        with count_queries() as statements:
+            response = await ac.get("/api/v1/workouts/", headers=auth_headers)
+        assert response.status_code == 200
+        counts.append(len(statements))
+
+    # Версия данных, тренировки с типами, упражнения, подходы;
+    # пользователь берется из кэша
+    assert counts == [4, 4]
+    workout = response.json()[0]
+    assert workout["workout_type"]["name"] == "Legs"
+    assert sorted(s["set_number"] for s in workout["exercises"][0]["sets"]) == [1, 2]
+
+async def test_create_workout_nested(ac: AsyncClient, auth_headers: dict, count_queries):
+    """Тест создания тренировки с упражнениями и подходами одним запросом."""
+    exercise_ids = []
+    for name in ("Squat", "Lunge"):
+        response = await ac.post(
+            "/api/v1/exercises/",
+            json={"name": name, "muscle_groups": ["legs"]},
+            headers=auth_headers
+        )
+        exercise_ids.append(response.json()["id"])
+    workout_type_id = await create_workout_type(ac, auth_headers)
+
+    payload = {
+        "name": "Leg day",
+        "workout_type_id": workout_type_id,
+        "exercises": [
+            {
+                "exercise_id": exercise_ids[0],
+                "notes": "heavy",
+                "sets": [
+                    {"set_number": 2, "weight": 105, "reps": 3},
+                    {"set_number": 1, "weight": 100, "reps": 5},
+                ],
+            },
+            {"exercise_id": exercise_ids[1], "sets": [{"set_number": 1, "weight": 40, "reps": 10}]},
+            {"exercise_id": exercise_ids[0]},
+        ],
+    }
+    with count_queries() as statements:
+        response = await ac.post("/api/v1/workouts/", json=payload, headers=auth_headers)
+    assert response.status_code == 201
+    created = response.json()
+
+    # Проверка имени, тип, упражнения, по одному INSERT на таблицу
+    # (PostgreSQL вставляет пакет с RETURNING одним выражением)
+    # по одному upsert личных рекордов и рекордов повторений
+    # пересчет недельной и месячной сводки (DELETE и INSERT ... SELECT)
+    # и новая версия данных пользователя
+    assert len(statements) == 13
+    assert created["workout_type"]["id"] == workout_type_id
+    assert [e["exercise_id"] for e in created["exercises"]] == [
+        exercise_ids[0], exercise_ids[1], exercise_ids[0]
+    ]
+    assert created["exercises"][0]["notes"] == "heavy"
+    assert [s["set_number"] for s in created["exercises"][0]["sets"]] == [1, 2]
+    assert created["exercises"][1]["exercise"]["name"] == "Lunge"
+    assert created["exercises"][2]["sets"] == []
+
+    response = await ac.get(f"/api/v1/workouts/{created['id']}", headers=auth_headers)
+    assert response.json()["exercises"] == created["exercises"]
+
+async def test_create_workout_unknown_exercise(ac: AsyncClient, auth_headers: dict):
+    """Тест отката создания тренировки с несуществующим упражнением."""
+    workout_type_id = await create_workout_type(ac, auth_headers)
+    payload = {
+        "name": "Broken",
+        "workout_type_id": workout_type_id,
+        "exercises": [{"exercise_id": 999999}],
+    }
+    response = await ac.post("/api/v1/workouts/", json=payload, headers=auth_headers)
+    assert response.status_code == 404
+
+    response = await ac.get("/api/v1/workouts/", headers=auth_headers)
+    assert response.json() == []
+
+async def test_create_workout_set_out_of_range(ac: AsyncClient, auth_headers: dict):
+    """Тест: значения подхода вне диапазона колонки INTEGER отклоняются до записи."""
+    workout_type_id = await create_workout_type(ac, auth_headers)
+    response = await ac.post("/api/v1/exercises/", json={"name": "Squat"}, headers=auth_headers)
+    exercise_id = response.json()["id"]
+    for values in ({"weight": 3_000_000_000}, {"reps": -1}):
+        payload = {
+            "name": "Broken",
+            "workout_type_id": workout_type_id,
+            "exercises": [{
+                "exercise_id": exercise_id,
+                "sets": [{"set_number": 1, "weight": 100, "reps": 5, **values}],
+            }],
+        }
+        response = await ac.post("/api/v1/workouts/", json=payload, headers=auth_headers)
+        assert response.status_code == 422
+
+async def test_create_workout_exercise_with_sets(ac: AsyncClient, auth_headers: dict):
+    """Тест добавления упражнения с подходами в тренировку."""
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs"]},
+        headers=auth_headers
+    )
+    exercise_id = response.json()["id"]
+    [workout_id] = await create_workouts(ac, auth_headers, 1)
+
+    response = await ac.post(
+        f"/api/v1/workouts/{workout_id}/exercises",
+        json={"exercise_id": exercise_id, "sets": [{"set_number": 1, "weight": 100, "reps": 5}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["workout_id"] == workout_id
+    assert data["exercise"]["name"] == "Squat"
+    assert [(s["weight"], s["reps"]) for s in data["sets"]] == [(100, 5)]
+
+    response = await ac.post(
+        "/api/v1/workouts/999999/exercises",
+        json={"exercise_id": exercise_id},
+        headers=auth_headers
+    )
+    assert response.status_code == 404
+
+async def create_nested_workout(
+    ac: AsyncClient, auth_headers: dict, name: str, workout_type_id: int, exercise_id: int, count: int
+) -> dict:
+    """Создание тренировки с несколькими упражнениями по два подхода."""
+    response = await ac.post(
+        "/api/v1/workouts/",
+        json={
+            "name": name,
+            "workout_type_id": workout_type_id,
+            "exercises": [
+                {
+                    "exercise_id": exercise_id,
+                    "sets": [
+                        {"set_number": 1, "weight": 100, "reps": 5},
+                        {"set_number": 2, "weight": 105, "reps": 3},
+                    ],
+                }
+                for _ in range(count)
+            ],
+        },
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    return response.json()
+
+async def test_update_workout_diff(ac: AsyncClient, auth_headers: dict):
+    """Тест применения изменений упражнений и подходов при обновлении тренировки."""
+    exercise_ids = []
+    for name in ("Squat", "Lunge"):
+        response = await ac.post(
+            "/api/v1/exercises/",
+            json={"name": name, "muscle_groups": ["legs"]},
+            headers=auth_headers
+        )
+        exercise_ids.append(response.json()["id"])
+    workout_type_id = await create_workout_type(ac, auth_headers)
+    workout = await create_nested_workout(
+        ac, auth_headers, "Leg day", workout_type_id, exercise_ids[0], 2
+    )
+    kept = workout["exercises"][0]
+    first_set = kept["sets"][0]
+
+    response = await ac.patch(
+        f"/api/v1/workouts/{workout['id']}",
+        json={
+            "description": "updated",
+            "exercises": [
+                {
+                    "id": kept["id"],
+                    "notes": "easy",
+                    "sets": [
+                        {"id": first_set["id"], "weight": 110},
+                        {"set_number": 3, "weight": 90, "reps": 8},
+                    ],
+                },
+                {"exercise_id": exercise_ids[1], "sets": [{"set_number": 1, "weight": 40, "reps": 10}]},
+            ],
+        },
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Leg day"
+    assert data["description"] == "updated"
+    assert len(data["exercises"]) == 2
+
+    updated, added = data["exercises"]
+    assert updated["id"] == kept["id"]
+    assert updated["notes"] == "easy"
+    assert [(s["set_number"], s["weight"], s["reps"]) for s in updated["sets"]] == [
+        (1, 110, 5), (3, 90, 8)
+    ]
+    assert added["exercise"]["name"] == "Lunge"
+    assert [(s["weight"], s["reps"]) for s in added["sets"]] == [(40, 10)]
+
+    # Без списка exercises упражнения не меняются
+    response = await ac.patch(
+        f"/api/v1/workouts/{workout['id']}", json={"name": "Renamed"}, headers=auth_headers
+    )
+    assert response.json()["exercises"] == data["exercises"]
+
+async def test_update_workout_unknown_exercise(ac: AsyncClient, auth_headers: dict):
+    """Тест отказа обновления с чужим упражнением в тренировке."""
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs"]},
+        headers=auth_headers
+    )
+    exercise_id = response.json()["id"]
+    workout_type_id = await create_workout_type(ac, auth_headers)
+    workout = await create_nested_workout(ac, auth_headers, "Leg day", workout_type_id, exercise_id, 1)
+
+    response = await ac.patch(
+        f"/api/v1/workouts/{workout['id']}",
+        json={"exercises": [{"id": 999999, "notes": "missing"}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 404
+
+    response = await ac.patch(
+        f"/api/v1/workouts/{workout['id']}",
+        json={"exercises": [{"exercise_id": 999999}]},
+        headers=auth_headers
+    )
+    assert response.status_code == 404
+
+    response = await ac.get(f"/api/v1/workouts/{workout['id']}", headers=auth_headers)
+    assert response.json()["exercises"] == workout["exercises"]
+
+async def test_update_workout_foreign_workout_type(ac: AsyncClient, auth_headers: dict, other_headers: dict):
+    """Тест отказа обновления с чужим типом тренировки."""
+    [workout_id] = await create_workouts(ac, auth_headers, 1)
+    foreign_type_id = await create_workout_type(ac, other_headers)
+
+    response = await ac.patch(
+        f"/api/v1/workouts/{workout_id}",
+        json={"workout_type_id": foreign_type_id},
+        headers=auth_headers
+    )
+    assert response.status_code == 404
+
+    response = await ac.get(f"/api/v1/workouts/{workout_id}", headers=auth_headers)
+    assert response.json()["workout_type_id"] != foreign_type_id
+
+async def test_delete_foreign_workout(ac: AsyncClient, auth_headers: dict, other_headers: dict):
+    """Тест: чужую тренировку и ее упражнения удалить нельзя."""
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs"]},
+        headers=auth_headers
+    )
+    exercise_id = response.json()["id"]
+    workout_type_id = await create_workout_type(ac, auth_headers)
+    workout = await create_nested_workout(ac, auth_headers, "Leg day", workout_type_id, exercise_id, 1)
+    [other_workout_id] = await create_workouts(ac, auth_headers, 1, prefix="Other", workout_type_id=workout_type_id)
+    workout_exercise_id = workout["exercises"][0]["id"]
+
+    response = await ac.delete(
+        f"/api/v1/workouts/{workout['id']}/exercises/{workout_exercise_id}", headers=other_headers
+    )
+    assert response.status_code == 404
+    response = await ac.delete(f"/api/v1/workouts/{workout['id']}", headers=other_headers)
+    assert response.status_code == 404
+    # Упражнение другой тренировки того же пользователя
+    response = await ac.delete(
+        f"/api/v1/workouts/{other_workout_id}/exercises/{workout_exercise_id}", headers=auth_headers
+    )
+    assert response.status_code == 404
+
+    response = await ac.get(f"/api/v1/workouts/{workout['id']}", headers=auth_headers)
+    assert response.json()["exercises"] == workout["exercises"]
+
+async def test_update_workout_statement_count(ac: AsyncClient, auth_headers: dict, count_queries):
+    """Тест постоянного числа SQL-запросов при обновлении тренировки."""
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs"]},
+        headers=auth_headers
+    )
+    exercise_id = response.json()["id"]
+    workout_type_id = await create_workout_type(ac, auth_headers)
+
+    counts = []
+    for exercises_count in (2, 6):
+        workout = await create_nested_workout(
+            ac, auth_headers, f"Batch {exercises_count}", workout_type_id, exercise_id, exercises_count
+        )
+        exercises = [
+            {
+                "id": e["id"],
+                "notes": "updated",
+                "sets": [{"id": e["sets"][0]["id"], "reps": 6}],
+            }
+            for e in workout["exercises"][1:]
+        ]
+        exercises.append({"exercise_id": exercise_id, "sets": [{"set_number": 1, "weight": 50, "reps": 5}]})
+
+        with count_queries() as statements:
+            response = await ac.patch(
+                f"/api/v1/workouts/{workout['id']}",
+                json={"exercises": exercises},
+                headers=auth_headers
+            )
+        assert response.status_code == 200
+        assert len(response.json()["exercises"]) == exercises_count
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+
+async def test_fast_json_responses(ac: AsyncClient, auth_headers: dict, monkeypatch):
+    """Тест совпадения быстрой сериализации с ответом по умолчанию."""
+    from app.core.config import settings
+
+    response = await ac.post(
+        "/api/v1/exercises/",
+        json={"name": "Squat", "muscle_groups": ["legs"]},
+        headers=auth_headers
+    )
+    exercise_id = response.json()["id"]
+    workout_type_id = await create_workout_type(ac, auth_headers)
+    for i in range(3):
+        await create_nested_workout(ac, auth_headers, f"Workout {i}", workout_type_id, exercise_id, 2)
+
+    default = await ac.get("/api/v1/workouts/?limit=2", headers=auth_headers)
+    workout_id = default.json()[0]["id"]
+    default_detail = await ac.get(f"/api/v1/workouts/{workout_id}", headers=auth_headers)
+
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = await ac.get("/api/v1/workouts/?limit=2", headers=auth_headers)
+    assert fast.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.json() == default.json()
+    assert fast.headers["X-Next-Cursor"] == default.headers["X-Next-Cursor"]
+
+    fast_detail = await ac.get(f"/api/v1/workouts/{workout_id}", headers=auth_headers)
+    assert fast_detail.json() == default_detail.json()
+
+    created = await create_nested_workout(ac, auth_headers, "Fast", workout_type_id, exercise_id, 1)
+    assert created["exercises"][0]["exercise"]["name"] == "Squat"